@@ -0,0 +1,62 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+from src.batch_runner import decode_file
+from src.parallel_decoder import ParallelDecoder
+from src.transcriber import Transcriber
+
+
+def timed(fn, audio, repeat: int):
+    elapsed = None
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn(audio)
+        elapsed = time.perf_counter() - start
+    return elapsed, text
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Compare single-model and multi-process CPU decoding of a long file")
+    parser.add_argument("input", help="Long audio/video file to transcribe")
+    parser.add_argument("--model", default="small")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="+",
+        default=[p for p in (1, 2, 4, 8, 16) if p <= cores],
+        help="Process counts to try; each process gets cores/processes threads"
+    )
+    parser.add_argument("--repeat", type=int, default=2, help="Runs per configuration; the last is reported so model loading is excluded")
+    args = parser.parse_args()
+
+    audio = decode_file(args.input)
+    if audio is None:
+        raise SystemExit(f"Could not decode {args.input}")
+    audio_seconds = len(audio) / 16000
+    print(f"Input: {audio_seconds:.0f}s of audio, {cores} CPU cores, model '{args.model}'")
+    print(f"{'config':>22} {'wall s':>8} {'x realtime':>11} {'speedup':>8} {'chars':>7}")
+
+    transcriber = Transcriber(model_size=args.model, device="cpu", keep_model_loaded=True)
+    baseline, text = timed(transcriber.transcribe, audio, args.repeat)
+    transcriber.shutdown()
+    print(f"{'single model':>22} {baseline:>8.1f} {audio_seconds / baseline:>11.1f} {1.0:>8.2f} {len(text):>7}")
+
+    for processes in args.processes:
+        decoder = ParallelDecoder(args.model, processes=processes)
+        try:
+            elapsed, text = timed(decoder.transcribe, audio, args.repeat)
+        finally:
+            decoder.shutdown()
+        label = f"{processes} proc x {decoder.cpu_threads} thr"
+        print(f"{label:>22} {elapsed:>8.1f} {audio_seconds / elapsed:>11.1f} {baseline / elapsed:>8.2f} {len(text):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+
+BENCHMARK_DIR = Path(__file__).parent.resolve()
+STAGES = ('conversion', 'file_decode', 'transcribe')
+HIGHER_IS_BETTER = {'throughput': True, 'p50_seconds': False, 'p95_seconds': False, 'peak_rss_mb': False}
+
+
+def speech_like(seconds: float, sample_rate: int, rng: np.random.Generator, pause_ratio: float = 0.2) -> np.ndarray:
+    audio = np.zeros(int(seconds * sample_rate), dtype=np.float32)
+    position = int(0.3 * sample_rate)
+    while position < len(audio):
+        if rng.random() < pause_ratio:
+            position += int(rng.uniform(0.5, 1.5) * sample_rate)
+            continue
+
+        length = int(rng.uniform(0.15, 0.3) * sample_rate)
+        length = min(length, len(audio) - position)
+        t = np.arange(length) / sample_rate
+        f0 = rng.uniform(100, 200)
+        formants = (rng.uniform(300, 900), rng.uniform(900, 2500))
+        syllable = np.zeros(length, dtype=np.float32)
+        for harmonic in range(1, 30):
+            frequency = f0 * harmonic
+            if frequency >= sample_rate / 2:
+                break
+            gain = sum(np.exp(-((frequency - formant) / 150.0) ** 2) for formant in formants) + 0.05
+            syllable += (gain / harmonic * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+        audio[position:position + length] += syllable * np.hanning(length).astype(np.float32)
+        position += length + int(rng.uniform(0.05, 0.15) * sample_rate)
+
+    audio += rng.standard_normal(len(audio)).astype(np.float32) * 0.002
+    return (0.5 * audio / max(np.abs(audio).max(), 1e-6)).astype(np.float32)
+
+
+def write_wav(path: Path, audio: np.ndarray, sample_rate: int):
+    from scipy.io import wavfile
+
+    wavfile.write(str(path), sample_rate, (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16))
+
+
+def generate_fixtures(directory: Path, seconds: float) -> dict:
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(1234)
+    fixtures = {}
+
+    speech = directory / "speech_16k_mono.wav"
+    if not speech.exists():
+        write_wav(speech, speech_like(seconds, 16000, rng), 16000)
+    fixtures['speech_16k_mono'] = speech
+
+    silence_heavy = directory / "silence_heavy_16k_mono.wav"
+    if not silence_heavy.exists():
+        write_wav(silence_heavy, speech_like(seconds, 16000, rng, pause_ratio=0.85), 16000)
+    fixtures['silence_heavy_16k_mono'] = silence_heavy
+
+    for sample_rate in (44100, 48000):
+        stereo = directory / f"speech_{sample_rate // 1000}k_stereo.wav"
+        if not stereo.exists():
+            left = speech_like(seconds, sample_rate, rng)
+            write_wav(stereo, np.stack([left, 0.8 * left], axis=1), sample_rate)
+        fixtures[stereo.stem] = stereo
+
+    video = directory / "speech_video.mp4"
+    if not video.exists() and shutil.which("ffmpeg"):
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-f", "lavfi", "-i", f"color=c=black:s=160x120:d={seconds}",
+                "-i", str(directory / "speech_48k_stereo.wav"),
+                "-c:v", "libx264", "-c:a", "aac", "-shortest", str(video)
+            ],
+            check=True
+        )
+    if video.exists():
+        fixtures['speech_video'] = video
+    return fixtures
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def summarize(latencies, audio_seconds: float, **extra) -> dict:
+    wall_seconds = sum(latencies)
+    peak_rss = peak_rss_mb()
+    return dict(
+        runs=len(latencies),
+        audio_seconds=round(audio_seconds, 2),
+        wall_seconds=round(wall_seconds, 4),
+        throughput=round(audio_seconds / wall_seconds, 2) if wall_seconds else None,
+        p50_seconds=round(percentile(latencies, 0.5), 4),
+        p95_seconds=round(percentile(latencies, 0.95), 4),
+        max_seconds=round(max(latencies), 4),
+        peak_rss_mb=round(peak_rss, 1) if peak_rss is not None else None,
+        **extra
+    )
+
+
+def run_conversion(fixtures: dict, repeat: int) -> dict:
+    from scipy.io import wavfile
+
+    from src.audio_buffer import AudioBuffer
+    from src.resampler import resample
+
+    latencies, audio_seconds = [], 0.0
+    for path in fixtures.values():
+        if path.suffix != '.wav':
+            continue
+        sample_rate, samples = wavfile.read(str(path))
+        pcm = np.ascontiguousarray(samples if samples.ndim == 1 else samples[:, 0])
+        blocks = [pcm[start:start + 1024].tobytes() for start in range(0, len(pcm), 1024)]
+        for run in range(repeat + 1):
+            # Same path as AudioRecorder: int16 callback blocks into the buffer, then resample on stop.
+            start_time = time.perf_counter()
+            buffer = AudioBuffer(sample_rate)
+            for block in blocks:
+                buffer.write_pcm16(block)
+            audio = buffer.view()
+            if sample_rate != 16000:
+                audio = resample(audio, sample_rate, 16000)
+            if run:
+                latencies.append(time.perf_counter() - start_time)
+                audio_seconds += len(pcm) / sample_rate
+    return summarize(latencies, audio_seconds)
+
+
+def run_file_decode(fixtures: dict, repeat: int) -> dict:
+    from src.local_file_processor import LocalFileProcessor
+
+    processor = LocalFileProcessor()
+    latencies, audio_seconds = [], 0.0
+    for path in fixtures.values():
+        for run in range(repeat + 1):
+            start_time = time.perf_counter()
+            result = processor.process_file(str(path))
+            if result is None:
+                raise RuntimeError(f"Could not decode {path.name}")
+            if run:
+                latencies.append(time.perf_counter() - start_time)
+                audio_seconds += len(result[0]) / 16000
+    processor.cleanup()
+    return summarize(latencies, audio_seconds)
+
+
+def run_transcribe(fixtures: dict, repeat: int, model: str) -> dict:
+    from src.local_file_processor import LocalFileProcessor
+    from src.transcriber import Transcriber
+
+    processor = LocalFileProcessor()
+    clips = [processor.process_file(str(path))[0] for path in fixtures.values()]
+    processor.cleanup()
+
+    transcriber = Transcriber(model_size=model, device="cpu", keep_model_loaded=True)
+    start_time = time.perf_counter()
+    transcriber.load_model("cpu")
+    load_seconds = time.perf_counter() - start_time
+
+    latencies, audio_seconds = [], 0.0
+    for audio in clips:
+        for run in range(repeat + 1):
+            start_time = time.perf_counter()
+            transcriber.transcribe(audio)
+            if run:
+                latencies.append(time.perf_counter() - start_time)
+                audio_seconds += len(audio) / 16000
+    transcriber.shutdown()
+    return summarize(latencies, audio_seconds, model=model, model_load_seconds=round(load_seconds, 3))
+
+
+def run_child(args) -> dict:
+    fixtures = {path.stem: path for path in sorted(Path(args.fixtures).iterdir()) if path.suffix in ('.wav', '.mp4')}
+    if args.child == 'conversion':
+        return run_conversion(fixtures, args.repeat)
+    if args.child == 'file_decode':
+        return run_file_decode(fixtures, args.repeat)
+    return run_transcribe(fixtures, args.repeat, args.model)
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    print(f"\n{'stage':>12} {'metric':>12} {'baseline':>10} {'current':>10} {'change':>8}")
+    for stage, current in results['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous or 'error' in current or 'error' in previous:
+            continue
+        for metric, higher_is_better in HIGHER_IS_BETTER.items():
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            flag = " REGRESSION" if worse > tolerance else ""
+            print(f"{stage:>12} {metric:>12} {old:>10.3f} {new:>10.3f} {change:>+8.0%}{flag}")
+            if flag:
+                regressions.append(f"{stage}.{metric}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark: conversion, file decoding and CPU transcription")
+    parser.add_argument("--fixtures", default=str(BENCHMARK_DIR / "fixtures"), help="Directory for the generated audio fixtures")
+    parser.add_argument("--seconds", type=float, default=30.0, help="Length of each generated fixture")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per fixture and stage, after one warm-up run")
+    parser.add_argument("--model", default="tiny")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--output", default=str(BENCHMARK_DIR / "results" / "latest.json"))
+    parser.add_argument("--baseline", default=str(BENCHMARK_DIR / "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown before a metric counts as a regression")
+    parser.add_argument("--child", choices=STAGES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args)))
+        return
+
+    fixtures = generate_fixtures(Path(args.fixtures), args.seconds)
+    print(f"Fixtures: {', '.join(fixtures)} ({args.seconds:g}s each)")
+    if 'speech_video' not in fixtures:
+        print("ffmpeg not found, MP4 fixture skipped")
+
+    results = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'model': args.model,
+            'repeat': args.repeat,
+            'fixture_seconds': args.seconds
+        },
+        'stages': {}
+    }
+
+    print(f"{'stage':>12} {'x realtime':>11} {'p50 s':>8} {'p95 s':>8} {'peak MB':>8}")
+    for stage in args.stages:
+        command = [
+            sys.executable, str(Path(__file__).resolve()), "--child", stage,
+            "--fixtures", args.fixtures, "--repeat", str(args.repeat), "--model", args.model
+        ]
+        completed = subprocess.run(command, capture_output=True, text=True, cwd=ROOT)
+        lines = [line for line in completed.stdout.splitlines() if line.startswith('{')]
+        if completed.returncode != 0 or not lines:
+            error = (completed.stderr.strip().splitlines() or [f"exit code {completed.returncode}"])[-1]
+            results['stages'][stage] = {'error': error}
+            print(f"{stage:>12} failed: {error}")
+            continue
+
+        result = json.loads(lines[-1])
+        results['stages'][stage] = result
+        peak = f"{result['peak_rss_mb']:.0f}" if result['peak_rss_mb'] is not None else "n/a"
+        print(f"{stage:>12} {result['throughput']:>11.1f} {result['p50_seconds']:>8.3f} {result['p95_seconds']:>8.3f} {peak:>8}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    print(f"\nResults written to {output}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"Baseline saved to {baseline_path}")
+    elif baseline_path.exists():
+        regressions = compare(results, json.loads(baseline_path.read_text(encoding='utf-8')), args.tolerance)
+        if regressions:
+            print(f"\nRegressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline")
+    else:
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one")
+
+
+if __name__ == "__main__":
+    main()
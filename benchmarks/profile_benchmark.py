@@ -0,0 +1,83 @@
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+from src.batch_runner import decode_file, expand_inputs
+from src.decode_profiles import DecodeProfiles
+from src.transcriber import Transcriber
+
+
+def normalize_words(text: str):
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_errors(reference: str, hypothesis: str):
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+    return previous[-1], len(ref)
+
+
+def load_reference_set(directory: str):
+    pairs = []
+    for source in expand_inputs([directory]):
+        reference = source.with_suffix('.txt')
+        if not reference.exists():
+            print(f"Skipping {source.name}: no {reference.name}")
+            continue
+        audio = decode_file(str(source))
+        if audio is None:
+            print(f"Skipping {source.name}: could not decode")
+            continue
+        pairs.append((source.name, audio, reference.read_text(encoding='utf-8')))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report real-time factor and WER of each decode profile")
+    parser.add_argument("reference_dir", help="Directory of audio files, each with a same-named .txt reference transcript")
+    parser.add_argument("--model", default="turbo")
+    parser.add_argument("--device", default="cuda")
+    parser.add_argument("--profiles", nargs="+", help="Profiles to compare (default: all)")
+    parser.add_argument("--profile-config", help="JSON file with additional profiles")
+    args = parser.parse_args()
+
+    profiles = DecodeProfiles.from_file(Path(args.profile_config)) if args.profile_config else DecodeProfiles()
+    pairs = load_reference_set(args.reference_dir)
+    if not pairs:
+        raise SystemExit("No reference files found")
+    audio_seconds = sum(len(audio) for _, audio, _ in pairs) / 16000
+    print(f"Reference set: {len(pairs)} file(s), {audio_seconds:.0f}s of audio, model '{args.model}'")
+
+    transcriber = Transcriber(model_size=args.model, device=args.device, keep_model_loaded=True)
+    transcriber.warm_up()
+    print(f"{'profile':>12} {'decode s':>9} {'RTF':>7} {'WER':>7}")
+    for profile in args.profiles or list(profiles.profiles):
+        options = profiles.options(profile)
+        errors = words = 0
+        start = time.perf_counter()
+        for name, audio, reference in pairs:
+            hypothesis = transcriber.transcribe(audio, decode_options=options)
+            file_errors, file_words = word_errors(reference, hypothesis)
+            errors += file_errors
+            words += file_words
+        elapsed = time.perf_counter() - start
+        wer = errors / words if words else 0.0
+        print(f"{profile:>12} {elapsed:>9.1f} {elapsed / audio_seconds:>7.3f} {wer:>7.1%}")
+    transcriber.shutdown()
+
+
+if __name__ == "__main__":
+    main()
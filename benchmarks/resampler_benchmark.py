@@ -0,0 +1,64 @@
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from scipy import signal
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+from src.resampler import resample
+
+
+def fft_resample(audio: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    num_samples = int(len(audio) * target_rate / source_rate)
+    return signal.resample(audio, num_samples).astype(np.float32)
+
+
+def polyphase_resample(audio: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    return resample(audio, source_rate, target_rate)
+
+
+def measure(fn, audio: np.ndarray, source_rate: int, target_rate: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(audio, source_rate, target_rate)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare FFT and polyphase resampling")
+    parser.add_argument("--durations", type=float, nargs="+", default=[1, 10, 60], help="Input lengths in minutes")
+    parser.add_argument("--source-rate", type=int, default=48000)
+    parser.add_argument("--target-rate", type=int, default=16000)
+    parser.add_argument("--skip-fft-above", type=float, help="Skip the FFT path for inputs longer than this (minutes)")
+    args = parser.parse_args()
+
+    print(f"Resampling {args.source_rate} Hz -> {args.target_rate} Hz")
+    print(f"{'input':>8} {'method':>10} {'seconds':>9} {'x realtime':>11} {'peak MB':>9}")
+
+    rng = np.random.default_rng(0)
+    for minutes in args.durations:
+        num_samples = int(minutes * 60 * args.source_rate)
+        # Odd length so the FFT path does not get a power-of-two size for free.
+        audio = (rng.standard_normal(num_samples | 1) * 0.1).astype(np.float32)
+        audio_seconds = len(audio) / args.source_rate
+
+        methods = [("polyphase", polyphase_resample), ("fft", fft_resample)]
+        for name, fn in methods:
+            if name == "fft" and args.skip_fft_above is not None and minutes > args.skip_fft_above:
+                print(f"{minutes:>6g}m {name:>10} {'skipped':>9}")
+                continue
+            elapsed, peak = measure(fn, audio, args.source_rate, args.target_rate)
+            print(f"{minutes:>6g}m {name:>10} {elapsed:>9.2f} {audio_seconds / elapsed:>11.0f} {peak / 1e6:>9.1f}")
+
+        del audio
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import time
+
+PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(ROOT))
+
+HEAVY_MODULES = ('faster_whisper', 'scipy.signal', 'yt_dlp', 'pystray', 'PIL.Image')
+
+
+def load_audio(path: str):
+    import numpy as np
+
+    if path:
+        from src.local_file_processor import LocalFileProcessor
+
+        result = LocalFileProcessor().process_file(path)
+        if result is None:
+            raise RuntimeError(f"Could not decode {path}")
+        return result[0]
+
+    t = np.arange(3 * 16000, dtype=np.float32) / 16000
+    return (0.1 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def run_child(args) -> dict:
+    result = {'warm_up': args.warm_up, 'import_seconds': None, 'heavy_modules_at_import': []}
+
+    # noinspection PyBroadException
+    try:
+        from src.voice_paste_app import VoicePasteApp
+        result['import_seconds'] = time.perf_counter() - PROCESS_START
+        result['heavy_modules_at_import'] = [name for name in HEAVY_MODULES if name in sys.modules]
+
+        app = VoicePasteApp(persistent_cache=False, warm_up=args.warm_up)
+        app.transcriber.model_size = args.model
+        app.transcriber.preferred_device = args.device
+        app.hotkey_handler.start()
+        result['hotkey_ready_seconds'] = time.perf_counter() - PROCESS_START
+        transcriber = app.transcriber
+    except Exception as e:
+        from src.transcriber import Transcriber
+
+        result['hotkey_ready_seconds'] = None
+        result['hotkey_error'] = str(e)
+        transcriber = Transcriber(model_size=args.model, device=args.device)
+
+    transcriber.keep_model_loaded = True
+    if args.warm_up:
+        result['warm_up_seconds'] = transcriber.warm_up()
+
+    audio = load_audio(args.audio)
+    start_time = time.perf_counter()
+    text = transcriber.transcribe(audio)
+    result['first_transcript_latency_seconds'] = time.perf_counter() - start_time
+    result['first_transcript_seconds'] = time.perf_counter() - PROCESS_START
+    result['first_transcript_chars'] = len(text)
+    transcriber.shutdown()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure VoicePaste time-to-hotkey-ready and time-to-first-transcript")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh processes per configuration")
+    parser.add_argument("--model", default="turbo")
+    parser.add_argument("--device", default="cuda")
+    parser.add_argument("--audio", help="Clip to transcribe (defaults to a 3 s synthetic tone)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--warm-up", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args)))
+        return
+
+    print(f"{'config':>8} {'import s':>9} {'hotkey s':>9} {'warm-up s':>10} {'1st latency s':>14} {'1st total s':>12}")
+    for warm_up in (False, True):
+        for _ in range(args.runs):
+            command = [
+                sys.executable, str(Path(__file__).resolve()), "--child",
+                "--model", args.model, "--device", args.device
+            ]
+            if args.audio:
+                command += ["--audio", args.audio]
+            if warm_up:
+                command.append("--warm-up")
+
+            completed = subprocess.run(command, capture_output=True, text=True, cwd=ROOT)
+            lines = [line for line in completed.stdout.splitlines() if line.startswith('{')]
+            if completed.returncode != 0 or not lines:
+                print(f"Run failed: {completed.stderr.strip().splitlines()[-1:] or completed.returncode}")
+                continue
+
+            result = json.loads(lines[-1])
+            import_seconds, hotkey = result['import_seconds'], result['hotkey_ready_seconds']
+            print(
+                f"{'warm' if warm_up else 'cold':>8} "
+                f"{'n/a' if import_seconds is None else f'{import_seconds:.2f}':>9} "
+                f"{'n/a' if hotkey is None else f'{hotkey:.2f}':>9} "
+                f"{result.get('warm_up_seconds', 0.0):>10.2f} "
+                f"{result['first_transcript_latency_seconds']:>14.2f} "
+                f"{result['first_transcript_seconds']:>12.2f}"
+            )
+            if result.get('hotkey_error'):
+                print(f"{'':>8} hotkey listener unavailable: {result['hotkey_error']}")
+            if result['heavy_modules_at_import']:
+                print(f"{'':>8} heavy modules imported at startup: {', '.join(result['heavy_modules_at_import'])}")
+
+
+if __name__ == "__main__":
+    main()
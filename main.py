@@ -1,14 +1,13 @@
 import sys
 import argparse
-import pyaudio
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.resolve()))
 
-from src.voice_paste_app import VoicePasteApp
-
 
 def list_devices():
+    import pyaudio
+
     print("Available audio input devices:")
     p = pyaudio.PyAudio()
     for i in range(p.get_device_count()):
@@ -18,6 +17,128 @@ def list_devices():
     p.terminate()
 
 
+def build_decode_profiles(args):
+    from src.decode_profiles import DecodeProfiles
+
+    profiles = DecodeProfiles.from_file(Path(args.profile_config)) if args.profile_config else DecodeProfiles()
+    profiles.update_jobs({
+        'dictation': args.dictation_profile,
+        'file': args.file_profile,
+        'youtube': args.youtube_profile,
+        'batch': args.batch_profile
+    })
+    return profiles
+
+
+def run_batch(args):
+    from src.batch_runner import BatchRunner
+    from src.batch_transcriber import BatchTranscriber
+    from src.metrics import MetricsRecorder
+    from src.transcriber import Transcriber
+
+    model_size = args.model or args.file_model or args.default_model
+    decode_options = build_decode_profiles(args).options_for('batch', timestamps=True)
+    if args.parallel_decode:
+        from src.parallel_decoder import ParallelDecoder
+
+        transcriber = ParallelDecoder(
+            model_size,
+            processes=args.parallel_decode,
+            cpu_threads=args.cpu_threads,
+            decode_options=decode_options
+        )
+    else:
+        transcriber = Transcriber(model_size=model_size, keep_model_loaded=True)
+        transcriber.decode_options = decode_options
+    batch_transcriber = None
+    if args.batch_size and not args.parallel_decode:
+        batch_transcriber = BatchTranscriber(transcriber, batch_size=args.batch_size, max_wait_seconds=args.batch_wait)
+
+    metrics_recorder = MetricsRecorder(Path(args.metrics_log) if args.metrics_log else None)
+    runner = BatchRunner(
+        batch_transcriber or transcriber,
+        manifest_path=Path(args.manifest),
+        output_formats=args.formats.split(','),
+        decode_workers=args.decode_workers,
+        transcribe_workers=args.batch_size if batch_transcriber is not None else 1,
+        language=args.language,
+        force=args.force,
+        chunked=not args.parallel_decode,
+        metrics_recorder=metrics_recorder
+    )
+    try:
+        summary = runner.run(args.batch)
+    finally:
+        if batch_transcriber is not None:
+            batch_transcriber.shutdown()
+        transcriber.shutdown()
+        metrics_recorder.close()
+    return 1 if summary['failed'] else 0
+
+
+def run_youtube_batch(args):
+    from src.batch_transcriber import BatchTranscriber
+    from src.job_workspace import WorkspaceManager
+    from src.metrics import MetricsRecorder
+    from src.persistent_cache import PersistentCache, make_cache_key
+    from src.transcriber import Transcriber
+    from src.youtube_batch import YouTubeBatchRunner
+    from src.youtube_downloader import YouTubeDownloader
+
+    urls = []
+    for item in args.youtube_batch:
+        if Path(item).is_file():
+            urls.extend(YouTubeDownloader.parse_url_list(Path(item).read_text(encoding='utf-8')))
+        else:
+            urls.append(item)
+
+    model_size = args.model or args.youtube_model or args.default_model
+    decode_options = build_decode_profiles(args).options_for('batch', timestamps=True)
+    transcriber = Transcriber(model_size=model_size, keep_model_loaded=True)
+    transcriber.decode_options = decode_options
+    batch_transcriber = None
+    if args.batch_size:
+        batch_transcriber = BatchTranscriber(transcriber, batch_size=args.batch_size, max_wait_seconds=args.batch_wait)
+
+    cache = None
+    if not args.no_persistent_cache:
+        try:
+            cache = PersistentCache()
+        except Exception as e:
+            print(f"Persistent cache disabled: {e}")
+
+    metrics_recorder = MetricsRecorder(Path(args.metrics_log) if args.metrics_log else None)
+    workspaces = WorkspaceManager(use_tmpfs=args.tmpfs_workspace)
+    workspaces.cleanup_stale()
+    runner = YouTubeBatchRunner(
+        YouTubeDownloader(workspaces=workspaces),
+        batch_transcriber or transcriber,
+        output_dir=Path(args.output_dir),
+        output_formats=args.formats.split(','),
+        download_workers=args.download_workers,
+        prefetch_chunks=args.prefetch_chunks,
+        language=args.language,
+        force=args.force,
+        cache_key=lambda video_id: make_cache_key(f"youtube:{video_id}", model_size, args.language, decode_options),
+        cache_lookup=cache.get if cache is not None else None,
+        cache_store=cache.put if cache is not None else None,
+        cache_lookup_segments=cache.get if cache is not None else None,
+        cache_store_segments=cache.put if cache is not None else None,
+        metrics_recorder=metrics_recorder
+    )
+    try:
+        summary = runner.run(urls)
+    finally:
+        if batch_transcriber is not None:
+            batch_transcriber.shutdown()
+        transcriber.shutdown()
+        metrics_recorder.close()
+        workspaces.close_all()
+        if cache is not None:
+            cache.close()
+    return 1 if summary['failed'] else 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="VoicePaste - Voice to text with clipboard")
     parser.add_argument(
@@ -25,6 +146,209 @@ def main():
         action="store_true",
         help="Keep the Whisper model loaded in memory at all times (uses more GPU memory)"
     )
+    parser.add_argument(
+        "--model",
+        help="Use this Whisper model for everything, overriding the routing rules below"
+    )
+    parser.add_argument(
+        "--default-model",
+        default="turbo",
+        help="Whisper model used when no routing rule matches (default: turbo)"
+    )
+    parser.add_argument(
+        "--dictation-model",
+        help="Whisper model for microphone dictation"
+    )
+    parser.add_argument(
+        "--file-model",
+        help="Whisper model for local files"
+    )
+    parser.add_argument(
+        "--youtube-model",
+        help="Whisper model for YouTube videos"
+    )
+    parser.add_argument(
+        "--short-model",
+        help="Whisper model for audio no longer than --short-max-seconds (e.g. small)"
+    )
+    parser.add_argument(
+        "--short-max-seconds",
+        type=float,
+        default=20.0,
+        help="Longest audio routed to --short-model"
+    )
+    parser.add_argument(
+        "--long-model",
+        help="Whisper model for audio at least --long-min-seconds long (e.g. large-v3)"
+    )
+    parser.add_argument(
+        "--long-min-seconds",
+        type=float,
+        default=1800.0,
+        help="Shortest audio routed to --long-model"
+    )
+    parser.add_argument(
+        "--model-memory-mb",
+        type=int,
+        help="Memory budget for loaded models; least recently used models are unloaded beyond it"
+    )
+    parser.add_argument(
+        "--profile-config",
+        help="JSON file defining decode profiles and which profile each job type uses"
+    )
+    parser.add_argument(
+        "--dictation-profile",
+        help="Decode profile for dictation: fast, accurate (default), archival or one from --profile-config"
+    )
+    parser.add_argument(
+        "--file-profile",
+        help="Decode profile for local files"
+    )
+    parser.add_argument(
+        "--youtube-profile",
+        help="Decode profile for YouTube videos"
+    )
+    parser.add_argument(
+        "--batch-profile",
+        help="Decode profile for --batch mode"
+    )
+    parser.add_argument(
+        "--draft-model",
+        help="Small model (e.g. tiny) whose quick greedy transcript is copied first, then replaced by the main model's result if not yet pasted"
+    )
+    parser.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="Load the model and run a short synthetic clip through it in the background at startup"
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Transcribe while recording so only the last few seconds are decoded after Shift+V is released"
+    )
+    parser.add_argument(
+        "--max-recording-seconds",
+        type=float,
+        help="Keep at most this many seconds of a recording (oldest audio is dropped beyond it)"
+    )
+    parser.add_argument(
+        "--vad-gate",
+        action="store_true",
+        help="Drop silence while recording so only speech (plus a short margin) is buffered and transcribed"
+    )
+    parser.add_argument(
+        "--continuous",
+        action="store_true",
+        help="Start in hands-free mode: every pause in speech sends the utterance to the model (Shift+C toggles it)"
+    )
+    parser.add_argument(
+        "--continuous-output",
+        choices=["append", "paste"],
+        default="append",
+        help="In continuous mode, append utterances to the clipboard text or paste each one into the focused window"
+    )
+    parser.add_argument(
+        "--metrics-log",
+        help="Append per-job stage timings, real-time factor and cache hits to this JSON-lines file"
+    )
+    parser.add_argument(
+        "--prefetch-chunks",
+        type=int,
+        default=32,
+        help="YouTube/file audio chunks (10 s each) to download and decode ahead of transcription"
+    )
+    parser.add_argument(
+        "--tmpfs-workspace",
+        action="store_true",
+        help="Keep per-job temporary downloads in memory (/dev/shm) when available"
+    )
+    parser.add_argument(
+        "--no-persistent-cache",
+        action="store_true",
+        help="Do not store transcriptions in the on-disk cache"
+    )
+    parser.add_argument(
+        "--gpu-workers",
+        type=int,
+        default=1,
+        help="Number of transcription jobs that may run at once on the GPU"
+    )
+    parser.add_argument(
+        "--cpu-workers",
+        type=int,
+        default=1,
+        help="Number of transcription jobs that may run at once on the CPU, alongside GPU jobs"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Batch speech segments from YouTube/file transcriptions through the batched pipeline (e.g. 8)"
+    )
+    parser.add_argument(
+        "--batch-wait",
+        type=float,
+        default=0.2,
+        help="Seconds to wait for more segments before running a partially filled batch"
+    )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="INPUT",
+        help="Transcribe files, glob patterns or directories without starting the tray app, then exit"
+    )
+    parser.add_argument(
+        "--youtube-batch",
+        nargs="+",
+        metavar="URL_OR_FILE",
+        help="Transcribe YouTube videos, playlists or text files with one URL per line without starting the tray app, then exit"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="voicepaste_youtube",
+        help="Folder for transcripts and the resumable manifest of --youtube-batch and clipboard playlists"
+    )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=2,
+        help="Number of YouTube downloads running at once in bulk mode"
+    )
+    parser.add_argument(
+        "--formats",
+        default="txt,json,srt",
+        help="Comma-separated output formats written next to each input in --batch mode (or to --output-dir for --youtube-batch)"
+    )
+    parser.add_argument(
+        "--decode-workers",
+        type=int,
+        default=2,
+        help="Number of processes decoding audio in --batch mode (up to this many files plus the ones being transcribed are held in memory)"
+    )
+    parser.add_argument(
+        "--manifest",
+        default="voicepaste_manifest.json",
+        help="Manifest used to skip already transcribed files in --batch mode"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Transcribe every input in --batch mode, even if the manifest marks it done"
+    )
+    parser.add_argument(
+        "--parallel-decode",
+        type=int,
+        metavar="PROCESSES",
+        help="In --batch mode, split each file at pauses and decode the pieces on this many CPU processes, each with its own model"
+    )
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        help="CPU threads per --parallel-decode process (default: cores divided by processes)"
+    )
+    parser.add_argument(
+        "--language",
+        help="Language code for --batch mode (auto-detected if omitted)"
+    )
     parser.add_argument(
         "--device",
         type=int,
@@ -41,7 +365,53 @@ def main():
         list_devices()
         sys.exit(0)
 
-    app = VoicePasteApp(keep_model_loaded=args.keep_model_loaded, device_id=args.device)
+    try:
+        build_decode_profiles(args)
+    except (OSError, ValueError) as e:
+        print(f"Invalid decode profile settings: {e}")
+        sys.exit(2)
+
+    if args.batch:
+        sys.exit(run_batch(args))
+    if args.youtube_batch:
+        sys.exit(run_youtube_batch(args))
+
+    from src.model_pool import ModelRouter
+    from src.voice_paste_app import VoicePasteApp
+
+    source_models = {'mic': args.dictation_model, 'file': args.file_model, 'youtube': args.youtube_model}
+    router = ModelRouter(
+        default_model=args.default_model,
+        short_model=args.short_model,
+        short_max_seconds=args.short_max_seconds,
+        long_model=args.long_model,
+        long_min_seconds=args.long_min_seconds,
+        source_models={source: model for source, model in source_models.items() if model},
+        override=args.model
+    )
+    app = VoicePasteApp(
+        keep_model_loaded=args.keep_model_loaded,
+        device_id=args.device,
+        streaming=args.streaming,
+        max_recording_seconds=args.max_recording_seconds,
+        persistent_cache=not args.no_persistent_cache,
+        worker_slots={'cuda': args.gpu_workers, 'cpu': args.cpu_workers},
+        batch_size=args.batch_size,
+        batch_wait_seconds=args.batch_wait,
+        warm_up=args.warm_up,
+        model_router=router,
+        model_memory_budget_mb=args.model_memory_mb,
+        vad_gate=args.vad_gate,
+        continuous=args.continuous,
+        continuous_output=args.continuous_output,
+        draft_model=args.draft_model,
+        decode_profiles=build_decode_profiles(args),
+        metrics_log=args.metrics_log,
+        prefetch_chunks=args.prefetch_chunks,
+        youtube_output_dir=args.output_dir,
+        download_workers=args.download_workers,
+        tmpfs_workspace=args.tmpfs_workspace
+    )
     try:
         app.start()
     except Exception as e:
@@ -0,0 +1,108 @@
+import threading
+import numpy as np
+from typing import Optional
+
+
+class AudioBuffer:
+    OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest')
+
+    def __init__(
+        self,
+        sample_rate: int,
+        initial_seconds: float = 60.0,
+        max_seconds: Optional[float] = None,
+        overflow_policy: str = 'drop_oldest',
+        dtype=np.float32
+    ):
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+
+        self.sample_rate = sample_rate
+        self.dtype = np.dtype(dtype)
+        self.max_samples = int(max_seconds * sample_rate) if max_seconds else None
+        self.initial_samples = max(1, int(initial_seconds * sample_rate))
+        if self.max_samples is not None:
+            self.initial_samples = min(self.initial_samples, self.max_samples)
+        self.overflow_policy = overflow_policy
+        self.lock = threading.Lock()
+        self.data = np.empty(self.initial_samples, dtype=self.dtype)
+        self.start = 0
+        self.length = 0
+        self.dropped_samples = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def capacity(self) -> int:
+        return len(self.data)
+
+    @property
+    def duration(self) -> float:
+        return self.length / self.sample_rate
+
+    def reset(self):
+        with self.lock:
+            self.data = np.empty(self.initial_samples, dtype=self.dtype)
+            self.start = 0
+            self.length = 0
+            self.dropped_samples = 0
+
+    def write_pcm16(self, in_data: bytes):
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        scale = 1.0 / 32768.0 if self.dtype.kind == 'f' else 1.0
+        self.write(samples, scale)
+
+    def write(self, samples: np.ndarray, scale: float = 1.0):
+        with self.lock:
+            count = len(samples)
+            free = self._reserve(count)
+
+            if free < count:
+                if self.overflow_policy == 'drop_newest':
+                    self.dropped_samples += count - free
+                    samples = samples[:free]
+                    count = free
+                else:
+                    if count > self.capacity:
+                        self.dropped_samples += count - self.capacity
+                        samples = samples[-self.capacity:]
+                        count = self.capacity
+                    overflow = count - free
+                    self.start = (self.start + overflow) % self.capacity
+                    self.length -= overflow
+                    self.dropped_samples += overflow
+
+            position = (self.start + self.length) % self.capacity
+            first = min(count, self.capacity - position)
+            self._store(self.data[position:position + first], samples[:first], scale)
+            if first < count:
+                self._store(self.data[:count - first], samples[first:], scale)
+            self.length += count
+
+    def view(self) -> np.ndarray:
+        with self.lock:
+            if self.start + self.length <= self.capacity:
+                return self.data[self.start:self.start + self.length]
+            return np.concatenate((self.data[self.start:], self.data[:(self.start + self.length) % self.capacity]))
+
+    def _reserve(self, count: int) -> int:
+        needed = self.length + count
+        if needed > self.capacity and self.start == 0:
+            new_capacity = self.capacity
+            while new_capacity < needed:
+                new_capacity *= 2
+            if self.max_samples is not None:
+                new_capacity = min(new_capacity, self.max_samples)
+            if new_capacity > self.capacity:
+                grown = np.empty(new_capacity, dtype=self.dtype)
+                grown[:self.length] = self.data[:self.length]
+                self.data = grown
+        return self.capacity - self.length
+
+    @staticmethod
+    def _store(target: np.ndarray, source: np.ndarray, scale: float):
+        if scale == 1.0:
+            target[:] = source
+        else:
+            np.multiply(source, np.float32(scale), out=target, casting='unsafe')
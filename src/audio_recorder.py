@@ -1,21 +1,42 @@
 import pyaudio
 import numpy as np
 import threading
-from typing import Optional
-from scipy import signal
+import time
+from typing import Optional, Callable
+
+from src import metrics
+from src.audio_buffer import AudioBuffer
+from src.resampler import resample
+from src.voice_activity import EnergyVAD
 
 
 class AudioRecorder:
-    def __init__(self, target_sample_rate: int = 16000, device_id: Optional[int] = None):
+    def __init__(
+        self,
+        target_sample_rate: int = 16000,
+        device_id: Optional[int] = None,
+        max_duration_seconds: Optional[float] = None,
+        overflow_policy: str = 'drop_oldest',
+        vad_gate: bool = False
+    ):
         self.target_sample_rate = target_sample_rate
         self.is_recording = False
-        self.audio_data = []
+        self.buffer_audio = True
+        self.started_at: Optional[float] = None
+        self.convert_seconds = 0.0
         self.stream = None
+        self.chunk_callback: Optional[Callable[[bytes], None]] = None
         self.lock = threading.Lock()
         self.pyaudio_instance = pyaudio.PyAudio()
         self.device_id = device_id if device_id is not None else self._find_input_device()
 
         self.device_sample_rate = self._get_device_sample_rate()
+        self.audio_buffer = AudioBuffer(
+            self.device_sample_rate,
+            max_seconds=max_duration_seconds,
+            overflow_policy=overflow_policy
+        )
+        self.vad: Optional[EnergyVAD] = EnergyVAD(self.device_sample_rate) if vad_gate else None
         print(f"Device native sample rate: {self.device_sample_rate} Hz")
         print(f"Will resample to: {self.target_sample_rate} Hz for Whisper")
 
@@ -43,12 +64,17 @@ class AudioRecorder:
         except Exception:
             return 48000
 
-    def start_recording(self):
+    def start_recording(self, buffer_audio: bool = True):
         with self.lock:
             if self.is_recording:
                 return
             self.is_recording = True
-            self.audio_data = []
+            self.buffer_audio = buffer_audio
+            self.started_at = time.perf_counter()
+            self.convert_seconds = 0.0
+            self.audio_buffer.reset()
+            if self.vad is not None:
+                self.vad.reset()
 
         if self.device_id is None:
             raise RuntimeError("No input device found. Please check your microphone connection.")
@@ -82,24 +108,55 @@ class AudioRecorder:
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+        if self.started_at is not None:
+            metrics.record_stage('capture', time.perf_counter() - self.started_at)
+        metrics.record_stage('convert', self.convert_seconds)
+
+        if self.vad is not None and self.buffer_audio:
+            self._store(self.vad.flush())
+            raw_seconds = self.vad.raw_samples / self.device_sample_rate
+            kept_seconds = self.vad.kept_samples / self.device_sample_rate
+            print(f"Voice activity gate kept {kept_seconds:.1f}s of {raw_seconds:.1f}s ({self.vad.kept_ratio:.0%})")
+
+        if len(self.audio_buffer) == 0:
+            return None
+
+        if self.audio_buffer.dropped_samples:
+            dropped_seconds = self.audio_buffer.dropped_samples / self.device_sample_rate
+            print(f"Recording exceeded the maximum duration, {dropped_seconds:.1f}s of audio dropped")
 
-        if self.audio_data:
-            audio_np = np.frombuffer(b''.join(self.audio_data), dtype=np.int16)
-            audio_float = audio_np.astype(np.float32) / 32768.0
+        audio_float = self.audio_buffer.view()
 
-            if self.device_sample_rate != self.target_sample_rate:
-                num_samples = int(len(audio_float) * self.target_sample_rate / self.device_sample_rate)
-                audio_float = signal.resample(audio_float, num_samples)
+        if self.device_sample_rate != self.target_sample_rate:
+            with metrics.stage('resample'):
+                audio_float = resample(audio_float, self.device_sample_rate, self.target_sample_rate)
 
-            return audio_float
-        return None
+        return audio_float
 
     # noinspection PyUnusedLocal
     def _audio_callback(self, in_data, frame_count, time_info, status):
         if self.is_recording:
-            self.audio_data.append(in_data)
+            if not self.buffer_audio:
+                if self.chunk_callback is not None:
+                    self.chunk_callback(in_data)
+            elif self.vad is not None:
+                self._store(self.vad.process(np.frombuffer(in_data, dtype=np.int16)))
+            else:
+                start_time = time.perf_counter()
+                self.audio_buffer.write_pcm16(in_data)
+                self.convert_seconds += time.perf_counter() - start_time
+                if self.chunk_callback is not None:
+                    self.chunk_callback(in_data)
         return in_data, pyaudio.paContinue
 
+    def _store(self, samples: np.ndarray):
+        if len(samples):
+            start_time = time.perf_counter()
+            self.audio_buffer.write(samples, 1.0 / 32768.0)
+            self.convert_seconds += time.perf_counter() - start_time
+            if self.chunk_callback is not None:
+                self.chunk_callback(samples.tobytes())
+
     def get_available_devices(self):
         devices = []
         for i in range(self.pyaudio_instance.get_device_count()):
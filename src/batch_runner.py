@@ -0,0 +1,248 @@
+import glob
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from src import metrics
+from src.chunked_pipeline import ChunkedTranscriptionPipeline
+from src.local_file_processor import LocalFileProcessor
+from src.metrics import MetricsRecorder
+from src.persistent_cache import file_fingerprint
+from src.transcriber import TranscriptSegment
+
+OUTPUT_FORMATS = ('txt', 'json', 'srt')
+
+
+def decode_file(path: str) -> Optional[np.ndarray]:
+    processor = LocalFileProcessor()
+    try:
+        result = processor.process_file(path)
+    finally:
+        processor.cleanup()
+    return None if result is None else result[0]
+
+
+def expand_inputs(inputs: Iterable[str]) -> List[Path]:
+    supported = LocalFileProcessor.SUPPORTED_AUDIO | LocalFileProcessor.SUPPORTED_VIDEO
+    files: List[Path] = []
+    seen = set()
+
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = sorted(p for p in path.rglob('*') if p.is_file())
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = sorted(Path(p) for p in glob.glob(item, recursive=True) if Path(p).is_file())
+
+        for candidate in candidates:
+            resolved = candidate.resolve()
+            if candidate.suffix.lower() in supported and resolved not in seen:
+                seen.add(resolved)
+                files.append(resolved)
+
+    return files
+
+
+def format_timestamp(seconds: float) -> str:
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
+def output_bases(sources: List[Path]) -> Dict[Path, Path]:
+    stems: Dict[Path, int] = {}
+    for source in sources:
+        stem = source.with_suffix('')
+        stems[stem] = stems.get(stem, 0) + 1
+    return {
+        source: source.with_suffix('') if stems[source.with_suffix('')] == 1 else source
+        for source in sources
+    }
+
+
+def write_outputs(
+    source: Path,
+    segments: List[TranscriptSegment],
+    formats: Iterable[str],
+    output_base: Optional[Path] = None
+) -> List[Path]:
+    output_base = output_base or source.with_suffix('')
+    written = []
+    for output_format in formats:
+        output_path = output_base.with_name(f"{output_base.name}.{output_format}")
+        if output_format == 'txt':
+            content = " ".join(segment.text for segment in segments).strip() + "\n"
+        elif output_format == 'json':
+            content = json.dumps({
+                'source': source.name,
+                'text': " ".join(segment.text for segment in segments).strip(),
+                'segments': [segment._asdict() for segment in segments]
+            }, ensure_ascii=False, indent=2)
+        elif output_format == 'srt':
+            content = "\n".join(
+                f"{index}\n{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}\n{segment.text}\n"
+                for index, segment in enumerate(segments, start=1)
+            )
+        else:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        temp_path = output_path.with_name(output_path.name + ".tmp")
+        temp_path.write_text(content, encoding='utf-8')
+        os.replace(temp_path, output_path)
+        written.append(output_path)
+    return written
+
+
+class BatchManifest:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+        if self.path.is_file():
+            # noinspection PyBroadException
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8')).get('files', {})
+            except Exception as e:
+                print(f"Ignoring unreadable manifest {self.path}: {e}")
+
+    def is_done(self, source: Union[Path, str], fingerprint: str) -> bool:
+        entry = self.entries.get(str(source))
+        if not entry or entry.get('status') != 'done' or entry.get('fingerprint') != fingerprint:
+            return False
+        return all(Path(output).is_file() for output in entry.get('outputs', []))
+
+    def mark(self, source: Union[Path, str], fingerprint: str, status: str, outputs: Optional[List[Path]] = None, error: Optional[str] = None):
+        with self.lock:
+            self.entries[str(source)] = {
+                'fingerprint': fingerprint,
+                'status': status,
+                'outputs': [str(output) for output in outputs or []],
+                'error': error,
+                'updated': time.time()
+            }
+            self._save()
+
+    def save(self):
+        with self.lock:
+            self._save()
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        temp_path.write_text(json.dumps({'files': self.entries}, indent=2), encoding='utf-8')
+        os.replace(temp_path, self.path)
+
+
+class BatchRunner:
+    def __init__(
+        self,
+        transcriber,
+        manifest_path: Path,
+        output_formats: Iterable[str] = OUTPUT_FORMATS,
+        decode_workers: int = 2,
+        transcribe_workers: int = 1,
+        language: Optional[str] = None,
+        force: bool = False,
+        chunked: bool = True,
+        metrics_recorder: Optional[MetricsRecorder] = None,
+        decode_fn: Callable[[str], Optional[np.ndarray]] = decode_file,
+        executor_factory: Callable[[int], Executor] = ProcessPoolExecutor
+    ):
+        self.output_formats = list(output_formats)
+        for output_format in self.output_formats:
+            if output_format not in OUTPUT_FORMATS:
+                raise ValueError(f"Unsupported output format: {output_format}")
+
+        self.transcriber = transcriber
+        self.manifest = BatchManifest(manifest_path)
+        self.decode_workers = max(1, decode_workers)
+        self.transcribe_workers = max(1, transcribe_workers)
+        self.language = language
+        self.force = force
+        self.chunked = chunked
+        self.metrics = metrics_recorder or MetricsRecorder()
+        self.decode_fn = decode_fn
+        self.executor_factory = executor_factory
+        self.output_bases: Dict[Path, Path] = {}
+
+    def run(self, inputs: Iterable[str]) -> Dict[str, int]:
+        summary = {'done': 0, 'skipped': 0, 'failed': 0}
+        sources = expand_inputs(inputs)
+        self.output_bases = output_bases(sources)
+        pending = []
+        for source in sources:
+            fingerprint = file_fingerprint(str(source))
+            if not self.force and self.manifest.is_done(source, fingerprint):
+                print(f"Skipping (already transcribed): {source}")
+                summary['skipped'] += 1
+            else:
+                pending.append((source, fingerprint))
+
+        if not pending:
+            return summary
+
+        print(
+            f"Transcribing {len(pending)} file(s) with {self.decode_workers} decode worker(s) "
+            f"and {self.transcribe_workers} transcription worker(s)..."
+        )
+        # Several files transcribed at once let a batching transcriber fill its batches with clips from all of them.
+        with self.executor_factory(self.decode_workers) as executor, \
+                ThreadPoolExecutor(self.transcribe_workers) as transcribe_executor:
+            queued = deque(pending)
+            decoding = deque()
+            transcribing = set()
+            while queued or decoding or transcribing:
+                # Files handed to a transcription worker leave the decode queue, so every decode process stays busy
+                # and at most decode_workers + transcribe_workers decoded files are held in memory.
+                while queued and len(decoding) < self.decode_workers:
+                    source, fingerprint = queued.popleft()
+                    decoding.append((source, fingerprint, executor.submit(self.decode_fn, str(source))))
+
+                while decoding and len(transcribing) < self.transcribe_workers:
+                    source, fingerprint, future = decoding.popleft()
+                    transcribing.add(transcribe_executor.submit(self._transcribe_file, source, fingerprint, future))
+
+                finished, transcribing = wait(transcribing, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    summary[future.result()] += 1
+
+        print(f"Batch finished: {summary['done']} done, {summary['skipped']} skipped, {summary['failed']} failed")
+        return summary
+
+    def _transcribe_file(self, source: Path, fingerprint: str, future) -> str:
+        try:
+            with self.metrics.job('batch') as job:
+                with metrics.stage('fetch'):
+                    audio = future.result()
+                if audio is None:
+                    raise RuntimeError("could not decode audio")
+
+                job.audio_seconds = len(audio) / 16000
+                print(f"Transcribing: {source.name} ({job.audio_seconds:.1f}s)")
+                start_time = time.time()
+                if self.chunked:
+                    pipeline = ChunkedTranscriptionPipeline(self.transcriber, language=self.language)
+                    segments = pipeline.run([audio], total_duration=job.audio_seconds)
+                else:
+                    segments = self.transcriber.transcribe_segments(audio, language=self.language)
+                with metrics.stage('write'):
+                    outputs = write_outputs(source, segments, self.output_formats, self.output_bases.get(source))
+                print(f"Finished {source.name} in {time.time() - start_time:.1f}s")
+
+            self.manifest.mark(source, fingerprint, 'done', outputs)
+            return 'done'
+        except Exception as e:
+            print(f"Failed to transcribe {source}: {e}")
+            self.manifest.mark(source, fingerprint, 'failed', error=str(e))
+            return 'failed'
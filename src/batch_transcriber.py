@@ -0,0 +1,214 @@
+import bisect
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src import metrics
+from src.job_scheduler import JobCancelledError
+from src.transcriber import Transcriber, TranscriptSegment
+
+
+class BatchRequest:
+    def __init__(self, audio_data: np.ndarray, language: Optional[str]):
+        self.audio_data = audio_data
+        self.language = language
+        self.clips: Optional[List[Dict[str, float]]] = None
+        self.segments: List[TranscriptSegment] = []
+        self.error: Optional[BaseException] = None
+        self.is_cancelled = False
+        self.done_event = threading.Event()
+
+    def cancel(self):
+        self.is_cancelled = True
+        self.done_event.set()
+
+    def result(self) -> List[TranscriptSegment]:
+        self.done_event.wait()
+        if self.is_cancelled:
+            raise JobCancelledError("Batched transcription was cancelled")
+        if self.error is not None:
+            raise self.error
+        return self.segments
+
+
+class BatchTranscriber:
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        batch_size: int = 8,
+        max_wait_seconds: float = 0.2,
+        max_clip_seconds: float = 30.0,
+        sample_rate: int = 16000,
+        executor: Optional[Callable[[Callable[[], Any]], Any]] = None
+    ):
+        self.transcriber = transcriber
+        self.batch_size = max(1, batch_size)
+        self.max_wait_seconds = max_wait_seconds
+        self.max_clip_seconds = max_clip_seconds
+        self.sample_rate = sample_rate
+        self.executor = executor or (lambda fn: fn())
+        self.requests: "queue.Queue[Optional[BatchRequest]]" = queue.Queue()
+        self.held: Optional[BatchRequest] = None
+        self.batches_run = 0
+        self.clips_run = 0
+        self.is_running = True
+        self.collector_thread = threading.Thread(target=self._collect_loop, daemon=True)
+        self.collector_thread.start()
+
+    def submit(self, audio_data: np.ndarray, language: Optional[str] = None) -> BatchRequest:
+        request = BatchRequest(np.asarray(audio_data, dtype=np.float32), language)
+        if not self.is_running:
+            request.cancel()
+            return request
+        self.requests.put(request)
+        return request
+
+    def transcribe_segments(self, audio_data: np.ndarray, language: Optional[str] = None) -> List[TranscriptSegment]:
+        request = self.submit(audio_data, language=language)
+        with metrics.stage('decode'):
+            return request.result()
+
+    def transcribe(self, audio_data: np.ndarray, language: Optional[str] = None) -> str:
+        segments = self.transcribe_segments(audio_data, language=language)
+        return " ".join(segment.text for segment in segments).strip()
+
+    def client(self) -> "BatchClient":
+        return BatchClient(self)
+
+    def shutdown(self):
+        self.is_running = False
+        self.requests.put(None)
+        self.collector_thread.join(timeout=5)
+        while True:
+            try:
+                request = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                request.cancel()
+
+    def _collect_loop(self):
+        while self.is_running:
+            batch = self._collect_batch()
+            if batch:
+                self._run_batch(batch)
+
+    def _collect_batch(self) -> List[BatchRequest]:
+        first = self.held
+        self.held = None
+        if first is None:
+            first = self.requests.get()
+        if first is None or not self._prepare(first):
+            return []
+
+        batch = [first]
+        clip_count = len(first.clips)
+        deadline = time.time() + self.max_wait_seconds
+        while clip_count < self.batch_size:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                request = self.requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                self.is_running = False
+                break
+            if not self._prepare(request):
+                continue
+            if request.language != first.language:
+                self.held = request
+                break
+            batch.append(request)
+            clip_count += len(request.clips)
+        return batch
+
+    def _prepare(self, request: BatchRequest) -> bool:
+        if request.is_cancelled:
+            return False
+        # noinspection PyBroadException
+        try:
+            request.clips = self.transcriber.speech_clips(
+                request.audio_data,
+                max_clip_seconds=self.max_clip_seconds,
+                sample_rate=self.sample_rate
+            )
+        except Exception as e:
+            request.error = e
+            request.done_event.set()
+            return False
+
+        if not request.clips:
+            request.done_event.set()
+            return False
+        return True
+
+    def _run_batch(self, batch: List[BatchRequest]):
+        batch = [request for request in batch if not request.is_cancelled]
+        if not batch:
+            return
+
+        offsets = []
+        clip_timestamps = []
+        position = 0
+        for request in batch:
+            offset = position / self.sample_rate
+            offsets.append(offset)
+            for clip in request.clips:
+                clip_timestamps.append({'start': clip['start'] + offset, 'end': clip['end'] + offset})
+            position += len(request.audio_data)
+
+        audio = np.concatenate([request.audio_data for request in batch])
+        language = batch[0].language
+        try:
+            segments = self.executor(lambda: self.transcriber.transcribe_batched(
+                audio,
+                clip_timestamps=clip_timestamps,
+                batch_size=self.batch_size,
+                language=language
+            ))
+        except BaseException as e:
+            for request in batch:
+                request.error = e
+                request.done_event.set()
+            return
+
+        self.batches_run += 1
+        self.clips_run += len(clip_timestamps)
+        for segment in segments:
+            index = max(bisect.bisect_right(offsets, segment.start) - 1, 0)
+            offset = offsets[index]
+            batch[index].segments.append(TranscriptSegment(
+                segment.start - offset,
+                segment.end - offset,
+                segment.text
+            ))
+        for request in batch:
+            request.done_event.set()
+
+
+class BatchClient:
+    def __init__(self, batcher: BatchTranscriber):
+        self.batcher = batcher
+        self.is_cancelled = False
+        self.current_request: Optional[BatchRequest] = None
+
+    def transcribe_segments(self, audio_data: np.ndarray, language: Optional[str] = None) -> List[TranscriptSegment]:
+        if self.is_cancelled:
+            raise JobCancelledError("Batched transcription was cancelled")
+        self.current_request = self.batcher.submit(audio_data, language=language)
+        with metrics.stage('decode'):
+            return self.current_request.result()
+
+    def transcribe(self, audio_data: np.ndarray, language: Optional[str] = None) -> str:
+        segments = self.transcribe_segments(audio_data, language=language)
+        return " ".join(segment.text for segment in segments).strip()
+
+    def cancel(self):
+        self.is_cancelled = True
+        if self.current_request is not None:
+            self.current_request.cancel()
@@ -0,0 +1,141 @@
+import re
+import numpy as np
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from src.transcriber import Transcriber, TranscriptSegment
+
+
+class ChunkedTranscriptionPipeline:
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        sample_rate: int = 16000,
+        window_seconds: float = 120.0,
+        overlap_seconds: float = 5.0,
+        split_on_silence: bool = True,
+        silence_search_seconds: float = 10.0,
+        silence_threshold: float = 0.01,
+        language: Optional[str] = None,
+        progress_callback: Optional[Callable[[float, Optional[float]], None]] = None
+    ):
+        if overlap_seconds >= window_seconds:
+            raise ValueError("Overlap must be shorter than the window")
+
+        self.transcriber = transcriber
+        self.sample_rate = sample_rate
+        self.window_samples = int(window_seconds * sample_rate)
+        self.overlap_samples = int(overlap_seconds * sample_rate)
+        self.split_on_silence = split_on_silence
+        self.silence_search_samples = int(silence_search_seconds * sample_rate)
+        self.silence_threshold = silence_threshold
+        self.frame_samples = sample_rate // 50
+        self.language = language
+        self.progress_callback = progress_callback
+
+    def run(self, chunks: Iterable[np.ndarray], total_duration: Optional[float] = None) -> List[TranscriptSegment]:
+        segments: List[TranscriptSegment] = []
+        parts: List[np.ndarray] = []
+        pending_samples = 0
+        offset = 0
+        overlapped = False
+
+        for chunk in chunks:
+            parts.append(np.asarray(chunk, dtype=np.float32))
+            pending_samples += len(chunk)
+            if pending_samples < self.window_samples:
+                continue
+
+            pending = np.concatenate(parts)
+            while len(pending) >= self.window_samples:
+                cut, clean = self._find_cut(pending[:self.window_samples])
+                next_start = cut if clean else cut - self.overlap_samples
+                keep_until = cut if clean else cut - self.overlap_samples // 2
+
+                window_segments = self._transcribe_window(pending[:cut], offset, overlapped, keep_until)
+                self._append_stitched(segments, window_segments, overlapped)
+
+                pending = pending[next_start:]
+                offset += next_start
+                overlapped = not clean
+                self._report_progress(offset + (cut - next_start), total_duration)
+
+            parts = [pending]
+            pending_samples = len(pending)
+
+        pending = np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+        if len(pending) >= self.sample_rate // 10:
+            window_segments = self._transcribe_window(pending, offset, overlapped, len(pending))
+            self._append_stitched(segments, window_segments, overlapped)
+        self._report_progress(offset + len(pending), total_duration)
+
+        return segments
+
+    def _transcribe_window(
+        self,
+        window: np.ndarray,
+        offset: int,
+        overlapped: bool,
+        keep_until: int
+    ) -> List[TranscriptSegment]:
+        keep_from = self.overlap_samples // 2 if overlapped else 0
+        offset_seconds = offset / self.sample_rate
+        kept = []
+        for segment in self.transcriber.transcribe_segments(window, language=self.language):
+            start_sample = segment.start * self.sample_rate
+            if start_sample < keep_from or start_sample >= keep_until:
+                continue
+            kept.append(TranscriptSegment(
+                segment.start + offset_seconds,
+                segment.end + offset_seconds,
+                segment.text
+            ))
+        return kept
+
+    def _find_cut(self, window: np.ndarray) -> Tuple[int, bool]:
+        if not self.split_on_silence:
+            return len(window), False
+
+        search = window[-self.silence_search_samples:]
+        num_frames = len(search) // self.frame_samples
+        if num_frames == 0:
+            return len(window), False
+
+        frames = search[len(search) - num_frames * self.frame_samples:].reshape(num_frames, self.frame_samples)
+        energy = np.sqrt(np.mean(frames * frames, axis=1))
+        quietest = int(np.argmin(energy))
+        if energy[quietest] >= self.silence_threshold:
+            return len(window), False
+
+        frame_center = quietest * self.frame_samples + self.frame_samples // 2
+        return len(window) - num_frames * self.frame_samples + frame_center, True
+
+    def _report_progress(self, processed_samples: int, total_duration: Optional[float]):
+        if self.progress_callback is not None:
+            self.progress_callback(processed_samples / self.sample_rate, total_duration)
+
+    @staticmethod
+    def _append_stitched(segments: List[TranscriptSegment], new_segments: List[TranscriptSegment], overlapped: bool):
+        if overlapped and segments and new_segments:
+            first = new_segments[0]
+            text = stitch_text(segments[-1].text, first.text)
+            if text:
+                new_segments[0] = TranscriptSegment(first.start, first.end, text)
+            else:
+                new_segments = new_segments[1:]
+        segments.extend(new_segments)
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r'[^\w]', '', word.lower())
+
+
+def stitch_text(previous_text: str, next_text: str, max_overlap_words: int = 12) -> str:
+    previous_words = [_normalize_word(word) for word in previous_text.split()]
+    next_words = next_text.split()
+    normalized_next = [_normalize_word(word) for word in next_words]
+
+    limit = min(max_overlap_words, len(previous_words), len(next_words))
+    for count in range(limit, 0, -1):
+        if previous_words[-count:] == normalized_next[:count]:
+            return " ".join(next_words[count:])
+    return next_text
@@ -3,13 +3,16 @@ import sys
 from typing import Optional
 from pathlib import Path
 
+from src import metrics
+
 
 class ClipboardManager:
     @staticmethod
     def copy_to_clipboard(text: str) -> bool:
         # noinspection PyBroadException
         try:
-            pyperclip.copy(text)
+            with metrics.stage('clipboard'):
+                pyperclip.copy(text)
             return True
         except Exception:
             return False
@@ -0,0 +1,230 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.resampler import resample
+from src.voice_activity import EnergyVAD
+
+
+class UtteranceResult(NamedTuple):
+    index: int
+    text: str
+    audio_seconds: float
+    transcribe_seconds: float
+    latency_seconds: float
+
+
+class EndpointDetector:
+    def __init__(
+        self,
+        sample_rate: int,
+        min_silence_ms: int = 700,
+        min_speech_ms: int = 250,
+        max_utterance_seconds: float = 30.0,
+        pre_roll_ms: int = 300,
+        post_roll_ms: int = 300,
+        vad: Optional[EnergyVAD] = None
+    ):
+        self.sample_rate = sample_rate
+        self.vad = vad or EnergyVAD(sample_rate, pre_roll_ms=0, post_roll_ms=0)
+        self.frame_samples = self.vad.frame_samples
+        frame_seconds = self.frame_samples / sample_rate
+        self.min_silence_frames = max(1, int(min_silence_ms / 1000 / frame_seconds))
+        self.min_speech_frames = max(1, int(min_speech_ms / 1000 / frame_seconds))
+        self.post_roll_frames = int(post_roll_ms / 1000 / frame_seconds)
+        self.max_frames = max(1, int(max_utterance_seconds / frame_seconds))
+        self.buffer = np.empty(self.max_frames * self.frame_samples, dtype=np.float32)
+        self.pre_roll: "deque[np.ndarray]" = deque(maxlen=max(1, int(pre_roll_ms / 1000 / frame_seconds)))
+        self.reset()
+
+    def reset(self):
+        self.vad.reset()
+        self.pre_roll.clear()
+        self.remainder = np.zeros(0, dtype=np.float32)
+        self.length = 0
+        self.in_utterance = False
+        self.speech_frames = 0
+        self.silence_frames = 0
+
+    def feed(self, samples: np.ndarray) -> List[Tuple[np.ndarray, float]]:
+        if samples.dtype.kind == 'i':
+            samples = samples.astype(np.float32) / 32768.0
+        if len(self.remainder):
+            samples = np.concatenate((self.remainder, samples))
+
+        num_frames = len(samples) // self.frame_samples
+        self.remainder = samples[num_frames * self.frame_samples:]
+        frames = samples[:num_frames * self.frame_samples].reshape(num_frames, self.frame_samples)
+
+        utterances = []
+        for frame, level in zip(frames, self.vad.frame_levels(frames)):
+            if self.vad.classify(level):
+                if not self.in_utterance:
+                    self.in_utterance = True
+                    for pre_frame in self.pre_roll:
+                        self._append(pre_frame)
+                    self.pre_roll.clear()
+                self._append(frame)
+                self.speech_frames += 1
+                self.silence_frames = 0
+            elif self.in_utterance:
+                self._append(frame)
+                self.silence_frames += 1
+                if self.silence_frames >= self.min_silence_frames:
+                    utterance = self._cut()
+                    if utterance is not None:
+                        utterances.append(utterance)
+            else:
+                self.pre_roll.append(frame)
+
+            if self.in_utterance and self.length >= len(self.buffer):
+                utterance = self._cut()
+                if utterance is not None:
+                    utterances.append(utterance)
+        return utterances
+
+    def flush(self) -> Optional[Tuple[np.ndarray, float]]:
+        self.remainder = np.zeros(0, dtype=np.float32)
+        return self._cut() if self.in_utterance else None
+
+    def _append(self, frame: np.ndarray):
+        self.buffer[self.length:self.length + len(frame)] = frame
+        self.length += len(frame)
+
+    def _cut(self) -> Optional[Tuple[np.ndarray, float]]:
+        trailing_frames = max(0, self.silence_frames - self.post_roll_frames)
+        end = self.length - trailing_frames * self.frame_samples
+        utterance = None
+        if self.speech_frames >= self.min_speech_frames:
+            utterance = (self.buffer[:end].copy(), trailing_frames * self.frame_samples / self.sample_rate)
+
+        self.length = 0
+        self.in_utterance = False
+        self.speech_frames = 0
+        self.silence_frames = 0
+        return utterance
+
+
+class ContinuousDictation:
+    def __init__(
+        self,
+        transcribe_fn: Callable[[np.ndarray], str],
+        on_result: Callable[[UtteranceResult], None],
+        source_sample_rate: int,
+        target_sample_rate: int = 16000,
+        max_pending: int = 8,
+        workers: int = 1,
+        history_size: int = 100,
+        detector: Optional[EndpointDetector] = None
+    ):
+        self.transcribe_fn = transcribe_fn
+        self.on_result = on_result
+        self.source_sample_rate = source_sample_rate
+        self.target_sample_rate = target_sample_rate
+        self.max_pending = max_pending
+        self.detector = detector or EndpointDetector(source_sample_rate)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="continuous")
+        self.pending: "deque[Future]" = deque()
+        self.history: "deque[UtteranceResult]" = deque(maxlen=history_size)
+        self.condition = threading.Condition()
+        self.is_active = False
+        self.next_index = 0
+        self.dropped_utterances = 0
+        self.delivery_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        with self.condition:
+            if self.is_active:
+                return
+            self.detector.reset()
+            self.is_active = True
+        self.delivery_thread = threading.Thread(target=self._deliver_loop, daemon=True)
+        self.delivery_thread.start()
+
+    def feed(self, in_data: bytes):
+        if not self.is_active:
+            return
+        for audio, trailing_seconds in self.detector.feed(np.frombuffer(in_data, dtype=np.int16)):
+            self._submit(audio, time.time() - trailing_seconds)
+
+    def stop(self, wait: bool = True):
+        utterance = self.detector.flush()
+        if utterance is not None:
+            self._submit(utterance[0], time.time())
+
+        with self.condition:
+            self.is_active = False
+            self.condition.notify_all()
+        if wait and self.delivery_thread is not None:
+            self.delivery_thread.join()
+
+    def cancel(self):
+        with self.condition:
+            self.is_active = False
+            for future in self.pending:
+                future.cancel()
+            self.pending.clear()
+            self.condition.notify_all()
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False)
+
+    def latency_summary(self) -> Dict[str, float]:
+        latencies = sorted(result.latency_seconds for result in self.history)
+        if not latencies:
+            return {'count': 0}
+        return {
+            'count': len(latencies),
+            'mean': sum(latencies) / len(latencies),
+            'p50': latencies[len(latencies) // 2],
+            'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            'max': latencies[-1]
+        }
+
+    def _submit(self, audio: np.ndarray, speech_end: float):
+        with self.condition:
+            if len(self.pending) >= self.max_pending:
+                self.dropped_utterances += 1
+                print(f"Transcription backlog full, dropped a {len(audio) / self.source_sample_rate:.1f}s utterance")
+                return
+            index = self.next_index
+            self.next_index += 1
+            self.pending.append(self.executor.submit(self._transcribe, index, audio, speech_end))
+            self.condition.notify_all()
+
+    def _transcribe(self, index: int, audio: np.ndarray, speech_end: float) -> Tuple[int, str, float, float, float]:
+        audio = resample(audio, self.source_sample_rate, self.target_sample_rate)
+        start_time = time.perf_counter()
+        text = self.transcribe_fn(audio)
+        return index, text, len(audio) / self.target_sample_rate, time.perf_counter() - start_time, speech_end
+
+    def _deliver_loop(self):
+        while True:
+            with self.condition:
+                while not self.pending and self.is_active:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                future = self.pending[0]
+
+            # noinspection PyBroadException
+            try:
+                index, text, audio_seconds, transcribe_seconds, speech_end = future.result()
+            except Exception as e:
+                if not future.cancelled():
+                    print(f"Continuous dictation transcription error: {e}")
+                text = None
+
+            with self.condition:
+                if self.pending and self.pending[0] is future:
+                    self.pending.popleft()
+
+            if text:
+                result = UtteranceResult(index, text, audio_seconds, transcribe_seconds, time.time() - speech_end)
+                self.history.append(result)
+                self.on_result(result)
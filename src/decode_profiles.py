@@ -0,0 +1,82 @@
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_PROFILE = "accurate"
+JOB_TYPES = ('dictation', 'file', 'youtube', 'batch')
+
+DECODE_PROFILES: Dict[str, Dict[str, Any]] = {
+    'fast': dict(
+        beam_size=1,
+        best_of=1,
+        temperature=0.0,
+        without_timestamps=True,
+        condition_on_previous_text=False,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500)
+    ),
+    'accurate': dict(
+        beam_size=5,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500)
+    ),
+    'archival': dict(
+        beam_size=5,
+        best_of=5,
+        patience=2.0,
+        temperature=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        compression_ratio_threshold=2.4,
+        log_prob_threshold=-1.0,
+        no_speech_threshold=0.6,
+        condition_on_previous_text=True,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500)
+    )
+}
+
+
+class DecodeProfiles:
+    def __init__(
+        self,
+        job_profiles: Optional[Dict[str, str]] = None,
+        profiles: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        self.profiles = copy.deepcopy(DECODE_PROFILES)
+        for name, options in (profiles or {}).items():
+            options = dict(options)
+            base = options.pop('base', name if name in self.profiles else DEFAULT_PROFILE)
+            if base not in self.profiles:
+                raise ValueError(f"Unknown base profile '{base}' for profile '{name}'")
+            self.profiles[name] = dict(copy.deepcopy(self.profiles[base]), **options)
+
+        self.job_profiles = {job: DEFAULT_PROFILE for job in JOB_TYPES}
+        self.update_jobs(job_profiles or {})
+
+    @classmethod
+    def from_file(cls, path: Path) -> "DecodeProfiles":
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        return cls(job_profiles=config.get('jobs'), profiles=config.get('profiles'))
+
+    def update_jobs(self, job_profiles: Dict[str, Optional[str]]):
+        for job, profile in job_profiles.items():
+            if not profile:
+                continue
+            if job not in JOB_TYPES:
+                raise ValueError(f"Unknown job type '{job}', expected one of: {', '.join(JOB_TYPES)}")
+            if profile not in self.profiles:
+                raise ValueError(f"Unknown decode profile '{profile}', expected one of: {', '.join(self.profiles)}")
+            self.job_profiles[job] = profile
+
+    def profile_for(self, job: str) -> str:
+        return self.job_profiles.get(job, DEFAULT_PROFILE)
+
+    def options(self, profile: str, timestamps: bool = False) -> Dict[str, Any]:
+        options = copy.deepcopy(self.profiles[profile])
+        if timestamps:
+            options.pop('without_timestamps', None)
+        return options
+
+    def options_for(self, job: str, timestamps: bool = False) -> Dict[str, Any]:
+        return self.options(self.profile_for(job), timestamps=timestamps)
@@ -0,0 +1,217 @@
+import subprocess
+import threading
+import time
+import numpy as np
+from typing import Iterable, Iterator, List, Optional
+
+
+class _StallWatchdog:
+    def __init__(self, process: subprocess.Popen, timeout: float):
+        self.process = process
+        self.timeout = timeout
+        self.waiting_since: Optional[float] = None
+        self.expired = False
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def waiting(self):
+        self.waiting_since = time.monotonic()
+
+    def idle(self):
+        self.waiting_since = None
+
+    def stop(self):
+        self.done.set()
+
+    def _run(self):
+        while not self.done.wait(min(1.0, self.timeout / 4)):
+            since = self.waiting_since
+            if since is not None and time.monotonic() - since > self.timeout:
+                self.expired = True
+                self.process.kill()
+                return
+
+
+class FFmpegDecoder:
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        chunk_seconds: float = 10.0,
+        ffmpeg_path: str = 'ffmpeg',
+        ffprobe_path: str = 'ffprobe',
+        stall_timeout: float = 60.0
+    ):
+        self.sample_rate = sample_rate
+        self.chunk_samples = int(chunk_seconds * sample_rate)
+        self.ffmpeg_path = ffmpeg_path
+        self.ffprobe_path = ffprobe_path
+        self.stall_timeout = stall_timeout
+        self.processes: List[subprocess.Popen] = []
+        self.lock = threading.Lock()
+
+    def probe_duration(self, source: str) -> Optional[float]:
+        # noinspection PyBroadException
+        try:
+            result = subprocess.run([
+                self.ffprobe_path,
+                '-v', 'error',
+                '-show_entries', 'format=duration',
+                '-of', 'default=noprint_wrappers=1:nokey=1',
+                source
+            ], capture_output=True, text=True, timeout=30)
+            return float(result.stdout.strip())
+        except Exception:
+            return None
+
+    def decode(
+        self,
+        source: str,
+        duration: Optional[float] = None,
+        input_options: Optional[List[str]] = None,
+        feed: Optional[Iterable[bytes]] = None
+    ) -> np.ndarray:
+        duration = duration or self.probe_duration(source)
+        capacity = int(duration * self.sample_rate) + self.sample_rate if duration else 60 * self.sample_rate
+        audio = np.empty(capacity, dtype=np.float32)
+        length = 0
+
+        for pcm in self._iter_pcm16(source, self.chunk_samples, input_options, feed):
+            if length + len(pcm) > len(audio):
+                grown = np.empty(max(2 * len(audio), length + len(pcm)), dtype=np.float32)
+                grown[:length] = audio[:length]
+                audio = grown
+            np.multiply(pcm, np.float32(1.0 / 32768.0), out=audio[length:length + len(pcm)], casting='unsafe')
+            length += len(pcm)
+
+        return audio[:length]
+
+    def iter_chunks(
+        self,
+        source: str,
+        chunk_seconds: Optional[float] = None,
+        input_options: Optional[List[str]] = None,
+        feed: Optional[Iterable[bytes]] = None
+    ) -> Iterator[np.ndarray]:
+        chunk_samples = int(chunk_seconds * self.sample_rate) if chunk_seconds else self.chunk_samples
+        for pcm in self._iter_pcm16(source, chunk_samples, input_options, feed):
+            yield pcm.astype(np.float32) / 32768.0
+
+    def terminate_all(self):
+        with self.lock:
+            processes = list(self.processes)
+        for process in processes:
+            # noinspection PyBroadException
+            try:
+                process.kill()
+            except Exception:
+                pass
+
+    def _iter_pcm16(
+        self,
+        source: str,
+        chunk_samples: int,
+        input_options: Optional[List[str]] = None,
+        feed: Optional[Iterable[bytes]] = None
+    ) -> Iterator[np.ndarray]:
+        if feed is not None:
+            source = 'pipe:0'
+        process = subprocess.Popen([
+            self.ffmpeg_path,
+            '-nostdin',
+            '-loglevel', 'error',
+            *(input_options or []),
+            '-i', source,
+            '-vn',
+            '-ac', '1',
+            '-ar', str(self.sample_rate),
+            '-f', 's16le',
+            '-acodec', 'pcm_s16le',
+            'pipe:1'
+        ], stdin=subprocess.PIPE if feed is not None else None, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        errors: List[bytes] = []
+        stderr_thread = threading.Thread(target=lambda: errors.append(process.stderr.read()), daemon=True)
+        stderr_thread.start()
+
+        feed_errors: List[BaseException] = []
+        feed_thread = None
+        if feed is not None:
+            feed_thread = threading.Thread(target=self._write_feed, args=(process, feed, feed_errors), daemon=True)
+            feed_thread.start()
+
+        with self.lock:
+            self.processes.append(process)
+
+        # Time spent waiting on FFmpeg is bounded, but time the consumer holds a chunk is not, so slow
+        # transcription of a long stream is never mistaken for a hung process.
+        watchdog = _StallWatchdog(process, self.stall_timeout)
+        scratch = np.empty(chunk_samples, dtype=np.int16)
+        scratch_bytes = memoryview(scratch).cast('B')
+        finished = False
+        try:
+            while True:
+                filled = self._read_into(process.stdout, scratch_bytes, watchdog)
+                if watchdog.expired:
+                    raise RuntimeError(f"FFmpeg stalled: no output for {self.stall_timeout:.0f}s")
+                if filled // 2:
+                    yield scratch[:filled // 2]
+                if filled < len(scratch_bytes):
+                    break
+
+            try:
+                process.wait(timeout=self.stall_timeout)
+            except subprocess.TimeoutExpired:
+                raise RuntimeError(f"FFmpeg did not exit within {self.stall_timeout:.0f}s after its output ended")
+            stderr_thread.join(timeout=self.stall_timeout)
+            finished = True
+            if feed_thread is not None:
+                feed_thread.join(timeout=self.stall_timeout)
+            if feed_errors:
+                raise RuntimeError(f"Input stream failed: {feed_errors[0]}")
+            if process.returncode != 0:
+                message = b''.join(errors).decode(errors='replace').strip()
+                raise RuntimeError(f"FFmpeg error: {message or f'exit code {process.returncode}'}")
+        finally:
+            watchdog.stop()
+            if not finished:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            with self.lock:
+                self.processes.remove(process)
+
+    @staticmethod
+    def _write_feed(process: subprocess.Popen, feed: Iterable[bytes], feed_errors: List[BaseException]):
+        iterator = iter(feed)
+        try:
+            for block in iterator:
+                process.stdin.write(block)
+        except (BrokenPipeError, OSError, ValueError):
+            # FFmpeg exited or was killed; its own exit status explains why.
+            pass
+        except Exception as e:
+            feed_errors.append(e)
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+            # noinspection PyBroadException
+            try:
+                process.stdin.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _read_into(stream, buffer: memoryview, watchdog: Optional[_StallWatchdog] = None) -> int:
+        filled = 0
+        while filled < len(buffer):
+            if watchdog is not None:
+                watchdog.waiting()
+            count = stream.readinto(buffer[filled:])
+            if watchdog is not None:
+                watchdog.idle()
+            if not count:
+                break
+            filled += count
+        return filled
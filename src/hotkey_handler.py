@@ -1,3 +1,4 @@
+import sys
 import threading
 from pynput import keyboard
 from typing import Callable
@@ -8,17 +9,23 @@ class HotkeyHandler:
         self,
         voice_callback: Callable,
         youtube_callback: Callable = None,
-        file_callback: Callable = None
+        file_callback: Callable = None,
+        continuous_callback: Callable = None
     ):
         self.voice_callback = voice_callback
         self.youtube_callback = youtube_callback
         self.file_callback = file_callback
+        self.continuous_callback = continuous_callback
         self.is_recording = False
         self.listener = None
         self.current_keys = set()
         self.voice_hotkey_triggered = False
         self.youtube_hotkey_triggered = False
         self.file_hotkey_triggered = False
+        self.continuous_hotkey_triggered = False
+        self.controller = None
+        self.synthetic_pastes = 0
+        self.paste_count = 0
 
     def start(self):
         self.listener = keyboard.Listener(
@@ -31,11 +38,26 @@ class HotkeyHandler:
         if self.listener:
             self.listener.stop()
 
+    def paste(self):
+        if self.controller is None:
+            self.controller = keyboard.Controller()
+        modifier = keyboard.Key.cmd if sys.platform == 'darwin' else keyboard.Key.ctrl
+        self.synthetic_pastes += 1
+        with self.controller.pressed(modifier):
+            self.controller.press('v')
+            self.controller.release('v')
+
     def _on_press(self, key):
         # noinspection PyBroadException
         try:
             self.current_keys.add(key)
 
+            if self._is_paste_pressed(key):
+                if self.synthetic_pastes > 0:
+                    self.synthetic_pastes -= 1
+                else:
+                    self.paste_count += 1
+
             if self._is_voice_hotkey_pressed() and not self.voice_hotkey_triggered:
                 self.voice_hotkey_triggered = True
                 self.is_recording = not self.is_recording
@@ -50,6 +72,11 @@ class HotkeyHandler:
                 self.file_hotkey_triggered = True
                 if self.file_callback:
                     threading.Thread(target=self.file_callback, daemon=True).start()
+
+            if self._is_continuous_hotkey_pressed() and not self.continuous_hotkey_triggered:
+                self.continuous_hotkey_triggered = True
+                if self.continuous_callback:
+                    threading.Thread(target=self.continuous_callback, daemon=True).start()
         except Exception:
             pass
 
@@ -64,6 +91,8 @@ class HotkeyHandler:
                 self.youtube_hotkey_triggered = False
             if not self._is_file_hotkey_pressed():
                 self.file_hotkey_triggered = False
+            if not self._is_continuous_hotkey_pressed():
+                self.continuous_hotkey_triggered = False
         except Exception:
             pass
 
@@ -99,3 +128,23 @@ class HotkeyHandler:
             for k in self.current_keys
         )
         return has_shift and has_f
+
+    def _is_continuous_hotkey_pressed(self):
+        has_shift = any(
+            k == keyboard.Key.shift or k == keyboard.Key.shift_r
+            for k in self.current_keys
+        )
+        has_c = any(
+            hasattr(k, 'char') and k.char and k.char.lower() == 'c'
+            for k in self.current_keys
+        )
+        return has_shift and has_c
+
+    def _is_paste_pressed(self, key):
+        modifiers = {
+            keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r,
+            keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r
+        }
+        has_modifier = any(k in modifiers for k in self.current_keys)
+        is_v = hasattr(key, 'char') and key.char and (key.char.lower() == 'v' or key.char == '\x16')
+        return has_modifier and is_v
@@ -0,0 +1,254 @@
+import contextvars
+import itertools
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src import metrics
+from src.transcriber import Transcriber, TranscriptSegment
+
+
+class JobCancelledError(Exception):
+    pass
+
+
+class Job:
+    def __init__(
+        self,
+        fn: Callable[[], Any],
+        priority: int,
+        name: str,
+        on_cancel: Optional[Callable[["Job"], None]] = None,
+        device: Optional[str] = None
+    ):
+        self.fn = fn
+        self.on_cancel = on_cancel
+        self.priority = priority
+        self.name = name
+        self.device = device
+        self.status = "pending"
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.submitted_at = time.time()
+        self.context = contextvars.copy_context()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.done_event = threading.Event()
+        self.lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.status == "cancelled"
+
+    def cancel(self) -> bool:
+        with self.lock:
+            if self.status != "pending":
+                return False
+            self.status = "cancelled"
+            self.finished_at = time.time()
+        if self.on_cancel is not None:
+            self.on_cancel(self)
+        self.done_event.set()
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.done_event.wait(timeout)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        if not self.done_event.wait(timeout):
+            raise TimeoutError(f"Job '{self.name}' did not finish in time")
+        if self.cancelled:
+            raise JobCancelledError(f"Job '{self.name}' was cancelled")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def _start(self) -> bool:
+        with self.lock:
+            if self.status != "pending":
+                return False
+            self.status = "running"
+            self.started_at = time.time()
+            return True
+
+    def _finish(self, value: Any = None, error: Optional[BaseException] = None):
+        self.value = value
+        self.error = error
+        self.status = "failed" if error is not None else "done"
+        self.finished_at = time.time()
+        self.done_event.set()
+
+
+class JobScheduler:
+    PRIORITY_DICTATION = 0
+    PRIORITY_INTERACTIVE = 10
+    PRIORITY_BATCH = 20
+
+    def __init__(self, worker_slots: Union[int, Dict[str, int]] = 1, name: str = "transcription"):
+        if isinstance(worker_slots, int):
+            worker_slots = {'any': worker_slots}
+        self.device_slots = {device: max(1, slots) for device, slots in worker_slots.items()}
+        self.default_device = next(iter(self.device_slots))
+        self.worker_slots = sum(self.device_slots.values())
+        self.name = name
+        # Each device has its own queue and workers, so CPU jobs run alongside GPU jobs within their own limit.
+        self.queues: Dict[str, "queue.PriorityQueue"] = {device: queue.PriorityQueue() for device in self.device_slots}
+        self.sequence = itertools.count()
+        self.lock = threading.Lock()
+        self.pending: Dict[int, int] = {}
+        self.running = 0
+        self.running_by_device: Dict[str, int] = {device: 0 for device in self.device_slots}
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.max_queue_depth = 0
+        self.jobs: List[Job] = []
+        self.workers: List[Tuple[str, threading.Thread]] = []
+        for device, slots in self.device_slots.items():
+            for index in range(slots):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    args=(self.queues[device],),
+                    name=f"{name}-{device}-worker-{index}",
+                    daemon=True
+                )
+                worker.start()
+                self.workers.append((device, worker))
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        priority: int = PRIORITY_BATCH,
+        name: str = "job",
+        device: Optional[str] = None
+    ) -> Job:
+        if device not in self.queues:
+            device = self.default_device
+        job = Job(fn, priority, name, on_cancel=self._mark_cancelled, device=device)
+        with self.lock:
+            self.submitted += 1
+            self.pending[priority] = self.pending.get(priority, 0) + 1
+            self.jobs.append(job)
+            self.max_queue_depth = max(self.max_queue_depth, self._queue_depth())
+        self.queues[device].put((priority, next(self.sequence), job))
+        return job
+
+    def run(
+        self,
+        fn: Callable[[], Any],
+        priority: int = PRIORITY_BATCH,
+        name: str = "job",
+        device: Optional[str] = None
+    ) -> Any:
+        return self.submit(fn, priority=priority, name=name, device=device).result()
+
+    def cancel_all(self, min_priority: int = PRIORITY_BATCH) -> int:
+        with self.lock:
+            jobs = [job for job in self.jobs if job.priority >= min_priority]
+        return sum(1 for job in jobs if job.cancel())
+
+    def queue_depth(self) -> int:
+        with self.lock:
+            return self._queue_depth()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'worker_slots': self.worker_slots,
+                'device_slots': dict(self.device_slots),
+                'queue_depth': self._queue_depth(),
+                'queue_depth_by_priority': {priority: count for priority, count in self.pending.items() if count},
+                'running': self.running,
+                'running_by_device': dict(self.running_by_device),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'cancelled': self.cancelled,
+                'max_queue_depth': self.max_queue_depth
+            }
+
+    def shutdown(self, wait: bool = False):
+        self.cancel_all(min_priority=-1)
+        for device, _ in self.workers:
+            self.queues[device].put((float('inf'), next(self.sequence), None))
+        if wait:
+            for _, worker in self.workers:
+                worker.join()
+
+    def _queue_depth(self) -> int:
+        return sum(self.pending.values())
+
+    def _mark_cancelled(self, job: Job):
+        with self.lock:
+            self.pending[job.priority] -= 1
+            self.cancelled += 1
+            if job in self.jobs:
+                self.jobs.remove(job)
+
+    def _worker_loop(self, jobs: "queue.PriorityQueue"):
+        while True:
+            _, _, job = jobs.get()
+            if job is None:
+                return
+            if not job._start():
+                continue
+
+            with self.lock:
+                self.pending[job.priority] -= 1
+                self.running += 1
+                self.running_by_device[job.device] += 1
+                self.jobs.remove(job)
+
+            value, error = None, None
+            try:
+                value = job.context.run(self._run_job, job)
+            except BaseException as e:
+                error = e
+
+            with self.lock:
+                self.running -= 1
+                self.running_by_device[job.device] -= 1
+                if error is None:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+            job._finish(value, error)
+
+    @staticmethod
+    def _run_job(job: Job) -> Any:
+        metrics.record_stage('queue', job.started_at - job.submitted_at)
+        return job.fn()
+
+
+class ScheduledTranscriber:
+    def __init__(self, transcriber: Transcriber, scheduler: JobScheduler, priority: int, name: str = "transcription"):
+        self.transcriber = transcriber
+        self.scheduler = scheduler
+        self.priority = priority
+        self.name = name
+        self.is_cancelled = False
+        self.current_job: Optional[Job] = None
+
+    def transcribe_segments(self, audio_data: np.ndarray, language: Optional[str] = None) -> List[TranscriptSegment]:
+        if self.is_cancelled:
+            raise JobCancelledError(f"Job '{self.name}' was cancelled")
+        self.current_job = self.scheduler.submit(
+            lambda: self.transcriber.transcribe_segments(audio_data, language=language),
+            priority=self.priority,
+            name=self.name,
+            device=getattr(self.transcriber, 'preferred_device', None)
+        )
+        return self.current_job.result()
+
+    def transcribe(self, audio_data: np.ndarray, language: Optional[str] = None) -> str:
+        segments = self.transcribe_segments(audio_data, language=language)
+        return " ".join(segment.text for segment in segments).strip()
+
+    def cancel(self):
+        self.is_cancelled = True
+        if self.current_job is not None:
+            self.current_job.cancel()
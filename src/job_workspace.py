@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Set
+
+OWNER_FILE = '.owner'
+MEMORY_ROOT = Path('/dev/shm')
+
+
+def default_root(use_tmpfs: bool = False) -> Path:
+    if use_tmpfs and MEMORY_ROOT.is_dir() and os.access(MEMORY_ROOT, os.W_OK):
+        return MEMORY_ROOT / 'voicepaste-jobs'
+    return Path(tempfile.gettempdir()) / 'voicepaste-jobs'
+
+
+def process_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+
+    if sys.platform == 'win32':
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobWorkspace:
+    def __init__(self, root: Path, name: str = "job", on_close=None):
+        root.mkdir(parents=True, exist_ok=True)
+        self.path = Path(tempfile.mkdtemp(prefix=f"{name}-", dir=root))
+        self.on_close = on_close
+        self.closed = False
+        (self.path / OWNER_FILE).write_text(
+            json.dumps({'pid': os.getpid(), 'created': time.time()}),
+            encoding='utf-8'
+        )
+
+    def file(self, name: str) -> Path:
+        return self.path / name
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        shutil.rmtree(self.path, ignore_errors=True)
+        if self.on_close is not None:
+            self.on_close(self)
+
+    def __enter__(self) -> "JobWorkspace":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class WorkspaceManager:
+    def __init__(self, root: Optional[Path] = None, use_tmpfs: bool = False, max_age_seconds: float = 24 * 3600):
+        self.root = Path(root) if root is not None else default_root(use_tmpfs)
+        self.max_age_seconds = max_age_seconds
+        self.active: Set[JobWorkspace] = set()
+        self.lock = threading.Lock()
+
+    def create(self, name: str = "job") -> JobWorkspace:
+        workspace = JobWorkspace(self.root, name, on_close=self._forget)
+        with self.lock:
+            self.active.add(workspace)
+        return workspace
+
+    def cleanup_stale(self) -> int:
+        if not self.root.is_dir():
+            return 0
+
+        removed = 0
+        now = time.time()
+        for path in self.root.iterdir():
+            if not path.is_dir():
+                continue
+            # noinspection PyBroadException
+            try:
+                owner = json.loads((path / OWNER_FILE).read_text(encoding='utf-8'))
+                pid, created = int(owner['pid']), float(owner['created'])
+            except Exception:
+                pid, created = None, path.stat().st_mtime
+
+            if pid == os.getpid():
+                continue
+            if pid is None:
+                # The owner file may not be written yet by a job that is just starting.
+                stale = now - created > 60
+            else:
+                # A workspace survives only while its owner runs; the age limit guards against reused PIDs.
+                stale = not process_alive(pid) or now - created >= self.max_age_seconds
+            if not stale:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        return removed
+
+    def close_all(self):
+        with self.lock:
+            workspaces = list(self.active)
+        for workspace in workspaces:
+            workspace.close()
+
+    def _forget(self, workspace: JobWorkspace):
+        with self.lock:
+            self.active.discard(workspace)
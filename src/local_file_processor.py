@@ -1,10 +1,9 @@
-import tempfile
 import numpy as np
 from pathlib import Path
-from scipy.io import wavfile
-from scipy.signal import resample
-import subprocess
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
+
+from src.ffmpeg_decoder import FFmpegDecoder
+from src.resampler import resample
 
 
 class LocalFileProcessor:
@@ -12,7 +11,7 @@ class LocalFileProcessor:
     SUPPORTED_VIDEO = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
 
     def __init__(self):
-        self.temp_dir = Path(tempfile.gettempdir())
+        self.decoder = FFmpegDecoder(sample_rate=16000)
 
     def is_valid_file_path(self, path: str) -> bool:
         if not path or not isinstance(path, str):
@@ -35,15 +34,6 @@ class LocalFileProcessor:
             return None
 
         file_path = Path(file_path_str)
-        temp_wav_path = self.temp_dir / 'voicepaste_local_audio.wav'
-
-        # noinspection PyBroadException
-        try:
-            if temp_wav_path.exists():
-                temp_wav_path.unlink()
-        except Exception:
-            pass
-
         ext = file_path.suffix.lower()
         filename = file_path.name
 
@@ -52,27 +42,11 @@ class LocalFileProcessor:
 
             if ext in self.SUPPORTED_VIDEO or ext not in {'.wav'}:
                 print("Extracting audio with FFmpeg...")
-                result = subprocess.run([
-                    'ffmpeg',
-                    '-i', str(file_path),
-                    '-vn',
-                    '-acodec', 'pcm_s16le',
-                    '-ar', '16000',
-                    '-ac', '1',
-                    '-y',
-                    str(temp_wav_path)
-                ], capture_output=True, text=True, timeout=300)
-
-                if result.returncode != 0:
-                    print(f"FFmpeg error: {result.stderr}")
-                    return None
-
-                if not temp_wav_path.exists():
-                    print(f"Audio extraction failed: {temp_wav_path} not created")
-                    return None
-
-                sample_rate, audio = wavfile.read(str(temp_wav_path))
+                audio = self.decoder.decode(str(file_path))
+                sample_rate = self.decoder.sample_rate
             else:
+                from scipy.io import wavfile
+
                 print("Loading WAV file...")
                 sample_rate, audio = wavfile.read(str(file_path))
 
@@ -86,39 +60,25 @@ class LocalFileProcessor:
 
             if sample_rate != 16000:
                 print(f"Resampling from {sample_rate}Hz to 16000Hz...")
-                num_samples = int(len(audio) * 16000 / sample_rate)
-                audio = resample(audio, num_samples)
+                audio = resample(audio, sample_rate, 16000)
                 sample_rate = 16000
 
-            # noinspection PyBroadException
-            try:
-                if temp_wav_path.exists() and file_path != temp_wav_path:
-                    temp_wav_path.unlink()
-            except Exception:
-                pass
-
             duration = len(audio) / sample_rate
             print(f"Audio loaded: {duration:.1f}s @ {sample_rate}Hz")
-            return audio.astype(np.float32), filename
+            return audio.astype(np.float32, copy=False), filename
 
-        except subprocess.TimeoutExpired:
-            print("FFmpeg timeout - file too large or processing error")
-            return None
         except Exception as e:
             print(f"Error processing file: {e}")
-            # noinspection PyBroadException
-            try:
-                if temp_wav_path.exists():
-                    temp_wav_path.unlink()
-            except Exception:
-                pass
             return None
 
+    def get_duration(self, file_path: str) -> Optional[float]:
+        return self.decoder.probe_duration(file_path.strip().strip('"').strip("'"))
+
+    def iter_chunks(self, file_path: str, chunk_seconds: float = 10.0) -> Iterator[np.ndarray]:
+        file_path_str = file_path.strip().strip('"').strip("'")
+        if not self.is_valid_file_path(file_path_str):
+            raise ValueError(f"Invalid or unsupported file: {file_path_str}")
+        return self.decoder.iter_chunks(file_path_str, chunk_seconds)
+
     def cleanup(self):
-        temp_wav_path = self.temp_dir / 'voicepaste_local_audio.wav'
-        # noinspection PyBroadException
-        try:
-            if temp_wav_path.exists():
-                temp_wav_path.unlink()
-        except Exception:
-            pass
+        self.decoder.terminate_all()
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class MemoryCache:
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 3600
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.entries: "OrderedDict[str, Tuple[str, float, int]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, _, _ = entry
+            if self._expire_if_stale(key, entry):
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: str):
+        size = len(key) + len(value.encode('utf-8'))
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+
+            self.entries[key] = (value, time.time(), size)
+            self.total_bytes += size
+
+            while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                oldest_key = next(iter(self.entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+    def __len__(self) -> int:
+        with self.lock:
+            for key, entry in list(self.entries.items()):
+                self._expire_if_stale(key, entry)
+            return len(self.entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and not self._expire_if_stale(key, entry)
+
+    def _expire_if_stale(self, key: str, entry: Tuple[str, float, int]) -> bool:
+        if self.ttl_seconds is None or time.time() - entry[1] < self.ttl_seconds:
+            return False
+        self._remove(key)
+        self.expirations += 1
+        return True
+
+    def _remove(self, key: str):
+        _, _, size = self.entries.pop(key)
+        self.total_bytes -= size
@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from src.persistent_cache import PersistentCache, default_cache_dir
+
+
+class VideoMetadata(NamedTuple):
+    video_id: str
+    title: str
+    duration: Optional[float] = None
+    live_status: Optional[str] = None
+
+    @property
+    def is_live(self) -> bool:
+        return self.live_status in ('is_live', 'is_upcoming')
+
+
+class VideoMetadataCache:
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 30 * 24 * 3600
+    ):
+        self.store = PersistentCache(
+            db_path or default_cache_dir() / 'youtube_metadata.db',
+            max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds
+        )
+
+    def get(self, video_id: str) -> Optional[VideoMetadata]:
+        value = self.store.get(video_id)
+        if value is None:
+            return None
+
+        try:
+            return VideoMetadata(**json.loads(value))
+        except (ValueError, TypeError):
+            self.store.delete(video_id)
+            return None
+
+    def put(self, metadata: VideoMetadata):
+        # Live and upcoming streams change duration and status, so only finished videos are kept.
+        if not metadata.is_live:
+            self.store.put(metadata.video_id, json.dumps(metadata._asdict()))
+
+    def close(self):
+        self.store.close()
@@ -0,0 +1,192 @@
+import contextvars
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+_current_job: "contextvars.ContextVar[Optional[JobMetrics]]" = contextvars.ContextVar('job_metrics', default=None)
+
+
+class JobMetrics:
+    def __init__(self, job: str):
+        self.job = job
+        self.started = time.time()
+        self.start_time = time.perf_counter()
+        self.total_seconds: Optional[float] = None
+        self.stages: Dict[str, float] = {}
+        self.audio_seconds: Optional[float] = None
+        self.model: Optional[str] = None
+        self.device: Optional[str] = None
+        self.cache_hit: Optional[bool] = None
+        self.status = "running"
+        self.lock = threading.Lock()
+
+    def add_stage(self, name: str, seconds: float):
+        with self.lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    @property
+    def rtf(self) -> Optional[float]:
+        if not self.audio_seconds or 'decode' not in self.stages:
+            return None
+        return self.stages['decode'] / self.audio_seconds
+
+    def finish(self, status: str = "done"):
+        self.total_seconds = time.perf_counter() - self.start_time
+        if self.status == "running":
+            self.status = status
+
+    def describe(self) -> str:
+        with self.lock:
+            stages = sorted(self.stages.items(), key=lambda item: item[1], reverse=True)
+        text = f"{self.job} took {self.total_seconds:.2f}s"
+        if stages:
+            text += " (" + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in stages) + ")"
+        if self.rtf is not None:
+            text += f", RTF {self.rtf:.2f}"
+        return text
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self.lock:
+            stages = {name: round(seconds, 4) for name, seconds in self.stages.items()}
+        rtf = self.rtf
+        return {
+            'job': self.job,
+            'started': self.started,
+            'status': self.status,
+            'total_seconds': round(self.total_seconds, 4) if self.total_seconds is not None else None,
+            'stages': stages,
+            'audio_seconds': round(self.audio_seconds, 3) if self.audio_seconds is not None else None,
+            'rtf': round(rtf, 4) if rtf is not None else None,
+            'model': self.model,
+            'device': self.device,
+            'cache_hit': self.cache_hit
+        }
+
+
+def current_job() -> Optional[JobMetrics]:
+    return _current_job.get()
+
+
+def record_stage(name: str, seconds: float):
+    job = _current_job.get()
+    if job is not None:
+        job.add_stage(name, seconds)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - start_time)
+
+
+def timed_iter(name: str, iterable: Iterable) -> Iterator:
+    iterator = iter(iterable)
+    while True:
+        start_time = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            record_stage(name, time.perf_counter() - start_time)
+            return
+        record_stage(name, time.perf_counter() - start_time)
+        yield item
+
+
+def annotate(**fields):
+    job = _current_job.get()
+    if job is not None:
+        for key, value in fields.items():
+            setattr(job, key, value)
+
+
+class MetricsRecorder:
+    def __init__(self, log_path: Optional[Path] = None, history_size: int = 200):
+        self.log_path = Path(log_path) if log_path is not None else None
+        self.history: "deque[JobMetrics]" = deque(maxlen=history_size)
+        self.lock = threading.Lock()
+        self.log_file = None
+        if self.log_path is not None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self.log_file = open(self.log_path, 'a', encoding='utf-8')
+
+    @contextmanager
+    def job(self, name: str) -> Iterator[JobMetrics]:
+        metrics = JobMetrics(name)
+        token = _current_job.set(metrics)
+        status = "done"
+        try:
+            yield metrics
+        except BaseException:
+            status = "failed"
+            raise
+        finally:
+            _current_job.reset(token)
+            metrics.finish(status)
+            self.record(metrics)
+
+    def record(self, metrics: JobMetrics):
+        if metrics.status == "done":
+            print(f"Timing: {metrics.describe()}")
+        with self.lock:
+            self.history.append(metrics)
+            if self.log_file is not None:
+                self.log_file.write(json.dumps(metrics.to_dict()) + "\n")
+                self.log_file.flush()
+
+    def recent(self, job: Optional[str] = None) -> List[JobMetrics]:
+        with self.lock:
+            return [metrics for metrics in self.history if job is None or metrics.job == job]
+
+    def summary(self, job: Optional[str] = None) -> Dict[str, Any]:
+        jobs = [metrics for metrics in self.recent(job) if metrics.status == "done"]
+        if not jobs:
+            return {'count': 0}
+
+        stages: Dict[str, float] = {}
+        for metrics in jobs:
+            for name, seconds in metrics.stages.items():
+                stages[name] = stages.get(name, 0.0) + seconds
+        rtfs = [metrics.rtf for metrics in jobs if metrics.rtf is not None]
+        lookups = [metrics.cache_hit for metrics in jobs if metrics.cache_hit is not None]
+        return {
+            'count': len(jobs),
+            'mean_seconds': sum(metrics.total_seconds for metrics in jobs) / len(jobs),
+            'mean_stage_seconds': {name: seconds / len(jobs) for name, seconds in stages.items()},
+            'mean_rtf': sum(rtfs) / len(rtfs) if rtfs else None,
+            'cache_hits': sum(lookups),
+            'cache_lookups': len(lookups)
+        }
+
+    def summary_text(self) -> str:
+        recent = self.recent()
+        if not recent:
+            return "No jobs yet"
+
+        job = recent[-1].job
+        summary = self.summary(job)
+        if not summary['count']:
+            return f"{job}: failed"
+
+        text = f"{job} avg {summary['mean_seconds']:.2f}s"
+        stages = {name: seconds for name, seconds in summary['mean_stage_seconds'].items() if name != 'capture'}
+        if stages:
+            slowest = max(stages, key=stages.get)
+            text += f" ({slowest} {stages[slowest]:.2f}s)"
+        if summary['mean_rtf'] is not None:
+            text += f", RTF {summary['mean_rtf']:.2f}"
+        if summary['cache_lookups']:
+            text += f", cache {summary['cache_hits']}/{summary['cache_lookups']}"
+        return text
+
+    def close(self):
+        with self.lock:
+            if self.log_file is not None:
+                self.log_file.close()
+                self.log_file = None
@@ -0,0 +1,202 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.transcriber import Transcriber, TranscriptSegment
+
+MODEL_MEMORY_MB = {
+    'tiny': 80,
+    'base': 150,
+    'small': 500,
+    'medium': 1550,
+    'turbo': 1650,
+    'large-v3-turbo': 1650,
+    'distil-large-v3': 1550,
+    'large': 3100,
+    'large-v1': 3100,
+    'large-v2': 3100,
+    'large-v3': 3100
+}
+
+
+def estimate_model_memory_mb(model_size: str) -> int:
+    return MODEL_MEMORY_MB.get(model_size.replace('.en', ''), MODEL_MEMORY_MB['large-v3'])
+
+
+class ModelRouter:
+    SOURCES = ('mic', 'file', 'youtube')
+
+    def __init__(
+        self,
+        default_model: str = "turbo",
+        short_model: Optional[str] = None,
+        short_max_seconds: float = 20.0,
+        long_model: Optional[str] = None,
+        long_min_seconds: float = 1800.0,
+        source_models: Optional[Dict[str, str]] = None,
+        override: Optional[str] = None
+    ):
+        self.default_model = default_model
+        self.short_model = short_model
+        self.short_max_seconds = short_max_seconds
+        self.long_model = long_model
+        self.long_min_seconds = long_min_seconds
+        self.source_models = dict(source_models or {})
+        self.override = override
+
+    def route(self, source: str, duration: Optional[float] = None, override: Optional[str] = None) -> str:
+        if override or self.override:
+            return override or self.override
+        if duration is not None:
+            if self.short_model and duration <= self.short_max_seconds:
+                return self.short_model
+            if self.long_model and duration >= self.long_min_seconds:
+                return self.long_model
+        return self.source_models.get(source, self.default_model)
+
+
+class ModelPool:
+    def __init__(
+        self,
+        transcriber_factory: Callable[[str], Transcriber],
+        memory_budget_mb: Optional[int] = None
+    ):
+        self.transcriber_factory = transcriber_factory
+        self.memory_budget_mb = memory_budget_mb
+        self.transcribers: "OrderedDict[str, Transcriber]" = OrderedDict()
+        self.in_use: Dict[str, int] = {}
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, model_size: str) -> Transcriber:
+        with self.lock:
+            return self._get(model_size)
+
+    def acquire(self, model_size: str) -> Transcriber:
+        with self.lock:
+            transcriber = self._get(model_size)
+            self.in_use[model_size] = self.in_use.get(model_size, 0) + 1
+            self._make_room(model_size)
+            return transcriber
+
+    def release(self, model_size: str):
+        with self.lock:
+            self.in_use[model_size] -= 1
+
+    def preload(self, model_size: str):
+        with self.lock:
+            transcriber = self._get(model_size)
+            self._make_room(model_size)
+        transcriber.preload_for_recording()
+
+    def pooled(self, model_size: str, decode_options: Optional[Dict[str, Any]] = None) -> "PooledTranscriber":
+        return PooledTranscriber(self, model_size, decode_options)
+
+    def loaded_models(self) -> List[str]:
+        with self.lock:
+            return [size for size, transcriber in self.transcribers.items() if transcriber.model is not None]
+
+    def loaded_memory_mb(self) -> int:
+        with self.lock:
+            return self._loaded_memory_mb()
+
+    def set_keep_model_loaded(self, keep_model_loaded: bool):
+        with self.lock:
+            for transcriber in self.transcribers.values():
+                transcriber.keep_model_loaded = keep_model_loaded
+
+    def status(self) -> Dict[str, Optional[str]]:
+        with self.lock:
+            return {size: transcriber.current_device for size, transcriber in self.transcribers.items()}
+
+    def shutdown(self):
+        with self.lock:
+            transcribers = list(self.transcribers.values())
+        for transcriber in transcribers:
+            transcriber.shutdown()
+
+    def _get(self, model_size: str) -> Transcriber:
+        transcriber = self.transcribers.get(model_size)
+        if transcriber is None:
+            transcriber = self.transcriber_factory(model_size)
+            self.transcribers[model_size] = transcriber
+        self.transcribers.move_to_end(model_size)
+        return transcriber
+
+    def _loaded_memory_mb(self, exclude: Optional[str] = None) -> int:
+        return sum(
+            estimate_model_memory_mb(size)
+            for size, transcriber in self.transcribers.items()
+            if transcriber.model is not None and size != exclude
+        )
+
+    def _make_room(self, model_size: str):
+        if self.memory_budget_mb is None:
+            return
+
+        needed = estimate_model_memory_mb(model_size)
+        for size, transcriber in list(self.transcribers.items()):
+            if self._loaded_memory_mb(exclude=model_size) + needed <= self.memory_budget_mb:
+                return
+            if size == model_size or transcriber.model is None or self.in_use.get(size, 0) > 0:
+                continue
+            print(f"Model pool over budget, unloading '{size}'...")
+            transcriber.unload_model()
+            self.evictions += 1
+
+
+class PooledTranscriber:
+    def __init__(self, pool: ModelPool, model_size: str, decode_options: Optional[Dict[str, Any]] = None):
+        self.pool = pool
+        self.model_size = model_size
+        self.profile_options = decode_options
+
+    @property
+    def transcriber(self) -> Transcriber:
+        return self.pool.get(self.model_size)
+
+    @property
+    def preferred_device(self) -> str:
+        return self.transcriber.preferred_device
+
+    @property
+    def decode_options(self) -> Dict:
+        if self.profile_options is not None:
+            return self.profile_options
+        return self.transcriber.decode_options
+
+    def transcribe_segments(self, audio_data: np.ndarray, language: Optional[str] = None) -> List[TranscriptSegment]:
+        transcriber = self.pool.acquire(self.model_size)
+        try:
+            return transcriber.transcribe_segments(audio_data, language=language, decode_options=self.profile_options)
+        finally:
+            self.pool.release(self.model_size)
+
+    def transcribe(self, audio_data: np.ndarray, language: Optional[str] = None) -> str:
+        segments = self.transcribe_segments(audio_data, language=language)
+        return " ".join(segment.text for segment in segments).strip()
+
+    def transcribe_batched(
+        self,
+        audio_data: np.ndarray,
+        clip_timestamps: Optional[List[Dict[str, float]]] = None,
+        batch_size: int = 8,
+        language: Optional[str] = None
+    ) -> List[TranscriptSegment]:
+        transcriber = self.pool.acquire(self.model_size)
+        try:
+            return transcriber.transcribe_batched(
+                audio_data,
+                clip_timestamps=clip_timestamps,
+                batch_size=batch_size,
+                language=language,
+                decode_options=self.profile_options
+            )
+        finally:
+            self.pool.release(self.model_size)
+
+    @staticmethod
+    def speech_clips(*args, **kwargs) -> List[Dict[str, float]]:
+        return Transcriber.speech_clips(*args, **kwargs)
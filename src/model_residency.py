@@ -0,0 +1,116 @@
+import gc
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+
+class ResidencyTransition(NamedTuple):
+    name: str
+    seconds: float
+    timestamp: float
+
+
+class ModelResidency:
+    def __init__(
+        self,
+        model_factory: Callable[[str, str], Any],
+        primary: Tuple[str, str],
+        fallback: Tuple[str, str] = ("cpu", "int8"),
+        park_primary_in_ram: bool = True,
+        history_size: int = 100
+    ):
+        self.model_factory = model_factory
+        self.primary_device, self.primary_compute_type = primary
+        self.fallback_device, self.fallback_compute_type = fallback
+        self.park_primary_in_ram = park_primary_in_ram
+        self.primary_model: Optional[Any] = None
+        self.fallback_model: Optional[Any] = None
+        self.primary_parked = False
+        self.active: Optional[str] = None
+        self.transitions: "deque[ResidencyTransition]" = deque(maxlen=history_size)
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self.lock = threading.RLock()
+
+    @property
+    def active_model(self) -> Optional[Any]:
+        if self.active == "primary":
+            return self.primary_model
+        if self.active == "fallback":
+            return self.fallback_model
+        return None
+
+    @property
+    def active_device(self) -> Optional[str]:
+        if self.active == "primary":
+            return self.primary_device
+        if self.active == "fallback":
+            return self.fallback_device
+        return None
+
+    def load_primary(self) -> Any:
+        with self.lock:
+            if self.primary_model is None:
+                self.primary_model = self._timed("load_primary", lambda: self.model_factory(
+                    self.primary_device, self.primary_compute_type
+                ))
+                self.primary_parked = False
+            elif self.primary_parked:
+                self._timed("promote", self.primary_model.model.load_model)
+                self.primary_parked = False
+            self.active = "primary"
+            return self.primary_model
+
+    def load_fallback(self) -> Any:
+        with self.lock:
+            if self.fallback_model is None:
+                self.fallback_model = self._timed("load_fallback", lambda: self.model_factory(
+                    self.fallback_device, self.fallback_compute_type
+                ))
+            self.active = "fallback"
+            return self.fallback_model
+
+    def promote(self) -> Any:
+        return self.load_primary()
+
+    def demote(self) -> Any:
+        with self.lock:
+            model = self.load_fallback()
+            if self.primary_model is not None and not self.primary_parked:
+                if self.park_primary_in_ram:
+                    self._timed("demote", lambda: self.primary_model.model.unload_model(to_cpu=True))
+                    self.primary_parked = True
+                else:
+                    self._timed("drop_primary", self.drop_primary)
+            return model
+
+    def unload(self):
+        with self.lock:
+            self.primary_model = None
+            self.fallback_model = None
+            self.primary_parked = False
+            self.active = None
+            self._timed("unload", gc.collect)
+
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        with self.lock:
+            return {name: dict(entry) for name, entry in self.stats.items()}
+
+    def drop_primary(self):
+        with self.lock:
+            self.primary_model = None
+            self.primary_parked = False
+            if self.active == "primary":
+                self.active = None
+            gc.collect()
+
+    def _timed(self, name: str, action: Callable[[], Any]) -> Any:
+        start_time = time.perf_counter()
+        result = action()
+        seconds = time.perf_counter() - start_time
+        self.transitions.append(ResidencyTransition(name, seconds, time.time()))
+        entry = self.stats.setdefault(name, {'count': 0, 'total_seconds': 0.0, 'last_seconds': 0.0})
+        entry['count'] += 1
+        entry['total_seconds'] += seconds
+        entry['last_seconds'] = seconds
+        return result
@@ -0,0 +1,144 @@
+import copy
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src import metrics
+from src.decode_profiles import DEFAULT_PROFILE, DECODE_PROFILES
+from src.transcriber import Transcriber, TranscriptSegment
+
+_worker_model = None
+
+
+def create_cpu_model(model_size: str, compute_type: str, cpu_threads: int, num_workers: int):
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        model_size,
+        device="cpu",
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers
+    )
+
+
+def _init_worker(model_factory: Callable, model_size: str, compute_type: str, cpu_threads: int, num_workers: int):
+    global _worker_model
+    _worker_model = model_factory(model_size, compute_type, cpu_threads, num_workers)
+
+
+def _decode_piece(
+    audio: np.ndarray,
+    offset: float,
+    language: Optional[str],
+    decode_options: Dict[str, Any]
+) -> List[TranscriptSegment]:
+    segments, info = _worker_model.transcribe(audio, language=language, **decode_options)
+    return [
+        TranscriptSegment(offset + segment.start, offset + segment.end, segment.text.strip())
+        for segment in segments
+    ]
+
+
+def plan_pieces(
+    clips: List[Dict[str, float]],
+    total_seconds: float,
+    piece_seconds: float
+) -> List[Tuple[float, float]]:
+    if not clips:
+        return []
+
+    pieces = []
+    start = 0.0
+    for clip, next_clip in zip(clips, clips[1:]):
+        if next_clip['start'] - start >= piece_seconds:
+            cut = (clip['end'] + next_clip['start']) / 2
+            pieces.append((start, cut))
+            start = cut
+    pieces.append((start, total_seconds))
+    return pieces
+
+
+class ParallelDecoder:
+    def __init__(
+        self,
+        model_size: str = "turbo",
+        processes: Optional[int] = None,
+        cpu_threads: Optional[int] = None,
+        compute_type: str = "int8",
+        num_workers: int = 1,
+        piece_seconds: Optional[float] = None,
+        decode_options: Optional[Dict[str, Any]] = None,
+        sample_rate: int = 16000,
+        model_factory: Callable = create_cpu_model,
+        clip_fn: Callable[[np.ndarray], List[Dict[str, float]]] = Transcriber.speech_clips,
+        executor_factory: Callable[..., Executor] = ProcessPoolExecutor
+    ):
+        cores = os.cpu_count() or 1
+        self.model_size = model_size
+        self.processes = max(1, processes or cores // 4 or 1)
+        self.cpu_threads = max(1, cpu_threads or cores // self.processes)
+        self.compute_type = compute_type
+        self.num_workers = num_workers
+        self.piece_seconds = piece_seconds
+        self.decode_options = decode_options or copy.deepcopy(DECODE_PROFILES[DEFAULT_PROFILE])
+        self.sample_rate = sample_rate
+        self.model_factory = model_factory
+        self.clip_fn = clip_fn
+        self.executor_factory = executor_factory
+        self.executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self.executor is None:
+            print(
+                f"Starting {self.processes} decode process(es) for '{self.model_size}' "
+                f"with {self.cpu_threads} thread(s) each..."
+            )
+            self.executor = self.executor_factory(
+                max_workers=self.processes,
+                initializer=_init_worker,
+                initargs=(self.model_factory, self.model_size, self.compute_type, self.cpu_threads, self.num_workers)
+            )
+        return self.executor
+
+    def plan(self, audio_data: np.ndarray) -> List[Tuple[float, float]]:
+        total_seconds = len(audio_data) / self.sample_rate
+        piece_seconds = self.piece_seconds or max(30.0, total_seconds / (self.processes * 2))
+        return plan_pieces(self.clip_fn(audio_data), total_seconds, piece_seconds)
+
+    def transcribe_segments(self, audio_data: np.ndarray, language: Optional[str] = None) -> List[TranscriptSegment]:
+        pieces = self.plan(audio_data)
+        if not pieces:
+            return []
+
+        start_time = time.perf_counter()
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                _decode_piece,
+                audio_data[int(start * self.sample_rate):int(end * self.sample_rate)],
+                start,
+                language,
+                self.decode_options
+            )
+            for start, end in pieces
+        ]
+
+        segments = []
+        with metrics.stage('decode'):
+            for future in futures:
+                segments.extend(future.result())
+        print(f"Decoded {len(pieces)} piece(s) on {self.processes} process(es) in {time.perf_counter() - start_time:.1f}s")
+        return segments
+
+    def transcribe(self, audio_data: np.ndarray, language: Optional[str] = None) -> str:
+        segments = self.transcribe_segments(audio_data, language=language)
+        return " ".join(segment.text for segment in segments).strip()
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
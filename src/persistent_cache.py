@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def default_cache_dir() -> Path:
+    if sys.platform == 'win32':
+        base = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
+    elif sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Caches'
+    else:
+        base = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    return base / 'VoicePaste'
+
+
+def file_fingerprint(path: str, sample_bytes: int = 1 << 20) -> str:
+    stat = os.stat(path)
+    size = stat.st_size
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+
+    with open(path, 'rb') as f:
+        if size <= 3 * sample_bytes:
+            digest.update(f.read())
+        else:
+            # Sampling misses in-place edits between the samples, so large files are also keyed by modification time.
+            digest.update(str(stat.st_mtime_ns).encode())
+            for offset in (0, (size - sample_bytes) // 2, size - sample_bytes):
+                f.seek(offset)
+                digest.update(f.read(sample_bytes))
+
+    return digest.hexdigest()
+
+
+def make_cache_key(
+    source_fingerprint: str,
+    model_size: str,
+    language: Optional[str],
+    decode_options: Dict[str, Any]
+) -> str:
+    payload = json.dumps({
+        'source': source_fingerprint,
+        'model': model_size,
+        'language': language,
+        'decode': decode_options
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class PersistentCache:
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 30 * 24 * 3600
+    ):
+        self.db_path = Path(db_path) if db_path else default_cache_dir() / 'transcriptions.db'
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self.connection.commit()
+        self.purge_expired()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self.lock:
+            row = self.connection.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            value, created = row
+            if self.ttl_seconds is not None and now - created >= self.ttl_seconds:
+                self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.connection.commit()
+                return None
+
+            self.connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self.connection.commit()
+            return value
+
+    def put(self, key: str, value: str):
+        now = time.time()
+        size = len(value.encode('utf-8'))
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now)
+            )
+            self._evict()
+            self.connection.commit()
+
+    def delete(self, key: str):
+        with self.lock:
+            self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.connection.commit()
+
+    def purge_expired(self):
+        if self.ttl_seconds is None:
+            return
+        with self.lock:
+            self.connection.execute("DELETE FROM entries WHERE created < ?", (time.time() - self.ttl_seconds,))
+            self.connection.commit()
+
+    def total_bytes(self) -> int:
+        with self.lock:
+            return self._total_bytes()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def _total_bytes(self) -> int:
+        return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self):
+        excess = self._total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+
+        victims = []
+        for key, size in self.connection.execute("SELECT key, size FROM entries ORDER BY accessed ASC"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.connection.executemany("DELETE FROM entries WHERE key = ?", victims)
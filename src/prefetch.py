@@ -0,0 +1,49 @@
+import contextvars
+import queue
+import threading
+from typing import Any, Iterable, Iterator, Tuple
+
+_DONE = object()
+
+
+def prefetch(iterable: Iterable, max_items: int = 32) -> Iterator:
+    items: "queue.Queue[Tuple[Any, Any]]" = queue.Queue(maxsize=max_items)
+    stop = threading.Event()
+
+    def put(entry: Tuple[Any, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        iterator = iter(iterable)
+        outcome = (_DONE, None)
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            outcome = (_DONE, e)
+        finally:
+            # Closing the source from its own thread lets generators release pipes and subprocesses.
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+        put(outcome)
+
+    producer = threading.Thread(target=contextvars.copy_context().run, args=(produce,), daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
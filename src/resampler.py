@@ -0,0 +1,109 @@
+import numpy as np
+from math import gcd
+from typing import Iterable, Iterator
+
+
+class StreamingResampler:
+    def __init__(self, source_rate: int, target_rate: int):
+        divisor = gcd(source_rate, target_rate)
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+        self.up = target_rate // divisor
+        self.down = source_rate // divisor
+
+        max_rate = max(self.up, self.down)
+        self.delay = 10 * max_rate
+        if self.is_passthrough:
+            self.taps = np.ones(1, dtype=np.float32)
+        else:
+            from scipy.signal import firwin
+
+            cutoff = 1.0 / max_rate
+            self.taps = (firwin(2 * self.delay + 1, cutoff, window=('kaiser', 5.0)) * self.up).astype(np.float32)
+
+        self.history = np.zeros(0, dtype=np.float32)
+        self.history_start = 0
+        self.input_count = 0
+        self.output_count = 0
+
+    @property
+    def is_passthrough(self) -> bool:
+        return self.up == self.down
+
+    def output_length(self, input_length: int) -> int:
+        return -(-input_length * self.up // self.down)
+
+    def reset(self):
+        self.history = np.zeros(0, dtype=np.float32)
+        self.history_start = 0
+        self.input_count = 0
+        self.output_count = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        chunk = np.asarray(chunk, dtype=np.float32)
+        self.input_count += len(chunk)
+
+        if self.is_passthrough:
+            self.output_count += len(chunk)
+            return chunk
+
+        self.history = np.concatenate((self.history, chunk)) if len(self.history) else chunk
+        ready = (self.up * self.input_count - 1 - self.delay) // self.down + 1
+        return self._emit(ready)
+
+    def flush(self) -> np.ndarray:
+        if self.is_passthrough:
+            return np.zeros(0, dtype=np.float32)
+        return self._emit(self.output_length(self.input_count))
+
+    def _emit(self, end: int) -> np.ndarray:
+        from scipy.signal import upfirdn
+
+        if end <= self.output_count:
+            return np.zeros(0, dtype=np.float32)
+
+        # Shift the filter so that output n lands on upfirdn's decimation grid
+        # even though the history no longer starts at input sample 0.
+        start = self.history_start
+        pad = (start * self.up - self.delay) % self.down
+        taps = np.concatenate((np.zeros(pad, dtype=np.float32), self.taps)) if pad else self.taps
+        filtered = upfirdn(taps, self.history, self.up, self.down)
+
+        first = self.output_count + (self.delay + pad - start * self.up) // self.down
+        output = filtered[first:first + end - self.output_count].astype(np.float32, copy=False)
+        self.output_count = end
+
+        keep_from = max(start, (end * self.down + self.delay - len(self.taps)) // self.up)
+        self.history = self.history[keep_from - start:]
+        self.history_start = keep_from
+        return output
+
+
+def resample(audio: np.ndarray, source_rate: int, target_rate: int, block_size: int = 1 << 16) -> np.ndarray:
+    if source_rate == target_rate:
+        return np.asarray(audio, dtype=np.float32)
+
+    resampler = StreamingResampler(source_rate, target_rate)
+    output = np.empty(resampler.output_length(len(audio)), dtype=np.float32)
+    position = 0
+
+    for start in range(0, len(audio), block_size):
+        piece = resampler.process(audio[start:start + block_size])
+        output[position:position + len(piece)] = piece
+        position += len(piece)
+
+    tail = resampler.flush()
+    output[position:position + len(tail)] = tail
+    return output
+
+
+def resample_chunks(chunks: Iterable[np.ndarray], source_rate: int, target_rate: int) -> Iterator[np.ndarray]:
+    resampler = StreamingResampler(source_rate, target_rate)
+    for chunk in chunks:
+        piece = resampler.process(chunk)
+        if len(piece):
+            yield piece
+
+    tail = resampler.flush()
+    if len(tail):
+        yield tail
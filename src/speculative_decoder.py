@@ -0,0 +1,90 @@
+import contextvars
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+from src import metrics
+
+
+class SpeculativeResult(NamedTuple):
+    draft_text: str
+    final_text: str
+    first_text_seconds: Optional[float]
+    final_text_seconds: float
+    replaced: bool
+
+
+class SpeculativeDecoder:
+    def __init__(
+        self,
+        draft_transcriber,
+        main_transcriber,
+        publish: Callable[[str], None],
+        can_replace: Callable[[str], bool]
+    ):
+        self.draft_transcriber = draft_transcriber
+        self.main_transcriber = main_transcriber
+        self.publish = publish
+        self.can_replace = can_replace
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str] = None,
+        started: Optional[float] = None
+    ) -> SpeculativeResult:
+        started = started if started is not None else time.perf_counter()
+        main_result = {}
+
+        def run_main():
+            try:
+                main_result['text'] = self.main_transcriber.transcribe(audio_data, language=language)
+            except Exception as e:
+                main_result['error'] = e
+
+        main_thread = threading.Thread(target=contextvars.copy_context().run, args=(run_main,), daemon=True)
+        main_thread.start()
+
+        draft_text = ""
+        first_text_seconds = None
+        # noinspection PyBroadException
+        try:
+            with metrics.stage('draft'):
+                draft_text = contextvars.Context().run(self.draft_transcriber.transcribe, audio_data, language=language)
+        except Exception as e:
+            print(f"Draft transcription failed: {e}")
+
+        if draft_text and main_thread.is_alive():
+            self.publish(draft_text)
+            first_text_seconds = time.perf_counter() - started
+        else:
+            draft_text = ""
+
+        main_thread.join()
+        if 'error' in main_result:
+            if not draft_text:
+                raise main_result['error']
+            print(f"Transcription error, keeping the draft: {main_result['error']}")
+        final_text = main_result.get('text') or ""
+
+        replaced = False
+        if not draft_text:
+            if final_text:
+                self.publish(final_text)
+                first_text_seconds = time.perf_counter() - started
+        elif final_text and final_text != draft_text:
+            if self.can_replace(draft_text):
+                self.publish(final_text)
+                replaced = True
+            else:
+                print("Draft was already pasted, keeping it in the clipboard")
+
+        return SpeculativeResult(
+            draft_text,
+            final_text or draft_text,
+            first_text_seconds,
+            time.perf_counter() - started,
+            replaced
+        )
@@ -0,0 +1,137 @@
+import threading
+import numpy as np
+from typing import List, Optional
+
+from src.resampler import StreamingResampler
+from src.transcriber import Transcriber, TranscriptSegment
+
+
+class StreamingTranscriber:
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        source_sample_rate: int,
+        target_sample_rate: int = 16000,
+        language: Optional[str] = None,
+        step_seconds: float = 2.0,
+        commit_margin_seconds: float = 1.5,
+        max_window_seconds: float = 25.0
+    ):
+        self.transcriber = transcriber
+        self.source_sample_rate = source_sample_rate
+        self.target_sample_rate = target_sample_rate
+        self.language = language
+        self.step_seconds = step_seconds
+        self.commit_margin_seconds = commit_margin_seconds
+        self.max_window_seconds = max_window_seconds
+        self.resampler = StreamingResampler(source_sample_rate, target_sample_rate)
+        self.pending_chunks: List[np.ndarray] = []
+        self.pending_samples = 0
+        self.committed_text: List[str] = []
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.decode_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        with self.lock:
+            self.resampler.reset()
+            self.pending_chunks = []
+            self.pending_samples = 0
+            self.committed_text = []
+        self.stop_event.clear()
+        self.decode_thread = threading.Thread(target=self._decode_loop, daemon=True)
+        self.decode_thread.start()
+
+    def feed(self, in_data: bytes):
+        audio = np.frombuffer(in_data, dtype=np.int16).astype(np.float32) / 32768.0
+        with self.lock:
+            self._append(self.resampler.process(audio))
+
+    def finish(self) -> str:
+        self._stop_decode_thread()
+
+        with self.lock:
+            self._append(self.resampler.flush())
+
+        tail = self._snapshot_pending()
+        if tail is not None and len(tail) >= self.target_sample_rate // 10:
+            print(f"Decoding unconfirmed tail ({len(tail) / self.target_sample_rate:.1f}s)...")
+            segments = self.transcriber.transcribe_segments(tail, language=self.language)
+            self._commit(segments, len(tail))
+
+        with self.lock:
+            text = " ".join(part for part in self.committed_text if part).strip()
+            self.pending_chunks = []
+            self.pending_samples = 0
+        return text
+
+    def cancel(self):
+        self._stop_decode_thread()
+        with self.lock:
+            self.resampler.reset()
+            self.pending_chunks = []
+            self.pending_samples = 0
+            self.committed_text = []
+
+    def _stop_decode_thread(self):
+        self.stop_event.set()
+        if self.decode_thread is not None:
+            self.decode_thread.join()
+            self.decode_thread = None
+
+    def _decode_loop(self):
+        while not self.stop_event.wait(self.step_seconds):
+            window = self._snapshot_pending()
+            if window is None or len(window) < self.step_seconds * self.target_sample_rate:
+                continue
+            try:
+                self._decode_window(window)
+            except Exception as e:
+                print(f"Streaming transcription error: {e}")
+
+    def _decode_window(self, window: np.ndarray):
+        window_duration = len(window) / self.target_sample_rate
+        segments = self.transcriber.transcribe_segments(window, language=self.language)
+
+        stable_end = window_duration - self.commit_margin_seconds
+        stable = [segment for segment in segments if segment.end <= stable_end]
+
+        if not stable and window_duration >= self.max_window_seconds:
+            if len(segments) > 1:
+                stable = segments[:-1]
+            elif segments:
+                # One segment spanning the whole window would never stabilise; commit it to keep the window bounded.
+                stable = segments
+            else:
+                self._drop_pending(int(stable_end * self.target_sample_rate))
+                return
+
+        if stable:
+            self._commit(stable, int(stable[-1].end * self.target_sample_rate))
+
+    def _commit(self, segments: List[TranscriptSegment], consumed_samples: int):
+        with self.lock:
+            self.committed_text.extend(segment.text for segment in segments)
+        self._drop_pending(consumed_samples)
+
+    def _append(self, audio: np.ndarray):
+        if len(audio):
+            self.pending_chunks.append(audio)
+            self.pending_samples += len(audio)
+
+    def _snapshot_pending(self) -> Optional[np.ndarray]:
+        with self.lock:
+            if not self.pending_chunks:
+                return None
+            if len(self.pending_chunks) > 1:
+                self.pending_chunks = [np.concatenate(self.pending_chunks)]
+            return self.pending_chunks[0]
+
+    def _drop_pending(self, num_samples: int):
+        if num_samples <= 0:
+            return
+        with self.lock:
+            pending = np.concatenate(self.pending_chunks) if self.pending_chunks else np.zeros(0, dtype=np.float32)
+            remainder = pending[num_samples:]
+            self.pending_chunks = [remainder] if len(remainder) else []
+            self.pending_samples = len(remainder)
@@ -1,9 +1,21 @@
+import copy
 import numpy as np
 import threading
 import time
-import gc
-from faster_whisper import WhisperModel
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, List, NamedTuple
+
+from src import metrics
+from src.decode_profiles import DEFAULT_PROFILE, DECODE_PROFILES
+from src.model_residency import ModelResidency
+
+if TYPE_CHECKING:
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+
+class TranscriptSegment(NamedTuple):
+    start: float
+    end: float
+    text: str
 
 
 class Transcriber:
@@ -14,13 +26,16 @@ class Transcriber:
         compute_type: str = "float16",
         keep_model_loaded: bool = False,
         move_to_ram_after_seconds: int = 3600,
-        unload_after_seconds: int = 18000
+        unload_after_seconds: int = 18000,
+        num_workers: int = 1
     ):
         self.model_size = model_size
+        self.num_workers = num_workers
         self.preferred_device = device
         self.gpu_compute_type = compute_type
         self.cpu_compute_type = "int8"
-        self.model: Optional[WhisperModel] = None
+        self.model: Optional["WhisperModel"] = None
+        self.batched_pipeline: Optional["BatchedInferencePipeline"] = None
         self.current_device: Optional[str] = None
         self.keep_model_loaded = keep_model_loaded
         self.move_to_ram_after_seconds = move_to_ram_after_seconds
@@ -31,116 +46,204 @@ class Transcriber:
         self.lock = threading.Lock()
         self.preload_thread: Optional[threading.Thread] = None
         self.is_preloading = False
+        self.residency = ModelResidency(
+            self._create_model,
+            primary=("cuda", self.gpu_compute_type),
+            fallback=("cpu", self.cpu_compute_type)
+        )
+        self.decode_options = copy.deepcopy(DECODE_PROFILES[DEFAULT_PROFILE])
 
     def load_model(self, target_device: Optional[str] = None):
         with self.lock:
             if self.model is None:
                 device = target_device or self.preferred_device
-                compute_type = self.gpu_compute_type if device == "cuda" else self.cpu_compute_type
 
                 print(f"Loading Whisper model '{self.model_size}' on {device}...")
                 try:
-                    self.model = WhisperModel(
-                        self.model_size,
-                        device=str(device),
-                        compute_type=compute_type
-                    )
-                    self.current_device = device
+                    if device == "cuda":
+                        self.residency.load_primary()
+                    else:
+                        self.residency.load_fallback()
+                    self._sync_active_model()
                     print(f"Model loaded successfully on {device.upper()}!")
                 except Exception as e:
                     if device == "cuda":
                         print(f"Failed to load model on CUDA: {e}")
                         print("Falling back to CPU...")
-                        self.model = WhisperModel(
-                            self.model_size,
-                            device="cpu",
-                            compute_type=self.cpu_compute_type
-                        )
-                        self.current_device = "cpu"
+                        self.residency.load_fallback()
+                        self._sync_active_model()
                         self.preferred_device = "cpu"
                         print("Model loaded successfully on CPU!")
                     else:
                         raise
 
-    def transcribe(self, audio_data: np.ndarray, language: Optional[str] = None) -> str:
+    def _create_model(self, device: str, compute_type: str) -> "WhisperModel":
+        from faster_whisper import WhisperModel
+
+        return WhisperModel(
+            self.model_size,
+            device=device,
+            compute_type=compute_type,
+            num_workers=self.num_workers
+        )
+
+    def _sync_active_model(self):
+        self.model = self.residency.active_model
+        self.current_device = self.residency.active_device
+
+    def get_residency_timings(self) -> Dict[str, Dict[str, Any]]:
+        return self.residency.timings()
+
+    def warm_up(self, seconds: float = 1.0) -> float:
+        start_time = time.perf_counter()
+        model = self._acquire_model()
+        try:
+            t = np.arange(int(seconds * 16000), dtype=np.float32) / 16000
+            noise = np.random.default_rng(0).standard_normal(len(t)).astype(np.float32)
+            audio = 0.1 * np.sin(2 * np.pi * 220 * t) + 0.01 * noise
+
+            options = dict(self.decode_options, vad_filter=False)
+            options.pop('vad_parameters', None)
+            segments, info = model.transcribe(audio, **options)
+            list(segments)
+        finally:
+            self._release_model()
+
+        elapsed = time.perf_counter() - start_time
+        print(f"Model warmed up in {elapsed:.2f}s")
+        return elapsed
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str] = None,
+        decode_options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        segments = self.transcribe_segments(audio_data, language=language, decode_options=decode_options)
+        return " ".join(segment.text for segment in segments).strip()
+
+    def transcribe_segments(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str] = None,
+        decode_options: Optional[Dict[str, Any]] = None
+    ) -> List[TranscriptSegment]:
+        model = self._acquire_model()
+        try:
+            options = decode_options if decode_options is not None else self.decode_options
+            with metrics.stage('decode'):
+                segments, info = model.transcribe(audio_data, language=language, **options)
+                return [
+                    TranscriptSegment(segment.start, segment.end, segment.text.strip())
+                    for segment in segments
+                ]
+        finally:
+            self._release_model()
+
+    def transcribe_batched(
+        self,
+        audio_data: np.ndarray,
+        clip_timestamps: Optional[List[Dict[str, float]]] = None,
+        batch_size: int = 8,
+        language: Optional[str] = None,
+        decode_options: Optional[Dict[str, Any]] = None
+    ) -> List[TranscriptSegment]:
+        from faster_whisper import BatchedInferencePipeline
+
+        model = self._acquire_model()
+        try:
+            if self.batched_pipeline is None or self.batched_pipeline.model is not model:
+                self.batched_pipeline = BatchedInferencePipeline(model)
+            with metrics.stage('decode'):
+                segments, info = self.batched_pipeline.transcribe(
+                    audio_data,
+                    language=language,
+                    batch_size=batch_size,
+                    clip_timestamps=clip_timestamps,
+                    **(decode_options if decode_options is not None else self.decode_options)
+                )
+                return [
+                    TranscriptSegment(segment.start, segment.end, segment.text.strip())
+                    for segment in segments
+                ]
+        finally:
+            self._release_model()
+
+    @staticmethod
+    def speech_clips(
+        audio_data: np.ndarray,
+        max_clip_seconds: float = 30.0,
+        min_silence_duration_ms: int = 500,
+        sample_rate: int = 16000
+    ) -> List[Dict[str, float]]:
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        timestamps = get_speech_timestamps(
+            audio_data,
+            VadOptions(max_speech_duration_s=max_clip_seconds, min_silence_duration_ms=min_silence_duration_ms),
+            sampling_rate=sample_rate
+        )
+        return [
+            {'start': timestamp['start'] / sample_rate, 'end': timestamp['end'] / sample_rate}
+            for timestamp in timestamps
+        ]
+
+    def _acquire_model(self) -> "WhisperModel":
         if self.is_preloading and self.preload_thread is not None:
             print("Waiting for model preload to complete...")
-            self.preload_thread.join()
+            with metrics.stage('model_load'):
+                self.preload_thread.join()
             self.is_preloading = False
 
         if self.model is None:
-            self.load_model()
+            with metrics.stage('model_load'):
+                self.load_model()
         elif self.current_device == "cpu" and self.preferred_device == "cuda":
             print("Model on CPU, moving back to GPU for transcription...")
-            self._move_to_gpu()
+            with metrics.stage('model_move'):
+                self._move_to_gpu()
 
+        metrics.annotate(model=self.model_size, device=self.current_device)
         self.last_used_time = time.time()
         self._cancel_all_timers()
+        return self.model
 
-        segments, info = self.model.transcribe(
-            audio_data,
-            language=language,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(min_silence_duration_ms=500)
-        )
-
-        text_parts = []
-        for segment in segments:
-            text_parts.append(segment.text)
-
+    def _release_model(self):
         if not self.keep_model_loaded:
             self._schedule_memory_management()
 
-        return " ".join(text_parts).strip()
-
     def unload_model(self):
         with self.lock:
             if self.model is not None:
                 print("Unloading Whisper model from memory (moving to disk)...")
-                self.model = None
-                self.current_device = None
-                gc.collect()
+                self.batched_pipeline = None
+                self.residency.unload()
+                self._sync_active_model()
                 print("Model unloaded!")
 
     def _move_to_cpu(self):
         with self.lock:
             if self.model is not None and self.current_device == "cuda":
                 print("Moving model from VRAM to RAM (GPU -> CPU)...")
-                self.model = None
-                gc.collect()
-
-                self.model = WhisperModel(
-                    self.model_size,
-                    device="cpu",
-                    compute_type=self.cpu_compute_type
-                )
-                self.current_device = "cpu"
-                print("Model moved to RAM (CPU)!")
+                start_time = time.perf_counter()
+                self.residency.demote()
+                self._sync_active_model()
+                print(f"Model moved to RAM (CPU) in {time.perf_counter() - start_time:.2f}s!")
 
     def _move_to_gpu(self):
         with self.lock:
             if self.model is not None and self.current_device == "cpu" and self.preferred_device == "cuda":
                 print("Moving model from RAM to VRAM (CPU -> GPU)...")
-                self.model = None
-                gc.collect()
-
+                start_time = time.perf_counter()
                 try:
-                    self.model = WhisperModel(
-                        self.model_size,
-                        device="cuda",
-                        compute_type=self.gpu_compute_type
-                    )
-                    self.current_device = "cuda"
-                    print("Model moved to VRAM (GPU)!")
+                    self.residency.promote()
+                    self._sync_active_model()
+                    print(f"Model moved to VRAM (GPU) in {time.perf_counter() - start_time:.2f}s!")
                 except Exception as e:
                     print(f"Failed to move to GPU: {e}, keeping on CPU")
-                    self.model = WhisperModel(
-                        self.model_size,
-                        device="cpu",
-                        compute_type=self.cpu_compute_type
-                    )
-                    self.current_device = "cpu"
+                    self.residency.drop_primary()
+                    self.residency.load_fallback()
+                    self._sync_active_model()
 
     def _schedule_memory_management(self):
         self._cancel_all_timers()
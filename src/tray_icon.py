@@ -1,7 +1,8 @@
-import pystray
 import threading
-from PIL import Image, ImageDraw
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageDraw
 
 
 class TrayIcon:
@@ -12,7 +13,11 @@ class TrayIcon:
         on_toggle_keep_model: Callable = None,
         get_model_status: Callable = None,
         on_transcribe_youtube: Callable = None,
-        on_transcribe_file: Callable = None
+        on_transcribe_file: Callable = None,
+        get_queue_status: Callable = None,
+        on_cancel_jobs: Callable = None,
+        on_toggle_continuous: Callable = None,
+        get_metrics_summary: Callable = None
     ):
         self.on_quit = on_quit
         self.on_toggle_recording = on_toggle_recording
@@ -20,12 +25,20 @@ class TrayIcon:
         self.get_model_status = get_model_status
         self.on_transcribe_youtube = on_transcribe_youtube
         self.on_transcribe_file = on_transcribe_file
+        self.get_queue_status = get_queue_status
+        self.on_cancel_jobs = on_cancel_jobs
+        self.on_toggle_continuous = on_toggle_continuous
+        self.get_metrics_summary = get_metrics_summary
+        self.continuous_enabled = False
         self.icon = None
         self.status = "idle"
+        self.progress: Optional[float] = None
         self.thread = None
         self.keep_model_enabled = False
 
-    def create_icon_image(self, status: str = "idle") -> Image.Image:
+    def create_icon_image(self, status: str = "idle") -> "Image.Image":
+        from PIL import Image, ImageDraw
+
         size = 512
         image = Image.new('RGBA', (size, size), color=(255, 255, 255, 0))
         draw = ImageDraw.Draw(image)
@@ -45,7 +58,7 @@ class TrayIcon:
         return image
 
     @staticmethod
-    def _draw_microphone(draw: ImageDraw.ImageDraw, size: int, color: tuple):
+    def _draw_microphone(draw: "ImageDraw.ImageDraw", size: int, color: tuple):
         cx, cy = size // 2, size // 2
 
         mic_width = int(size * 0.50)
@@ -75,7 +88,7 @@ class TrayIcon:
                  fill=color, width=stand_width)
 
     @staticmethod
-    def _draw_sound_waves(draw: ImageDraw.ImageDraw, size: int, color: tuple):
+    def _draw_sound_waves(draw: "ImageDraw.ImageDraw", size: int, color: tuple):
         cx, cy = size // 2, size // 2
 
         wave_offset = int(size * 0.38)
@@ -97,7 +110,7 @@ class TrayIcon:
                     start=90, end=270, fill=color, width=wave_width)
 
     @staticmethod
-    def _draw_download_arrow(draw: ImageDraw.ImageDraw, size: int, color: tuple):
+    def _draw_download_arrow(draw: "ImageDraw.ImageDraw", size: int, color: tuple):
         arrow_size = int(size * 0.3)
         arrow_x = size - arrow_size - int(size * 0.05)
         arrow_y = size - arrow_size - int(size * 0.05)
@@ -118,7 +131,7 @@ class TrayIcon:
         draw.polygon(head_points, fill=color)
 
     @staticmethod
-    def _draw_clipboard(draw: ImageDraw.ImageDraw, size: int, color: tuple):
+    def _draw_clipboard(draw: "ImageDraw.ImageDraw", size: int, color: tuple):
         clip_size = int(size * 0.36)
         clip_x = size - clip_size - int(size * 0.04)
         clip_y = size - clip_size - int(size * 0.04)
@@ -143,18 +156,32 @@ class TrayIcon:
                  fill=color, width=line_width)
 
     def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        import pystray
+
         def create_menu():
             return pystray.Menu(
                 pystray.MenuItem("VoicePaste - Voice to Text", lambda: None, enabled=False),
                 pystray.Menu.SEPARATOR,
                 pystray.MenuItem(self._get_status_text, lambda: None, enabled=False),
                 pystray.MenuItem(self._get_model_location, lambda: None, enabled=False),
+                pystray.MenuItem(self._get_queue_text, lambda: None, enabled=False),
+                pystray.MenuItem(self._get_metrics_text, lambda: None, enabled=False),
                 pystray.Menu.SEPARATOR,
                 pystray.MenuItem(
                     "Record (Shift+V)",
                     self._toggle_recording_action,
                     enabled=bool(self.on_toggle_recording)
                 ),
+                pystray.MenuItem(
+                    "Continuous Dictation (Shift+C)",
+                    self._toggle_continuous_action,
+                    checked=lambda _: self.continuous_enabled,
+                    enabled=bool(self.on_toggle_continuous)
+                ),
                 pystray.MenuItem(
                     "Transcribe YouTube URL... (Shift+Y)",
                     self._transcribe_youtube_action,
@@ -165,6 +192,11 @@ class TrayIcon:
                     self._transcribe_file_action,
                     enabled=bool(self.on_transcribe_file)
                 ),
+                pystray.MenuItem(
+                    "Cancel Background Jobs",
+                    self._cancel_jobs_action,
+                    enabled=bool(self.on_cancel_jobs)
+                ),
                 pystray.Menu.SEPARATOR,
                 pystray.MenuItem(
                     "Keep Model in Memory",
@@ -182,11 +214,13 @@ class TrayIcon:
             "VoicePaste - Ready",
             menu=create_menu()
         )
-        self.thread = threading.Thread(target=self.icon.run, daemon=True)
-        self.thread.start()
+        if self.status != "idle":
+            self.update_status(self.status)
+        self.icon.run()
 
     def update_status(self, status: str):
         self.status = status
+        self.progress = None
         if self.icon:
             if status == "recording":
                 self.icon.icon = self.create_icon_image("recording")
@@ -201,6 +235,12 @@ class TrayIcon:
                 self.icon.icon = self.create_icon_image("idle")
                 self.icon.title = "VoicePaste - Ready"
 
+    def update_progress(self, progress: float):
+        self.progress = progress
+        if self.icon:
+            self.icon.title = f"VoicePaste - Processing {progress:.0%}"
+            self.icon.update_menu()
+
     def _get_status_text(self, _=None):
         status_map = {
             "idle": "Ready",
@@ -209,6 +249,8 @@ class TrayIcon:
             "processing": "Processing..."
         }
         status = status_map.get(self.status, self.status.capitalize())
+        if self.progress is not None:
+            status = f"{status} {self.progress:.0%}"
         icon = {"idle": "✓", "recording": "●", "downloading": "⬇", "processing": "⚙"}.get(self.status, "○")
         return f"{icon} Status: {status}"
 
@@ -224,10 +266,29 @@ class TrayIcon:
             return f"{icon} Model: {location}"
         return "○ Model: Unknown"
 
+    def _get_queue_text(self, _=None):
+        if self.get_queue_status:
+            return f"☰ Queue: {self.get_queue_status()}"
+        return "☰ Queue: Unknown"
+
+    def _get_metrics_text(self, _=None):
+        if self.get_metrics_summary:
+            return f"⏱ Timing: {self.get_metrics_summary()}"
+        return "⏱ Timing: Unknown"
+
     def _toggle_recording_action(self, _=None):
         if self.on_toggle_recording:
             self.on_toggle_recording()
 
+    def _toggle_continuous_action(self, _=None):
+        if self.on_toggle_continuous:
+            self.on_toggle_continuous()
+
+    def set_continuous(self, enabled: bool):
+        self.continuous_enabled = enabled
+        if self.icon:
+            self.icon.update_menu()
+
     def _toggle_keep_model_action(self, _=None):
         if self.on_toggle_keep_model:
             self.keep_model_enabled = not self.keep_model_enabled
@@ -243,6 +304,10 @@ class TrayIcon:
         if self.on_transcribe_file:
             self.on_transcribe_file()
 
+    def _cancel_jobs_action(self, _=None):
+        if self.on_cancel_jobs:
+            self.on_cancel_jobs()
+
     def _quit_action(self, _=None):
         if self.icon:
             self.icon.stop()
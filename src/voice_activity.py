@@ -0,0 +1,102 @@
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+
+class EnergyVAD:
+    def __init__(
+        self,
+        sample_rate: int,
+        frame_ms: int = 30,
+        pre_roll_ms: int = 300,
+        post_roll_ms: int = 600,
+        min_threshold: float = 0.01,
+        noise_margin: float = 3.0,
+        noise_floor_rise: float = 0.002,
+        noise_window_ms: int = 5000,
+        noise_percentile: float = 10.0
+    ):
+        self.sample_rate = sample_rate
+        self.frame_samples = max(1, sample_rate * frame_ms // 1000)
+        self.pre_roll_frames = pre_roll_ms // frame_ms
+        self.post_roll_frames = post_roll_ms // frame_ms
+        self.min_threshold = min_threshold
+        self.noise_margin = noise_margin
+        self.noise_floor_rise = noise_floor_rise
+        self.noise_window_frames = max(1, noise_window_ms // frame_ms)
+        self.noise_percentile = noise_percentile
+        self.reset()
+
+    def reset(self):
+        self.remainder: Optional[np.ndarray] = None
+        self.pre_roll: "deque[np.ndarray]" = deque(maxlen=max(1, self.pre_roll_frames))
+        self.hangover = 0
+        self.noise_floor = self.min_threshold / self.noise_margin
+        self.recent_levels: "deque[float]" = deque(maxlen=self.noise_window_frames)
+        self.raw_samples = 0
+        self.kept_samples = 0
+        self.speech_frames = 0
+
+    @property
+    def threshold(self) -> float:
+        return max(self.min_threshold, self.noise_floor * self.noise_margin)
+
+    @property
+    def kept_ratio(self) -> float:
+        return self.kept_samples / self.raw_samples if self.raw_samples else 0.0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        self.raw_samples += len(samples)
+        if self.remainder is not None and len(self.remainder):
+            samples = np.concatenate((self.remainder, samples))
+
+        num_frames = len(samples) // self.frame_samples
+        self.remainder = samples[num_frames * self.frame_samples:]
+        if num_frames == 0:
+            return samples[:0]
+
+        frames = samples[:num_frames * self.frame_samples].reshape(num_frames, self.frame_samples)
+        kept = []
+        for frame, level in zip(frames, self.frame_levels(frames)):
+            if self.classify(level):
+                kept.extend(self.pre_roll)
+                self.pre_roll.clear()
+                kept.append(frame)
+                self.hangover = self.post_roll_frames
+                self.speech_frames += 1
+            elif self.hangover > 0:
+                kept.append(frame)
+                self.hangover -= 1
+            elif self.pre_roll_frames:
+                self.pre_roll.append(frame)
+
+        output = np.concatenate(kept) if kept else samples[:0]
+        self.kept_samples += len(output)
+        return output
+
+    @staticmethod
+    def frame_levels(frames: np.ndarray) -> np.ndarray:
+        scale = 1.0 / 32768.0 if frames.dtype.kind == 'i' else 1.0
+        return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1)) * scale
+
+    def classify(self, level: float) -> bool:
+        self.recent_levels.append(level)
+        if len(self.recent_levels) == self.noise_window_frames:
+            # Background louder than the threshold never reaches the non-speech branch below, so the quietest
+            # recent frames are allowed to raise the floor even while every frame counts as speech.
+            quiet_level = float(np.percentile(self.recent_levels, self.noise_percentile))
+            self.noise_floor = max(self.noise_floor, quiet_level)
+
+        if level > self.threshold:
+            return True
+        self.noise_floor = min(level, self.noise_floor * (1.0 + self.noise_floor_rise))
+        return False
+
+    def flush(self) -> np.ndarray:
+        remainder = self.remainder if self.remainder is not None else np.zeros(0, dtype=np.int16)
+        self.remainder = None
+        if self.hangover > 0 and len(remainder):
+            self.kept_samples += len(remainder)
+            return remainder
+        return remainder[:0]
@@ -1,7 +1,8 @@
 import threading
 import sys
 import time
-from typing import Optional, Dict, Tuple
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
 
 from src.audio_recorder import AudioRecorder
 from src.transcriber import Transcriber
@@ -10,28 +11,132 @@ from src.hotkey_handler import HotkeyHandler
 from src.tray_icon import TrayIcon
 from src.youtube_downloader import YouTubeDownloader
 from src.local_file_processor import LocalFileProcessor
+from src.streaming_transcriber import StreamingTranscriber
+from src.chunked_pipeline import ChunkedTranscriptionPipeline
+from src.memory_cache import MemoryCache
+from src.job_scheduler import JobCancelledError, JobScheduler, ScheduledTranscriber
+from src.batch_transcriber import BatchClient, BatchTranscriber
+from src.persistent_cache import PersistentCache, file_fingerprint, make_cache_key
+from src.resampler import StreamingResampler
+from src.model_pool import ModelPool, ModelRouter
+from src.continuous_dictation import ContinuousDictation, UtteranceResult
+from src.speculative_decoder import SpeculativeDecoder
+from src.decode_profiles import DecodeProfiles
+from src.prefetch import prefetch
+from src.metadata_cache import VideoMetadataCache
+from src.job_workspace import WorkspaceManager
+from src.youtube_batch import YouTubeBatchRunner
+from src import metrics
+from src.metrics import MetricsRecorder
 
 
 class VoicePasteApp:
-    def __init__(self, keep_model_loaded: bool = False, device_id: Optional[int] = None):
-        self.audio_recorder = AudioRecorder(device_id=device_id)
-        self.transcriber = Transcriber(keep_model_loaded=keep_model_loaded)
+    def __init__(
+        self,
+        keep_model_loaded: bool = False,
+        device_id: Optional[int] = None,
+        streaming: bool = False,
+        max_recording_seconds: Optional[float] = None,
+        persistent_cache: bool = True,
+        worker_slots: Optional[Dict[str, int]] = None,
+        batch_size: Optional[int] = None,
+        batch_wait_seconds: float = 0.2,
+        warm_up: bool = False,
+        model_router: Optional[ModelRouter] = None,
+        model_memory_budget_mb: Optional[int] = None,
+        vad_gate: bool = False,
+        continuous: bool = False,
+        continuous_output: str = 'append',
+        draft_model: Optional[str] = None,
+        decode_profiles: Optional[DecodeProfiles] = None,
+        metrics_log: Optional[str] = None,
+        prefetch_chunks: int = 32,
+        youtube_output_dir: str = "voicepaste_youtube",
+        download_workers: int = 2,
+        tmpfs_workspace: bool = False
+    ):
+        self.warm_up = warm_up
+        self.prefetch_chunks = prefetch_chunks
+        self.youtube_output_dir = Path(youtube_output_dir)
+        self.download_workers = download_workers
+        self.metrics = MetricsRecorder(Path(metrics_log) if metrics_log else None)
+        self.decode_profiles = decode_profiles or DecodeProfiles()
+        self.start_continuous = continuous
+        self.continuous_output = continuous_output
+        self.continuous_dictation: Optional[ContinuousDictation] = None
+        self.continuous_parts: List[str] = []
+        self.worker_slots = {'cuda': 1, 'cpu': 1}
+        self.worker_slots.update(worker_slots or {})
+        self.audio_recorder = AudioRecorder(
+            device_id=device_id,
+            max_duration_seconds=max_recording_seconds,
+            vad_gate=vad_gate
+        )
+        self.keep_model_loaded = keep_model_loaded
+        self.transcriber_workers = 1
+        self.router = model_router or ModelRouter()
+        self.model_pool = ModelPool(self._create_transcriber, memory_budget_mb=model_memory_budget_mb)
+        self.transcriber = self.model_pool.get(self.router.default_model)
+        # A model may end up on either device, so it gets enough workers for the larger slot count.
+        self.transcriber_workers = max(self.worker_slots.values())
+        self.transcriber.num_workers = self.transcriber_workers
+        self.scheduler = JobScheduler(worker_slots=self.worker_slots)
+        self.background_jobs: List[Union[ScheduledTranscriber, BatchClient]] = []
+        self.batch_size = batch_size
+        self.batch_wait_seconds = batch_wait_seconds
+        self.batch_transcribers: Dict[str, BatchTranscriber] = {}
+        self.draft_transcriber: Optional[Transcriber] = None
+        if draft_model:
+            self.draft_transcriber = Transcriber(
+                model_size=draft_model,
+                device="cpu",
+                compute_type="int8",
+                keep_model_loaded=True
+            )
+            self.draft_transcriber.decode_options['beam_size'] = 1
+        self.streaming_transcriber: Optional[StreamingTranscriber] = None
+        if streaming:
+            self.streaming_transcriber = StreamingTranscriber(
+                self._scheduled_transcriber(
+                    JobScheduler.PRIORITY_DICTATION,
+                    "dictation",
+                    self.router.route('mic'),
+                    timestamps=True
+                ),
+                source_sample_rate=self.audio_recorder.device_sample_rate,
+                target_sample_rate=self.audio_recorder.target_sample_rate
+            )
         self.clipboard_manager = ClipboardManager()
-        self.youtube_downloader = YouTubeDownloader()
+        self.metadata_cache: Optional[VideoMetadataCache] = None
+        if persistent_cache:
+            try:
+                self.metadata_cache = VideoMetadataCache()
+            except Exception as e:
+                print(f"Video metadata cache disabled: {e}")
+        self.workspaces = WorkspaceManager(use_tmpfs=tmpfs_workspace)
+        stale_workspaces = self.workspaces.cleanup_stale()
+        if stale_workspaces:
+            print(f"Removed {stale_workspaces} temp folder(s) left behind by earlier runs")
+        self.youtube_downloader = YouTubeDownloader(metadata_cache=self.metadata_cache, workspaces=self.workspaces)
         self.local_file_processor = LocalFileProcessor()
         self.hotkey_handler = HotkeyHandler(
             voice_callback=self.on_voice_hotkey,
             youtube_callback=self.on_youtube_hotkey,
-            file_callback=self.on_file_hotkey
+            file_callback=self.on_file_hotkey,
+            continuous_callback=self.toggle_continuous
         )
         self.is_running = True
         self.processing_lock = threading.Lock()
         self.shutdown_event = threading.Event()
         self.is_recording = False
 
-        self.transcription_cache: Dict[str, Tuple[str, float]] = {}
-        self.cache_ttl = 3600
-        self.cache_cleanup_timer: Optional[threading.Timer] = None
+        self.transcription_cache = MemoryCache(max_entries=128, max_bytes=64 * 1024 * 1024, ttl_seconds=3600)
+        self.persistent_cache: Optional[PersistentCache] = None
+        if persistent_cache:
+            try:
+                self.persistent_cache = PersistentCache()
+            except Exception as e:
+                print(f"Persistent cache disabled: {e}")
 
         self.tray_icon = TrayIcon(
             on_quit=self.quit,
@@ -39,7 +144,11 @@ class VoicePasteApp:
             on_toggle_keep_model=self.toggle_keep_model,
             get_model_status=self.get_model_status,
             on_transcribe_youtube=self.transcribe_youtube_from_dialog,
-            on_transcribe_file=self.transcribe_file_from_dialog
+            on_transcribe_file=self.transcribe_file_from_dialog,
+            get_queue_status=self.get_queue_status,
+            on_cancel_jobs=self.cancel_background_jobs,
+            on_toggle_continuous=self.toggle_continuous,
+            get_metrics_summary=self.metrics.summary_text
         )
 
     def start(self):
@@ -53,6 +162,7 @@ class VoicePasteApp:
             print("Please check your microphone connection.")
 
         print("Press Shift+V to start/stop recording...")
+        print("Press Shift+C to start/stop continuous dictation...")
         print("Press Shift+Y to transcribe YouTube video from clipboard...")
         print("Press Shift+F to transcribe audio/video file from clipboard...")
         print("Press Ctrl+C to quit")
@@ -63,6 +173,11 @@ class VoicePasteApp:
         print("Starting system tray icon...")
         self.tray_icon.start()
 
+        threading.Thread(target=self._warm_up_in_background, daemon=True).start()
+
+        if self.start_continuous:
+            self._start_continuous()
+
         try:
             while not self.shutdown_event.is_set():
                 self.shutdown_event.wait(timeout=0.5)
@@ -70,19 +185,60 @@ class VoicePasteApp:
             print("\nReceived Ctrl+C, shutting down...")
             self.quit()
 
-    def _try_use_cached_transcription(self, key: str) -> bool:
-        if key not in self.transcription_cache:
+    def _warm_up_in_background(self):
+        # noinspection PyBroadException
+        try:
+            StreamingResampler(self.audio_recorder.device_sample_rate, self.audio_recorder.target_sample_rate)
+            if self.warm_up:
+                print("Warming up transcription model in the background...")
+                self.model_pool.get(self.router.route('mic')).warm_up()
+        except Exception as e:
+            print(f"Warm-up failed: {e}")
+
+    def _create_transcriber(self, model_size: str) -> Transcriber:
+        return Transcriber(
+            model_size=model_size,
+            keep_model_loaded=self.keep_model_loaded,
+            num_workers=self.transcriber_workers
+        )
+
+    def _cache_key(self, source_fingerprint: str, model_size: str, job: str) -> str:
+        return make_cache_key(
+            source_fingerprint,
+            model_size,
+            None,
+            self.decode_profiles.options_for(job, timestamps=True)
+        )
+
+    def _try_use_cached_transcription(self, key: str, label: str) -> bool:
+        cached_text = self._lookup_cached_transcription(key)
+        if cached_text is None:
             return False
 
-        cached_text, timestamp = self.transcription_cache[key]
-        if time.time() - timestamp < self.cache_ttl:
-            print(f"Using cached transcription for: {key}")
-            self.clipboard_manager.copy_to_clipboard(cached_text)
-            print("Cached transcription copied to clipboard!")
-            return True
+        print(f"Using cached transcription for: {label}")
+        self.clipboard_manager.copy_to_clipboard(cached_text)
+        print("Cached transcription copied to clipboard!")
+        return True
+
+    def _get_cached_transcription(self, key: str) -> Optional[str]:
+        cached_text = self.transcription_cache.get(key)
+        if cached_text is not None or self.persistent_cache is None:
+            return cached_text
+
+        cached_text = self.persistent_cache.get(key)
+        if cached_text is not None:
+            self.transcription_cache.put(key, cached_text)
+        return cached_text
+
+    def _lookup_cached_transcription(self, key: str) -> Optional[str]:
+        cached_text = self._get_cached_transcription(key)
+        metrics.annotate(cache_hit=cached_text is not None)
+        return cached_text
 
-        del self.transcription_cache[key]
-        return False
+    def _store_transcription(self, key: str, text: str):
+        self.transcription_cache.put(key, text)
+        if self.persistent_cache is not None:
+            self.persistent_cache.put(key, text)
 
     def on_voice_hotkey(self, is_pressed: bool):
         if is_pressed:
@@ -96,47 +252,95 @@ class VoicePasteApp:
                 url = self.clipboard_manager.get_from_clipboard()
                 if not url or not isinstance(url, str):
                     print("No URL in clipboard")
+                    metrics.annotate(status="skipped")
                     return
 
                 url = url.strip()
-                if not self.youtube_downloader.is_youtube_url(url):
-                    print(f"Not a YouTube URL: {url}")
+                urls = self.youtube_downloader.parse_url_list(url)
+                if len(urls) > 1 or (urls and self.youtube_downloader.extract_playlist_id(urls[0])):
+                    metrics.annotate(status="batch")
+                    self._run_youtube_batch(urls)
                     return
 
-                if self._try_use_cached_transcription(url):
+                video_id = self.youtube_downloader.extract_video_id(url)
+                if video_id is None:
+                    print(f"Not a YouTube video URL: {url}")
+                    metrics.annotate(status="skipped")
                     return
 
-                print(f"Processing YouTube URL: {url}")
+                # Tracking parameters, timestamps and short links all map to one video ID and cache entry.
+                url = self.youtube_downloader.watch_url(video_id)
+                source_key = f"youtube:{video_id}"
+                metadata = self.youtube_downloader.probe(url)
+                if metadata is not None and metadata.is_live:
+                    print(f"Skipping live stream: {metadata.title}")
+                    metrics.annotate(status="skipped")
+                    return
+
+                duration = metadata.duration if metadata is not None else None
+                model_size = self.router.route('youtube', duration)
+                cache_key = self._cache_key(source_key, model_size, 'youtube')
+                if self._try_use_cached_transcription(cache_key, url):
+                    return
+
+                print(f"Processing YouTube video: {metadata.title if metadata else url}{self._describe_cost('youtube', duration)}")
                 self.tray_icon.update_status("downloading")
 
-                result = self.youtube_downloader.download_audio(url)
-                if not result:
+                stream = self.youtube_downloader.stream_audio(url)
+                if not stream:
                     print("Failed to download audio")
+                    metrics.annotate(status="failed")
                     self.tray_icon.update_status("idle")
                     return
 
-                audio_data, title = result
-                print(f"Transcribing: {title}")
-                self.tray_icon.update_status("processing")
-
-                text = self.transcriber.transcribe(audio_data)
+                chunks = prefetch(stream.chunks, self.prefetch_chunks)
+                try:
+                    duration = duration or stream.duration
+                    metrics.annotate(audio_seconds=duration)
+                    routed_size = self.router.route('youtube', duration)
+                    if routed_size != model_size:
+                        model_size = routed_size
+                        cache_key = self._cache_key(source_key, model_size, 'youtube')
+                        if self._try_use_cached_transcription(cache_key, url):
+                            self.tray_icon.update_status("idle")
+                            return
+
+                    print(f"Transcribing while downloading: {stream.title} (model: {model_size})")
+                    self.tray_icon.update_status("processing")
+
+                    # The stream keeps downloading and decoding into a bounded queue while windows are transcribed.
+                    segments = self._run_background_pipeline(
+                        "youtube",
+                        metrics.timed_iter('fetch', chunks),
+                        duration,
+                        model_size
+                    )
+                finally:
+                    chunks.close()
+                    self.youtube_downloader.discard(stream)
+
+                text = " ".join(segment.text for segment in segments).strip()
                 if text:
                     print(f"Transcription ({len(text)} chars): {text[:100]}...")
                     self.clipboard_manager.copy_to_clipboard(text)
                     print("Transcription copied to clipboard!")
 
-                    self.transcription_cache[url] = (text, time.time())
-                    self._schedule_cache_cleanup()
+                    self._store_transcription(cache_key, text)
                 else:
                     print("No transcription result")
 
                 self.tray_icon.update_status("idle")
 
+            except JobCancelledError:
+                print("YouTube transcription cancelled")
+                metrics.annotate(status="cancelled")
+                self.tray_icon.update_status("idle")
             except Exception as e:
                 print(f"YouTube transcription error: {e}")
+                metrics.annotate(status="failed")
                 self.tray_icon.update_status("idle")
 
-        threading.Thread(target=process_youtube, daemon=True).start()
+        threading.Thread(target=self._run_measured, args=('youtube', process_youtube), daemon=True).start()
 
     def on_file_hotkey(self):
         def process_file():
@@ -144,80 +348,224 @@ class VoicePasteApp:
                 file_path = self.clipboard_manager.get_file_path_from_clipboard()
                 if not file_path:
                     print("No file or file path in clipboard")
+                    metrics.annotate(status="skipped")
                     return
 
                 if not self.local_file_processor.is_valid_file_path(file_path):
                     print(f"Not a valid audio/video file: {file_path}")
+                    metrics.annotate(status="skipped")
                     return
 
-                if self._try_use_cached_transcription(file_path):
+                duration = self.local_file_processor.get_duration(file_path)
+                metrics.annotate(audio_seconds=duration)
+                model_size = self.router.route('file', duration)
+                cache_key = self._cache_key(file_fingerprint(file_path), model_size, 'file')
+                if self._try_use_cached_transcription(cache_key, file_path):
                     return
 
                 print(f"Processing file: {file_path}")
                 self.tray_icon.update_status("processing")
+                print(f"Transcribing: {Path(file_path).name} (model: {model_size})")
 
-                result = self.local_file_processor.process_file(file_path)
-                if not result:
-                    print("Failed to process file")
-                    self.tray_icon.update_status("idle")
-                    return
-
-                audio_data, filename = result
-                print(f"Transcribing: {filename}")
-
-                text = self.transcriber.transcribe(audio_data)
+                chunks = prefetch(self.local_file_processor.iter_chunks(file_path), self.prefetch_chunks)
+                try:
+                    segments = self._run_background_pipeline(
+                        "file",
+                        metrics.timed_iter('fetch', chunks),
+                        duration,
+                        model_size
+                    )
+                finally:
+                    chunks.close()
+                text = " ".join(segment.text for segment in segments).strip()
                 if text:
                     print(f"Transcription ({len(text)} chars): {text[:100]}...")
                     self.clipboard_manager.copy_to_clipboard(text)
                     print("Transcription copied to clipboard!")
 
-                    self.transcription_cache[file_path] = (text, time.time())
-                    self._schedule_cache_cleanup()
+                    self._store_transcription(cache_key, text)
                 else:
                     print("No transcription result")
 
                 self.tray_icon.update_status("idle")
 
+            except JobCancelledError:
+                print("File transcription cancelled")
+                metrics.annotate(status="cancelled")
+                self.tray_icon.update_status("idle")
             except Exception as e:
                 print(f"File transcription error: {e}")
+                metrics.annotate(status="failed")
                 self.tray_icon.update_status("idle")
 
-        threading.Thread(target=process_file, daemon=True).start()
+        threading.Thread(target=self._run_measured, args=('file', process_file), daemon=True).start()
+
+    def _describe_cost(self, job: str, duration: Optional[float]) -> str:
+        if not duration:
+            return ""
+        text = f" ({duration / 60:.1f} min"
+        mean_rtf = self.metrics.summary(job).get('mean_rtf')
+        if mean_rtf:
+            text += f", about {duration * mean_rtf:.0f}s to transcribe"
+        return text + ")"
+
+    def _run_youtube_batch(self, urls: List[str]):
+        model_size = self.router.route('youtube')
+        scheduled = self._scheduled_transcriber(JobScheduler.PRIORITY_BATCH, "youtube", model_size, timestamps=True)
+        runner = YouTubeBatchRunner(
+            self.youtube_downloader,
+            scheduled,
+            self.youtube_output_dir,
+            download_workers=self.download_workers,
+            prefetch_chunks=self.prefetch_chunks,
+            cache_key=lambda video_id: self._cache_key(f"youtube:{video_id}", model_size, 'youtube'),
+            cache_lookup=self._get_cached_transcription,
+            cache_store=self._store_transcription,
+            cache_lookup_segments=self.persistent_cache.get if self.persistent_cache is not None else None,
+            cache_store_segments=self.persistent_cache.put if self.persistent_cache is not None else None,
+            metrics_recorder=self.metrics
+        )
+
+        print(f"Processing {len(urls)} YouTube link(s) into {self.youtube_output_dir} (model: {model_size})")
+        self.tray_icon.update_status("processing")
+        self.background_jobs.append(scheduled)
+        try:
+            summary = runner.run(urls)
+        finally:
+            self.background_jobs.remove(scheduled)
+
+        if summary['done'] or summary['cached']:
+            self.clipboard_manager.copy_to_clipboard(str(self.youtube_output_dir.resolve()))
+            print("Output folder copied to clipboard!")
+        self.tray_icon.update_status("idle")
+
+    def _run_measured(self, name: str, fn: Callable[[], None]):
+        with self.metrics.job(name):
+            fn()
+
+    def _scheduled_transcriber(
+        self,
+        priority: int,
+        name: str,
+        model_size: str,
+        timestamps: bool = False
+    ) -> ScheduledTranscriber:
+        job = 'dictation' if name in ("dictation", "continuous") else name
+        options = self.decode_profiles.options_for(job, timestamps=timestamps)
+        return ScheduledTranscriber(self.model_pool.pooled(model_size, options), self.scheduler, priority, name)
+
+    def _batch_transcriber(self, model_size: str, job: str) -> BatchTranscriber:
+        key = f"{model_size}:{self.decode_profiles.profile_for(job)}"
+        if key not in self.batch_transcribers:
+            pooled = self.model_pool.pooled(model_size, self.decode_profiles.options_for(job, timestamps=True))
+            self.batch_transcribers[key] = BatchTranscriber(
+                pooled,
+                batch_size=self.batch_size,
+                max_wait_seconds=self.batch_wait_seconds,
+                executor=lambda fn: self.scheduler.run(
+                    fn,
+                    priority=JobScheduler.PRIORITY_INTERACTIVE,
+                    name="batch",
+                    device=pooled.preferred_device
+                )
+            )
+        return self.batch_transcribers[key]
+
+    def _run_background_pipeline(self, name: str, chunks, total_duration: Optional[float], model_size: str):
+        if self.batch_size:
+            scheduled = self._batch_transcriber(model_size, name).client()
+        else:
+            scheduled = self._scheduled_transcriber(JobScheduler.PRIORITY_INTERACTIVE, name, model_size, timestamps=True)
+        self.background_jobs.append(scheduled)
+        try:
+            pipeline = ChunkedTranscriptionPipeline(scheduled, progress_callback=self._report_progress)
+            return pipeline.run(chunks, total_duration=total_duration)
+        finally:
+            self.background_jobs.remove(scheduled)
+
+    def cancel_background_jobs(self):
+        for scheduled in list(self.background_jobs):
+            scheduled.cancel()
+        cancelled = self.scheduler.cancel_all(min_priority=JobScheduler.PRIORITY_INTERACTIVE)
+        print(f"Cancelled background jobs ({cancelled} queued chunks dropped)")
+
+    def get_queue_status(self) -> str:
+        status = self.scheduler.metrics()
+        return f"{status['running']} running, {status['queue_depth']} queued"
+
+    def _report_progress(self, processed_seconds: float, total_seconds: Optional[float]):
+        if total_seconds:
+            progress = min(processed_seconds / total_seconds, 1.0)
+            print(f"Progress: {progress:.0%} ({processed_seconds:.0f}s / {total_seconds:.0f}s)")
+            self.tray_icon.update_progress(progress)
+        else:
+            print(f"Progress: {processed_seconds:.0f}s transcribed")
 
     def _start_recording(self):
+        if self.continuous_dictation is not None:
+            print("Continuous dictation is active, press Shift+C to stop it first")
+            return
         with self.processing_lock:
             try:
                 print("Started recording...")
                 self.is_recording = True
                 self.tray_icon.update_status("recording")
+                if self.streaming_transcriber is not None:
+                    self.streaming_transcriber.start()
+                    self.audio_recorder.chunk_callback = self.streaming_transcriber.feed
                 self.audio_recorder.start_recording()
-                self.transcriber.preload_for_recording()
+                self.model_pool.preload(self.router.route('mic'))
+                if self.draft_transcriber is not None and self.streaming_transcriber is None:
+                    self.draft_transcriber.preload_for_recording()
             except RuntimeError as e:
                 print(f"Error starting recording: {e}")
                 self.is_recording = False
+                self._cancel_streaming()
                 self.tray_icon.update_status("idle")
             except Exception as e:
                 print(f"Unexpected error: {e}")
                 self.is_recording = False
+                self._cancel_streaming()
                 self.tray_icon.update_status("idle")
 
+    def _cancel_streaming(self):
+        self.audio_recorder.chunk_callback = None
+        if self.streaming_transcriber is not None:
+            self.streaming_transcriber.cancel()
+
     def _stop_recording(self):
+        if not self.is_recording:
+            return
         self.is_recording = False
 
         def process_audio():
-            with self.processing_lock:
+            released = time.perf_counter()
+            with self.metrics.job('dictation') as job, self.processing_lock:
                 print("Stopped recording. Processing...")
                 self.tray_icon.update_status("processing")
 
                 audio_data = self.audio_recorder.stop_recording()
+                self.audio_recorder.chunk_callback = None
 
                 if audio_data is None or len(audio_data) < 1600:
                     print("Recording too short, ignoring...")
+                    job.status = "skipped"
+                    self._cancel_streaming()
                     self.tray_icon.update_status("idle")
                     return
 
+                job.audio_seconds = len(audio_data) / self.audio_recorder.target_sample_rate
                 try:
-                    text = self.transcriber.transcribe(audio_data)
+                    if self.streaming_transcriber is not None:
+                        text = self.streaming_transcriber.finish()
+                    else:
+                        model_size = self.router.route('mic', job.audio_seconds)
+                        dictation = self._scheduled_transcriber(JobScheduler.PRIORITY_DICTATION, "dictation", model_size)
+                        if self.draft_transcriber is not None:
+                            self._speculative_transcribe(dictation, audio_data, released)
+                            self.tray_icon.update_status("idle")
+                            return
+                        text = dictation.transcribe(audio_data)
                     if text:
                         print(f"Transcription: {text}")
                         self.clipboard_manager.copy_to_clipboard(text)
@@ -226,31 +574,139 @@ class VoicePasteApp:
                         print("No transcription result")
                 except Exception as e:
                     print(f"Transcription error: {e}")
+                    job.status = "failed"
 
                 self.tray_icon.update_status("idle")
 
         threading.Thread(target=process_audio, daemon=True).start()
 
+    def _speculative_transcribe(self, dictation: ScheduledTranscriber, audio_data, released: float):
+        published = {}
+
+        def publish(text: str):
+            self.clipboard_manager.copy_to_clipboard(text)
+            published['pastes'] = self.hotkey_handler.paste_count
+            print(f"Copied to clipboard: {text}")
+
+        def can_replace(draft_text: str) -> bool:
+            return (
+                self.hotkey_handler.paste_count == published.get('pastes')
+                and self.clipboard_manager.get_from_clipboard() == draft_text
+            )
+
+        decoder = SpeculativeDecoder(self.draft_transcriber, dictation, publish, can_replace)
+        result = decoder.transcribe(audio_data, started=released)
+        if not result.final_text:
+            print("No transcription result")
+            return
+
+        first = f"{result.first_text_seconds:.2f}s" if result.first_text_seconds is not None else "n/a"
+        outcome = "draft replaced" if result.replaced else "draft kept"
+        print(f"First text after {first}, final text after {result.final_text_seconds:.2f}s ({outcome})")
+
     def toggle_recording(self):
         if self.is_recording:
             self._stop_recording()
         else:
             self._start_recording()
 
+    def toggle_continuous(self):
+        if self.continuous_dictation is not None:
+            self._stop_continuous()
+        else:
+            self._start_continuous()
+
+    def _start_continuous(self):
+        with self.processing_lock:
+            if self.is_recording or self.continuous_dictation is not None:
+                print("Stop the current recording before starting continuous dictation")
+                return
+            self.continuous_parts = []
+            continuous = ContinuousDictation(
+                self._transcribe_utterance,
+                self._on_utterance,
+                source_sample_rate=self.audio_recorder.device_sample_rate,
+                target_sample_rate=self.audio_recorder.target_sample_rate
+            )
+            try:
+                continuous.start()
+                self.audio_recorder.chunk_callback = continuous.feed
+                self.audio_recorder.start_recording(buffer_audio=False)
+            except Exception as e:
+                print(f"Error starting continuous dictation: {e}")
+                self.audio_recorder.chunk_callback = None
+                continuous.shutdown()
+                return
+
+            self.continuous_dictation = continuous
+            self.model_pool.preload(self.router.route('mic'))
+            self.tray_icon.set_continuous(True)
+            self.tray_icon.update_status("recording")
+            print("Continuous dictation started, each pause sends the last utterance to the model")
+
+    def _stop_continuous(self):
+        with self.processing_lock:
+            continuous = self.continuous_dictation
+            if continuous is None:
+                return
+            self.continuous_dictation = None
+            self.audio_recorder.stop_recording()
+            self.audio_recorder.chunk_callback = None
+            self.tray_icon.update_status("processing")
+
+            continuous.stop()
+            continuous.shutdown()
+            latency = continuous.latency_summary()
+            if latency['count']:
+                print(
+                    f"Continuous dictation stopped: {latency['count']} utterances, "
+                    f"latency mean {latency['mean']:.2f}s, p95 {latency['p95']:.2f}s, max {latency['max']:.2f}s"
+                )
+            else:
+                print("Continuous dictation stopped")
+            if continuous.dropped_utterances:
+                print(f"{continuous.dropped_utterances} utterances were dropped because transcription fell behind")
+
+            self.tray_icon.set_continuous(False)
+            self.tray_icon.update_status("idle")
+
+    def _transcribe_utterance(self, audio_data) -> str:
+        with self.metrics.job('continuous') as job:
+            job.audio_seconds = len(audio_data) / self.audio_recorder.target_sample_rate
+            model_size = self.router.route('mic', job.audio_seconds)
+            dictation = self._scheduled_transcriber(JobScheduler.PRIORITY_DICTATION, "continuous", model_size)
+            return dictation.transcribe(audio_data)
+
+    def _on_utterance(self, result: UtteranceResult):
+        print(
+            f"Utterance {result.index + 1}: {result.text} "
+            f"({result.audio_seconds:.1f}s audio, decoded in {result.transcribe_seconds:.2f}s, "
+            f"ready {result.latency_seconds:.2f}s after speech ended)"
+        )
+        if self.continuous_output == 'paste':
+            self.clipboard_manager.copy_to_clipboard(result.text + " ")
+            self.hotkey_handler.paste()
+        else:
+            # Utterances are kept as a list and joined only for the clipboard, never re-copied string by string.
+            if result.text:
+                self.continuous_parts.append(result.text)
+            self.clipboard_manager.copy_to_clipboard(" ".join(self.continuous_parts))
+
     def toggle_keep_model(self):
-        self.transcriber.keep_model_loaded = not self.transcriber.keep_model_loaded
-        status = "enabled" if self.transcriber.keep_model_loaded else "disabled"
+        self.keep_model_loaded = not self.keep_model_loaded
+        self.model_pool.set_keep_model_loaded(self.keep_model_loaded)
+        status = "enabled" if self.keep_model_loaded else "disabled"
         print(f"Keep model loaded: {status}")
 
     def get_model_status(self):
-        if self.transcriber.model is None:
+        locations = {"cuda": "VRAM (GPU)", "cpu": "RAM (CPU)"}
+        loaded = {size: device for size, device in self.model_pool.status().items() if device is not None}
+        if not loaded:
             return "Not loaded"
-        elif self.transcriber.current_device == "cuda":
-            return "VRAM (GPU)"
-        elif self.transcriber.current_device == "cpu":
-            return "RAM (CPU)"
+        elif len(loaded) == 1 and self.router.default_model in loaded:
+            return locations.get(loaded[self.router.default_model], "Unknown")
         else:
-            return "Unknown"
+            return ", ".join(f"{size} {locations.get(device, 'Unknown')}" for size, device in loaded.items())
 
     def transcribe_youtube_from_dialog(self):
         def process():
@@ -371,38 +827,25 @@ class VoicePasteApp:
 
         threading.Thread(target=process, daemon=True).start()
 
-    def _schedule_cache_cleanup(self):
-        if self.cache_cleanup_timer:
-            self.cache_cleanup_timer.cancel()
-
-        self.cache_cleanup_timer = threading.Timer(self.cache_ttl, self._cleanup_cache)
-        self.cache_cleanup_timer.daemon = True
-        self.cache_cleanup_timer.start()
-
-    def _cleanup_cache(self):
-        current_time = time.time()
-        urls_to_remove = []
-
-        for url, (_, timestamp) in self.transcription_cache.items():
-            if current_time - timestamp >= self.cache_ttl:
-                urls_to_remove.append(url)
-
-        for url in urls_to_remove:
-            del self.transcription_cache[url]
-            print(f"Removed cached transcription for: {url}")
-
-        if self.transcription_cache:
-            self._schedule_cache_cleanup()
-
     def quit(self):
         print("Shutting down...")
         self.is_running = False
-        if self.cache_cleanup_timer:
-            self.cache_cleanup_timer.cancel()
         self.hotkey_handler.stop()
-        self.transcriber.shutdown()
+        if self.continuous_dictation is not None:
+            self.continuous_dictation.shutdown()
+        for batch_transcriber in self.batch_transcribers.values():
+            batch_transcriber.shutdown()
+        self.scheduler.shutdown()
+        self.model_pool.shutdown()
+        if self.draft_transcriber is not None:
+            self.draft_transcriber.shutdown()
         self.youtube_downloader.cleanup()
         self.local_file_processor.cleanup()
+        if self.persistent_cache is not None:
+            self.persistent_cache.close()
+        if self.metadata_cache is not None:
+            self.metadata_cache.close()
+        self.metrics.close()
         self.tray_icon.stop()
         self.shutdown_event.set()
         sys.exit(0)
@@ -0,0 +1,209 @@
+import json
+import re
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src import metrics
+from src.batch_runner import OUTPUT_FORMATS, BatchManifest, write_outputs
+from src.chunked_pipeline import ChunkedTranscriptionPipeline
+from src.job_scheduler import JobCancelledError
+from src.metrics import MetricsRecorder
+from src.prefetch import prefetch
+from src.transcriber import TranscriptSegment
+from src.youtube_downloader import AudioStream, VideoEntry, YouTubeDownloader
+
+TIMESTAMPED_FORMATS = ('json', 'srt')
+
+
+def output_name(entry: VideoEntry, title: Optional[str]) -> str:
+    safe_title = re.sub(r'[\\/:*?"<>|\s]+', ' ', title or entry.title or "").strip()[:80]
+    return f"{safe_title} [{entry.video_id}]" if safe_title else entry.video_id
+
+
+class YouTubeBatchRunner:
+    def __init__(
+        self,
+        downloader: YouTubeDownloader,
+        transcriber,
+        output_dir: Path,
+        manifest_path: Optional[Path] = None,
+        output_formats: Iterable[str] = OUTPUT_FORMATS,
+        download_workers: int = 2,
+        prefetch_chunks: int = 32,
+        language: Optional[str] = None,
+        force: bool = False,
+        cache_key: Optional[Callable[[str], str]] = None,
+        cache_lookup: Optional[Callable[[str], Optional[str]]] = None,
+        cache_store: Optional[Callable[[str, str], None]] = None,
+        cache_lookup_segments: Optional[Callable[[str], Optional[str]]] = None,
+        cache_store_segments: Optional[Callable[[str, str], None]] = None,
+        metrics_recorder: Optional[MetricsRecorder] = None,
+        on_result: Optional[Callable[[VideoEntry, str], None]] = None,
+        executor_factory: Callable[[int], Executor] = ThreadPoolExecutor
+    ):
+        self.output_formats = list(output_formats)
+        for output_format in self.output_formats:
+            if output_format not in OUTPUT_FORMATS:
+                raise ValueError(f"Unsupported output format: {output_format}")
+
+        self.downloader = downloader
+        self.transcriber = transcriber
+        self.output_dir = Path(output_dir)
+        self.manifest = BatchManifest(manifest_path or self.output_dir / "manifest.json")
+        self.download_workers = max(1, download_workers)
+        self.prefetch_chunks = prefetch_chunks
+        self.language = language
+        self.force = force
+        self.cache_key = cache_key or (lambda video_id: f"youtube:{video_id}")
+        self.cache_lookup = cache_lookup
+        self.cache_store = cache_store
+        # Segment lists are much larger than the joined text, so callers can keep them out of in-memory caches.
+        self.cache_lookup_segments = cache_lookup_segments
+        self.cache_store_segments = cache_store_segments
+        self.metrics = metrics_recorder or MetricsRecorder()
+        self.on_result = on_result
+        self.executor_factory = executor_factory
+
+    def run(self, urls: Iterable[str]) -> Dict[str, int]:
+        summary = {'done': 0, 'cached': 0, 'skipped': 0, 'failed': 0}
+        entries = self.downloader.list_videos(urls)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        pending = []
+        for entry in entries:
+            if not self.force and self.manifest.is_done(self._manifest_key(entry), entry.video_id):
+                print(f"Skipping (already transcribed): {entry.video_id}")
+                summary['skipped'] += 1
+            elif self._write_cached(entry):
+                summary['cached'] += 1
+            else:
+                pending.append(entry)
+
+        if not pending:
+            return summary
+
+        print(f"Transcribing {len(pending)} video(s) with {self.download_workers} download worker(s)...")
+        try:
+            with self.executor_factory(self.download_workers) as executor:
+                queued = deque(pending)
+                in_flight = deque()
+                try:
+                    while queued or in_flight:
+                        # Each open stream buffers at most prefetch_chunks decoded chunks, so memory is bounded by
+                        # audio seconds rather than by whole videos.
+                        while queued and len(in_flight) <= self.download_workers:
+                            entry = queued.popleft()
+                            in_flight.append((entry, executor.submit(self._open_stream, entry.url)))
+
+                        entry, future = in_flight.popleft()
+                        status = self._transcribe_entry(entry, future)
+                        summary[status] += 1
+                finally:
+                    for _, future in in_flight:
+                        if future.exception() is None:
+                            self._close_stream(future.result())
+        except JobCancelledError:
+            self._print_summary("cancelled", summary)
+            raise
+
+        self._print_summary("finished", summary)
+        return summary
+
+    @staticmethod
+    def _print_summary(outcome: str, summary: Dict[str, int]):
+        print(
+            f"YouTube batch {outcome}: {summary['done']} done, {summary['cached']} from cache, "
+            f"{summary['skipped']} skipped, {summary['failed']} failed"
+        )
+
+    def _write_cached(self, entry: VideoEntry) -> bool:
+        if self.force:
+            return False
+
+        key = self.cache_key(entry.video_id)
+        if any(output_format in TIMESTAMPED_FORMATS for output_format in self.output_formats):
+            # Subtitles and JSON need the real segments; a text-only entry would become one cue for the whole video.
+            if self.cache_lookup_segments is None:
+                return False
+            cached = self.cache_lookup_segments(f"{key}:segments")
+            if cached is None:
+                return False
+            try:
+                segments = [
+                    TranscriptSegment(float(start), float(end), str(text)) for start, end, text in json.loads(cached)
+                ]
+            except (ValueError, TypeError):
+                return False
+            text = " ".join(segment.text for segment in segments).strip()
+        else:
+            text = self.cache_lookup(key) if self.cache_lookup is not None else None
+            if text is None:
+                return False
+            segments = [TranscriptSegment(0.0, float(entry.duration or 0.0), text)]
+
+        print(f"Using cached transcription for: {entry.video_id}")
+        self._finish(entry, entry.title, segments, text)
+        return True
+
+    def _open_stream(self, url: str) -> Optional[Tuple[AudioStream, Iterator]]:
+        stream = self.downloader.stream_audio(url)
+        if stream is None:
+            return None
+        # Decoding starts right away in the background but stops once the prefetch queue is full.
+        return stream, prefetch(stream.chunks, self.prefetch_chunks)
+
+    def _close_stream(self, opened: Optional[Tuple[AudioStream, Iterator]]):
+        if opened is None:
+            return
+        stream, chunks = opened
+        chunks.close()
+        self.downloader.discard(stream)
+
+    def _transcribe_entry(self, entry: VideoEntry, future) -> str:
+        try:
+            with self.metrics.job('youtube') as job:
+                with metrics.stage('fetch'):
+                    opened = future.result()
+                if opened is None:
+                    raise RuntimeError("could not download audio")
+
+                stream, chunks = opened
+                try:
+                    job.audio_seconds = stream.duration or entry.duration
+                    length = f" ({job.audio_seconds:.1f}s)" if job.audio_seconds else ""
+                    print(f"Transcribing: {stream.title}{length}")
+                    pipeline = ChunkedTranscriptionPipeline(self.transcriber, language=self.language)
+                    segments = pipeline.run(metrics.timed_iter('fetch', chunks), total_duration=job.audio_seconds)
+                finally:
+                    self._close_stream(opened)
+
+                text = " ".join(segment.text for segment in segments).strip()
+                with metrics.stage('write'):
+                    self._finish(entry, stream.title, segments, text)
+
+            if text:
+                key = self.cache_key(entry.video_id)
+                if self.cache_store is not None:
+                    self.cache_store(key, text)
+                if self.cache_store_segments is not None:
+                    self.cache_store_segments(f"{key}:segments", json.dumps([list(segment) for segment in segments]))
+            return 'done'
+        except JobCancelledError:
+            raise
+        except Exception as e:
+            print(f"Failed to transcribe {entry.url}: {e}")
+            self.manifest.mark(self._manifest_key(entry), entry.video_id, 'failed', error=str(e))
+            return 'failed'
+
+    def _finish(self, entry: VideoEntry, title: Optional[str], segments: List[TranscriptSegment], text: str):
+        source = Path(entry.video_id)
+        outputs = write_outputs(source, segments, self.output_formats, self.output_dir / output_name(entry, title))
+        self.manifest.mark(self._manifest_key(entry), entry.video_id, 'done', outputs)
+        if self.on_result is not None:
+            self.on_result(entry, text)
+
+    @staticmethod
+    def _manifest_key(entry: VideoEntry) -> str:
+        return f"youtube:{entry.video_id}"
@@ -1,15 +1,55 @@
 import re
-import tempfile
 import numpy as np
-from pathlib import Path
-import yt_dlp
-from scipy.io import wavfile
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+
+from src import metrics
+from src.ffmpeg_decoder import FFmpegDecoder
+from src.job_workspace import JobWorkspace, WorkspaceManager
+from src.metadata_cache import VideoMetadata, VideoMetadataCache
+
+
+class AudioStream(NamedTuple):
+    title: str
+    duration: Optional[float]
+    chunks: Iterator[np.ndarray]
+    workspace: Optional[JobWorkspace] = None
+
+
+class ResolvedSource(NamedTuple):
+    info: Dict[str, Any]
+    source: str
+    input_options: List[str]
+    workspace: Optional[JobWorkspace] = None
+    feed: Optional[Iterable[bytes]] = None
+
+
+class VideoEntry(NamedTuple):
+    video_id: str
+    url: str
+    title: Optional[str] = None
+    duration: Optional[float] = None
 
 
 class YouTubeDownloader:
-    def __init__(self):
-        self.temp_dir = Path(tempfile.gettempdir())
+    # Smallest audio-only stream that still carries speech well; Whisper only needs 16 kHz mono.
+    AUDIO_FORMAT = 'worstaudio[abr>=32]/bestaudio/worst'
+    STREAM_PROTOCOLS = ('http', 'https', 'm3u8', 'm3u8_native')
+    FRAGMENT_RETRIES = 3
+    VIDEO_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{11}$')
+    VIDEO_PATH_PREFIXES = ('shorts', 'embed', 'live', 'v')
+
+    def __init__(
+        self,
+        ydl_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        decoder: Optional[FFmpegDecoder] = None,
+        metadata_cache: Optional[VideoMetadataCache] = None,
+        workspaces: Optional[WorkspaceManager] = None
+    ):
+        self.workspaces = workspaces or WorkspaceManager()
+        self.ydl_factory = ydl_factory
+        self.decoder = decoder or FFmpegDecoder(sample_rate=16000)
+        self.metadata_cache = metadata_cache
 
     @staticmethod
     def is_youtube_url(url: str) -> bool:
@@ -19,84 +59,273 @@ class YouTubeDownloader:
         ]
         return any(re.match(pattern, url) for pattern in youtube_patterns)
 
-    def download_audio(self, url: str) -> Optional[Tuple[np.ndarray, str]]:
-        if not self.is_youtube_url(url):
-            print(f"URL is not a YouTube link: {url}")
+    @classmethod
+    def extract_video_id(cls, url: str) -> Optional[str]:
+        if not url or not cls.is_youtube_url(url.strip()):
+            return None
+
+        parsed = urlparse(url.strip() if '://' in url else f"https://{url.strip()}")
+        host = parsed.netloc.lower().split(':')[0]
+        parts = [part for part in parsed.path.split('/') if part]
+        if host.endswith('youtu.be'):
+            candidate = parts[0] if parts else None
+        elif parts[:1] == ['watch']:
+            candidate = parse_qs(parsed.query).get('v', [None])[0]
+        elif len(parts) >= 2 and parts[0] in cls.VIDEO_PATH_PREFIXES:
+            candidate = parts[1]
+        else:
+            candidate = None
+        return candidate if candidate and cls.VIDEO_ID_PATTERN.match(candidate) else None
+
+    @classmethod
+    def extract_playlist_id(cls, url: str) -> Optional[str]:
+        if not url or not cls.is_youtube_url(url.strip()):
+            return None
+
+        parsed = urlparse(url.strip() if '://' in url else f"https://{url.strip()}")
+        playlist_id = parse_qs(parsed.query).get('list', [None])[0]
+        # A video opened from a playlist (watch?v=...&list=...) still means that one video.
+        if playlist_id and cls.extract_video_id(url) is None:
+            return playlist_id
+        return None
+
+    @staticmethod
+    def watch_url(video_id: str) -> str:
+        return f"https://www.youtube.com/watch?v={video_id}"
+
+    @classmethod
+    def canonical_url(cls, url: str) -> Optional[str]:
+        video_id = cls.extract_video_id(url)
+        return cls.watch_url(video_id) if video_id else None
+
+    def probe(self, url: str) -> Optional[VideoMetadata]:
+        video_id = self.extract_video_id(url)
+        if video_id is None:
             return None
 
-        temp_audio_path = self.temp_dir / 'voicepaste_yt_audio.wav'
+        if self.metadata_cache is not None:
+            cached = self.metadata_cache.get(video_id)
+            if cached is not None:
+                return cached
 
-        # noinspection PyBroadException
         try:
-            if temp_audio_path.exists():
-                temp_audio_path.unlink()
-        except Exception:
-            pass
-
-        ydl_opts = {
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'wav',
-            }],
-            'outtmpl': str(temp_audio_path.with_suffix('')),
+            with self._create_ydl(self._base_options()) as ydl:
+                with metrics.stage('fetch'):
+                    # process=False skips format selection; title, duration and live status are already known.
+                    info = ydl.extract_info(self.watch_url(video_id), download=False, process=False)
+        except Exception as e:
+            print(f"Could not read video metadata: {e}")
+            return None
+
+        metadata = VideoMetadata(video_id, info.get('title') or 'Unknown', info.get('duration'), info.get('live_status'))
+        if self.metadata_cache is not None:
+            self.metadata_cache.put(metadata)
+        return metadata
+
+    @staticmethod
+    def parse_url_list(text: str) -> List[str]:
+        urls = []
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                urls.extend(line.split())
+        return urls
+
+    def list_videos(self, urls: Iterable[str]) -> List[VideoEntry]:
+        entries: List[VideoEntry] = []
+        seen = set()
+        for url in urls:
+            playlist_id = self.extract_playlist_id(url)
+            if playlist_id:
+                found = self._playlist_entries(url)
+                print(f"Playlist {playlist_id}: {len(found)} video(s)")
+            else:
+                video_id = self.extract_video_id(url)
+                if video_id is None:
+                    print(f"Skipping, not a YouTube video or playlist: {url}")
+                    continue
+                found = [VideoEntry(video_id, self.watch_url(video_id))]
+
+            for entry in found:
+                if entry.video_id not in seen:
+                    seen.add(entry.video_id)
+                    entries.append(entry)
+        return entries
+
+    def download_audio(self, url: str) -> Optional[Tuple[np.ndarray, str]]:
+        resolved = self._resolve_source(url)
+        if resolved is None:
+            return None
+
+        info, source, input_options, workspace, feed = resolved
+        title = info.get('title', 'Unknown')
+        try:
+            with metrics.stage('convert'):
+                audio = self.decoder.decode(source, info.get('duration'), input_options, feed)
+
+            if len(audio) == 0:
+                print("No audio decoded from stream")
+                return None
+
+            print(f"Audio decoded: {len(audio)/self.decoder.sample_rate:.1f}s @ {self.decoder.sample_rate}Hz")
+            return audio, title
+
+        except Exception as e:
+            print(f"Error downloading YouTube audio: {e}")
+            return None
+        finally:
+            self._close_workspace(workspace)
+
+    def stream_audio(self, url: str, chunk_seconds: Optional[float] = None) -> Optional[AudioStream]:
+        resolved = self._resolve_source(url)
+        if resolved is None:
+            return None
+
+        info, source, input_options, workspace, feed = resolved
+        return AudioStream(
+            info.get('title', 'Unknown'),
+            info.get('duration'),
+            self._iter_stream(source, input_options, chunk_seconds, workspace, feed),
+            workspace
+        )
+
+    def discard(self, stream: AudioStream):
+        self._close_workspace(stream.workspace)
+
+    def cleanup(self):
+        self.workspaces.close_all()
+
+    def _base_options(self) -> Dict[str, Any]:
+        return {
             'quiet': True,
             'no_warnings': True,
             'cookiesfrombrowser': ('firefox',),
             'js_runtimes': {'node': {}},
         }
 
+    def _playlist_entries(self, url: str) -> List[VideoEntry]:
+        ydl_opts = self._base_options()
+        ydl_opts['extract_flat'] = 'in_playlist'
         try:
-            print(f"Downloading audio from YouTube: {url}")
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                title = info.get('title', 'Unknown')
-                print(f"Downloaded: {title}")
-
-            if not temp_audio_path.exists():
-                print(f"Audio file not found: {temp_audio_path}")
-                return None
+            with self._create_ydl(ydl_opts) as ydl:
+                with metrics.stage('fetch'):
+                    info = ydl.extract_info(url, download=False)
+        except Exception as e:
+            print(f"Error listing YouTube playlist: {e}")
+            return []
 
-            print("Converting audio to 16kHz mono...")
-            sample_rate, audio = wavfile.read(str(temp_audio_path))
+        entries = []
+        for entry in info.get('entries') or []:
+            video_id = (entry or {}).get('id')
+            if video_id and self.VIDEO_ID_PATTERN.match(video_id):
+                entries.append(VideoEntry(video_id, self.watch_url(video_id), entry.get('title'), entry.get('duration')))
+        return entries
 
-            if audio.dtype == np.int16:
-                audio = audio.astype(np.float32) / 32768.0
-            elif audio.dtype == np.int32:
-                audio = audio.astype(np.float32) / 2147483648.0
+    def _resolve_source(self, url: str) -> Optional[ResolvedSource]:
+        if not self.is_youtube_url(url):
+            print(f"URL is not a YouTube link: {url}")
+            return None
 
-            if len(audio.shape) > 1:
-                audio = audio.mean(axis=1)
+        ydl_opts = self._base_options()
+        ydl_opts['format'] = self.AUDIO_FORMAT
 
-            if sample_rate != 16000:
-                from scipy.signal import resample
-                num_samples = int(len(audio) * 16000 / sample_rate)
-                audio = resample(audio, num_samples)
-                sample_rate = 16000
+        workspace = None
+        try:
+            print(f"Fetching audio stream from YouTube: {url}")
+            with self._create_ydl(ydl_opts) as ydl:
+                with metrics.stage('fetch'):
+                    info = ydl.extract_info(url, download=False)
+            print(f"Selected stream for {info.get('title', 'Unknown')}: {self._describe_stream(info)}")
+
+            if self._is_streamable(info):
+                return ResolvedSource(info, info['url'], self._input_options(info))
 
-            # noinspection PyBroadException
-            try:
-                temp_audio_path.unlink()
-            except Exception:
-                pass
+            if self._fragment_urls(info):
+                # DASH fragments are fetched one by one and piped into FFmpeg, so decoding starts with the first one.
+                return ResolvedSource(info, 'pipe:0', [], feed=self._iter_fragments(info))
 
-            print(f"Audio converted: {len(audio)/sample_rate:.1f}s @ {sample_rate}Hz")
-            return audio.astype(np.float32), title
+            # Anything else is downloaded into a workspace owned by this job only before decoding.
+            workspace = self.workspaces.create("youtube")
+            ydl_opts['outtmpl'] = str(workspace.file('audio.%(ext)s'))
+            with self._create_ydl(ydl_opts) as ydl:
+                temp_path = ydl.prepare_filename(info)
+                with metrics.stage('fetch'):
+                    ydl.process_info(info)
+            return ResolvedSource(info, temp_path, [], workspace)
 
         except Exception as e:
             print(f"Error downloading YouTube audio: {e}")
-            # noinspection PyBroadException
-            try:
-                if temp_audio_path.exists():
-                    temp_audio_path.unlink()
-            except Exception:
-                pass
+            self._close_workspace(workspace)
             return None
 
-    def cleanup(self):
-        temp_audio_path = self.temp_dir / 'voicepaste_yt_audio.wav'
-        # noinspection PyBroadException
+    def _iter_stream(
+        self,
+        source: str,
+        input_options: List[str],
+        chunk_seconds: Optional[float],
+        workspace: Optional[JobWorkspace],
+        feed: Optional[Iterable[bytes]] = None
+    ) -> Iterator[np.ndarray]:
         try:
-            if temp_audio_path.exists():
-                temp_audio_path.unlink()
-        except Exception:
-            pass
+            yield from self.decoder.iter_chunks(source, chunk_seconds, input_options, feed)
+        finally:
+            self._close_workspace(workspace)
+
+    @staticmethod
+    def _fragment_urls(info: Dict[str, Any]) -> List[str]:
+        base_url = info.get('fragment_base_url')
+        urls = []
+        for fragment in info.get('fragments') or []:
+            if fragment.get('url'):
+                urls.append(fragment['url'])
+            elif base_url and fragment.get('path'):
+                urls.append(urljoin(base_url, fragment['path']))
+            else:
+                return []
+        return urls
+
+    def _iter_fragments(self, info: Dict[str, Any]) -> Iterator[bytes]:
+        with self._create_ydl(self._base_options()) as ydl:
+            for url in self._fragment_urls(info):
+                for attempt in range(self.FRAGMENT_RETRIES):
+                    try:
+                        # Whole fragments only, so a retry never repeats bytes FFmpeg has already read.
+                        data = ydl.urlopen(url).read()
+                        break
+                    except Exception as e:
+                        if attempt + 1 == self.FRAGMENT_RETRIES:
+                            raise RuntimeError(f"Could not fetch stream fragment: {e}")
+                yield data
+
+    @staticmethod
+    def _close_workspace(workspace: Optional[JobWorkspace]):
+        if workspace is not None:
+            workspace.close()
+
+    def _create_ydl(self, options: Dict[str, Any]):
+        if self.ydl_factory is not None:
+            return self.ydl_factory(options)
+
+        import yt_dlp
+        return yt_dlp.YoutubeDL(options)
+
+    def _is_streamable(self, info: Dict[str, Any]) -> bool:
+        return bool(info.get('url')) and info.get('protocol') in (None, *self.STREAM_PROTOCOLS)
+
+    @staticmethod
+    def _input_options(info: Dict[str, Any]) -> List[str]:
+        if not str(info.get('url', '')).startswith('http'):
+            return []
+
+        options = ['-reconnect', '1', '-reconnect_streamed', '1', '-reconnect_delay_max', '5']
+        headers = info.get('http_headers') or {}
+        if headers:
+            options += ['-headers', ''.join(f"{name}: {value}\r\n" for name, value in headers.items())]
+        return options
+
+    @staticmethod
+    def _describe_stream(info: Dict[str, Any]) -> str:
+        details = [info.get('format_id'), info.get('acodec'), info.get('ext')]
+        if info.get('abr'):
+            details.append(f"{info['abr']:.0f}kbps")
+        return " ".join(str(detail) for detail in details if detail and detail != 'none') or "default"
@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tiny_model():
+    # noinspection PyBroadException
+    try:
+        from faster_whisper.utils import download_model
+
+        return download_model("tiny")
+    except Exception as e:
+        pytest.skip(f"Tiny Whisper model is not available: {e}")
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from src.audio_buffer import AudioBuffer
+
+
+def _pcm16(values) -> bytes:
+    return np.asarray(values, dtype=np.int16).tobytes()
+
+
+def test_audio_buffer_initialization():
+    buffer = AudioBuffer(16000, initial_seconds=1.0)
+    assert len(buffer) == 0
+    assert buffer.capacity == 16000
+    assert buffer.max_samples is None
+    assert buffer.dropped_samples == 0
+
+
+def test_audio_buffer_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        AudioBuffer(16000, overflow_policy='explode')
+
+
+def test_write_pcm16_converts_in_place():
+    buffer = AudioBuffer(16000, initial_seconds=1.0)
+    buffer.write_pcm16(_pcm16([0, 16384, -32768]))
+    view = buffer.view()
+    assert view.dtype == np.float32
+    np.testing.assert_allclose(view, [0.0, 0.5, -1.0])
+
+
+def test_view_shares_storage_with_buffer():
+    buffer = AudioBuffer(16000, initial_seconds=1.0)
+    buffer.write_pcm16(_pcm16([1, 2, 3]))
+    assert np.shares_memory(buffer.view(), buffer.data)
+
+
+def test_buffer_grows_until_max():
+    buffer = AudioBuffer(10, initial_seconds=1.0, max_seconds=3.0)
+    buffer.write(np.ones(25, dtype=np.float32))
+    assert buffer.capacity == 30
+    assert len(buffer) == 25
+    assert buffer.dropped_samples == 0
+
+
+def test_drop_newest_keeps_first_samples():
+    buffer = AudioBuffer(10, initial_seconds=1.0, max_seconds=1.0, overflow_policy='drop_newest')
+    buffer.write(np.arange(8, dtype=np.float32))
+    buffer.write(np.arange(8, 16, dtype=np.float32))
+    np.testing.assert_array_equal(buffer.view(), np.arange(10))
+    assert buffer.dropped_samples == 6
+
+
+def test_drop_oldest_keeps_latest_samples():
+    buffer = AudioBuffer(10, initial_seconds=1.0, max_seconds=1.0, overflow_policy='drop_oldest')
+    for start in range(0, 25, 5):
+        buffer.write(np.arange(start, start + 5, dtype=np.float32))
+    np.testing.assert_array_equal(buffer.view(), np.arange(15, 25))
+    assert buffer.dropped_samples == 15
+
+
+def test_drop_oldest_with_write_larger_than_capacity():
+    buffer = AudioBuffer(10, initial_seconds=1.0, max_seconds=1.0)
+    buffer.write(np.arange(3, dtype=np.float32))
+    buffer.write(np.arange(100, 125, dtype=np.float32))
+    np.testing.assert_array_equal(buffer.view(), np.arange(115, 125))
+    assert buffer.dropped_samples == 18
+
+
+def test_reset_allocates_fresh_storage():
+    buffer = AudioBuffer(10, initial_seconds=1.0)
+    buffer.write(np.ones(5, dtype=np.float32))
+    previous = buffer.view()
+    buffer.reset()
+    buffer.write(np.zeros(5, dtype=np.float32))
+    assert len(buffer) == 5
+    np.testing.assert_array_equal(previous, np.ones(5))
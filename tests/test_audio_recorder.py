@@ -8,7 +8,7 @@ def test_audio_recorder_initialization():
     recorder = AudioRecorder(target_sample_rate=16000)
     assert recorder.target_sample_rate == 16000
     assert recorder.is_recording is False
-    assert recorder.audio_data == []
+    assert len(recorder.audio_buffer) == 0
     recorder.pyaudio_instance.terminate()
 
 
@@ -19,6 +19,35 @@ def test_audio_recorder_initialization_with_device():
     recorder.pyaudio_instance.terminate()
 
 
+def test_audio_recorder_initialization_with_max_duration():
+    recorder = AudioRecorder(target_sample_rate=16000, max_duration_seconds=10, overflow_policy='drop_newest')
+    assert recorder.audio_buffer.max_samples == 10 * recorder.device_sample_rate
+    assert recorder.audio_buffer.overflow_policy == 'drop_newest'
+    recorder.pyaudio_instance.terminate()
+
+
+def test_audio_recorder_initialization_with_vad_gate():
+    recorder = AudioRecorder(target_sample_rate=16000, vad_gate=True)
+    assert recorder.vad is not None
+    assert recorder.vad.sample_rate == recorder.device_sample_rate
+    assert AudioRecorder(target_sample_rate=16000).vad is None
+    recorder.pyaudio_instance.terminate()
+
+
+def test_unbuffered_recording_only_forwards_chunks():
+    recorder = AudioRecorder(target_sample_rate=16000)
+    chunks = []
+    recorder.chunk_callback = chunks.append
+    recorder.is_recording = True
+    recorder.buffer_audio = False
+
+    recorder._audio_callback(np.zeros(1024, dtype=np.int16).tobytes(), 1024, None, None)
+
+    assert len(chunks) == 1
+    assert len(recorder.audio_buffer) == 0
+    recorder.pyaudio_instance.terminate()
+
+
 def test_audio_recorder_device_info():
     recorder = AudioRecorder(target_sample_rate=16000)
     device_info = recorder.get_device_info()
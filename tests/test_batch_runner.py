@@ -0,0 +1,169 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.batch_runner import BatchRunner, expand_inputs, format_timestamp, write_outputs
+from src.batch_transcriber import BatchTranscriber
+from src.transcriber import TranscriptSegment
+
+
+class FakeTranscriber:
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe_segments(self, audio_data, language=None):
+        self.calls += 1
+        return [TranscriptSegment(0.0, len(audio_data) / 16000, f"value {audio_data[0]:.1f}")]
+
+
+def fake_decode(path):
+    content = open(path, 'rb').read()
+    if content == b'broken':
+        return None
+    return np.full(16000, float(content.decode()), dtype=np.float32)
+
+
+def _make_files(directory, values):
+    paths = []
+    for name, value in values.items():
+        path = directory / name
+        path.write_bytes(value.encode())
+        paths.append(path)
+    return paths
+
+
+def _runner(transcriber, tmp_path, **kwargs):
+    return BatchRunner(
+        transcriber,
+        manifest_path=tmp_path / "manifest.json",
+        decode_fn=fake_decode,
+        executor_factory=ThreadPoolExecutor,
+        **kwargs
+    )
+
+
+def test_expand_inputs_handles_files_directories_and_globs(tmp_path):
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    _make_files(tmp_path, {"a.mp3": "0.1", "notes.txt": "x"})
+    _make_files(nested, {"b.wav": "0.2", "c.mp4": "0.3"})
+
+    from_dir = expand_inputs([str(tmp_path)])
+    assert [path.name for path in from_dir] == ["a.mp3", "b.wav", "c.mp4"]
+
+    from_glob = expand_inputs([str(tmp_path / "**" / "*.wav"), str(nested / "b.wav")])
+    assert [path.name for path in from_glob] == ["b.wav"]
+
+
+def test_format_timestamp():
+    assert format_timestamp(0) == "00:00:00,000"
+    assert format_timestamp(3723.456) == "01:02:03,456"
+
+
+def test_write_outputs_creates_all_formats(tmp_path):
+    source = tmp_path / "talk.mp3"
+    segments = [TranscriptSegment(0.0, 1.5, "Hello"), TranscriptSegment(1.5, 3.0, "world")]
+
+    written = write_outputs(source, segments, ['txt', 'json', 'srt'])
+
+    assert [path.name for path in written] == ["talk.txt", "talk.json", "talk.srt"]
+    assert (tmp_path / "talk.txt").read_text() == "Hello world\n"
+    data = json.loads((tmp_path / "talk.json").read_text())
+    assert data['text'] == "Hello world"
+    assert data['segments'][1] == {'start': 1.5, 'end': 3.0, 'text': "world"}
+    assert "2\n00:00:01,500 --> 00:00:03,000\nworld\n" in (tmp_path / "talk.srt").read_text()
+
+
+def test_runner_transcribes_and_writes_outputs_next_to_inputs(tmp_path):
+    _make_files(tmp_path, {"one.mp3": "0.1", "two.wav": "0.2", "three.m4a": "0.3"})
+    transcriber = FakeTranscriber()
+
+    summary = _runner(transcriber, tmp_path, output_formats=['txt']).run([str(tmp_path)])
+
+    assert summary == {'done': 3, 'skipped': 0, 'failed': 0}
+    assert (tmp_path / "two.txt").read_text() == "value 0.2\n"
+    assert not (tmp_path / "two.srt").exists()
+
+
+def test_inputs_sharing_a_stem_keep_their_extension(tmp_path):
+    _make_files(tmp_path, {"talk.mp3": "0.1", "talk.mp4": "0.2", "other.wav": "0.3"})
+
+    _runner(FakeTranscriber(), tmp_path, output_formats=['txt']).run([str(tmp_path)])
+
+    assert (tmp_path / "talk.mp3.txt").read_text() == "value 0.1\n"
+    assert (tmp_path / "talk.mp4.txt").read_text() == "value 0.2\n"
+    assert (tmp_path / "other.txt").exists()
+
+
+def test_runner_resumes_from_manifest(tmp_path):
+    paths = _make_files(tmp_path, {"one.mp3": "0.1", "two.mp3": "0.2"})
+    transcriber = FakeTranscriber()
+    _runner(transcriber, tmp_path).run([str(tmp_path)])
+
+    paths[1].write_bytes(b"0.5")
+    summary = _runner(transcriber, tmp_path).run([str(tmp_path)])
+
+    assert summary == {'done': 1, 'skipped': 1, 'failed': 0}
+    assert transcriber.calls == 3
+    assert (tmp_path / "two.txt").read_text() == "value 0.5\n"
+
+
+def test_runner_redoes_files_with_missing_outputs_or_force(tmp_path):
+    _make_files(tmp_path, {"one.mp3": "0.1"})
+    transcriber = FakeTranscriber()
+    _runner(transcriber, tmp_path).run([str(tmp_path)])
+
+    (tmp_path / "one.srt").unlink()
+    assert _runner(transcriber, tmp_path).run([str(tmp_path)])['done'] == 1
+    assert _runner(transcriber, tmp_path, force=True).run([str(tmp_path)])['done'] == 1
+    assert transcriber.calls == 3
+
+
+def test_runner_records_failures_and_continues(tmp_path):
+    _make_files(tmp_path, {"bad.mp3": "broken", "good.mp3": "0.4"})
+    runner = _runner(FakeTranscriber(), tmp_path)
+
+    summary = runner.run([str(tmp_path)])
+
+    assert summary == {'done': 1, 'skipped': 0, 'failed': 1}
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    failed = [entry for entry in manifest['files'].values() if entry['status'] == 'failed']
+    assert failed[0]['error'] == "could not decode audio"
+
+
+class FakeBatchedTranscriber:
+    def __init__(self):
+        self.calls = []
+
+    @staticmethod
+    def speech_clips(audio_data, max_clip_seconds=30.0, sample_rate=16000):
+        return [{'start': 0.0, 'end': len(audio_data) / sample_rate}]
+
+    def transcribe_batched(self, audio_data, clip_timestamps=None, batch_size=8, language=None):
+        self.calls.append(len(clip_timestamps))
+        return [
+            TranscriptSegment(clip['start'], clip['end'], f"value {audio_data[int(clip['start'] * 16000)]:.1f}")
+            for clip in clip_timestamps
+        ]
+
+
+def test_runner_batches_clips_across_files(tmp_path):
+    _make_files(tmp_path, {"one.mp3": "0.1", "two.mp3": "0.2", "three.mp3": "0.3"})
+    fake = FakeBatchedTranscriber()
+    batcher = BatchTranscriber(fake, batch_size=3, max_wait_seconds=5.0)
+
+    runner = _runner(batcher, tmp_path, output_formats=['txt'], decode_workers=3, transcribe_workers=3)
+
+    summary = runner.run([str(tmp_path)])
+    batcher.shutdown()
+
+    assert summary == {'done': 3, 'skipped': 0, 'failed': 0}
+    assert fake.calls == [3]
+    assert (tmp_path / "two.txt").read_text() == "value 0.2\n"
+
+
+def test_runner_rejects_unknown_formats(tmp_path):
+    with pytest.raises(ValueError):
+        _runner(FakeTranscriber(), tmp_path, output_formats=['docx'])
@@ -0,0 +1,156 @@
+import threading
+import numpy as np
+import pytest
+
+from src.batch_transcriber import BatchTranscriber
+from src.job_scheduler import JobCancelledError
+from src.transcriber import TranscriptSegment
+
+SAMPLE_RATE = 16000
+
+
+class FakeBatchedTranscriber:
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    @staticmethod
+    def speech_clips(audio_data, max_clip_seconds=30.0, sample_rate=SAMPLE_RATE):
+        duration = len(audio_data) / sample_rate
+        clips = []
+        start = 0.0
+        while start < duration:
+            end = min(start + 1.0, duration)
+            if np.any(audio_data[int(start * sample_rate):int(end * sample_rate)]):
+                clips.append({'start': start, 'end': end})
+            start = end
+        return clips
+
+    def transcribe_batched(self, audio_data, clip_timestamps=None, batch_size=8, language=None):
+        self.release.wait(5)
+        self.calls.append((len(clip_timestamps), language))
+        segments = []
+        for clip in clip_timestamps:
+            value = audio_data[int(clip['start'] * SAMPLE_RATE)]
+            segments.append(TranscriptSegment(clip['start'], clip['end'], f"v{value:.1f}"))
+        return segments
+
+
+def _audio(value, seconds):
+    return np.full(int(seconds * SAMPLE_RATE), value, dtype=np.float32)
+
+
+def test_single_request_returns_relative_segments():
+    fake = FakeBatchedTranscriber()
+    batcher = BatchTranscriber(fake, batch_size=4, max_wait_seconds=0.01)
+
+    segments = batcher.transcribe_segments(_audio(0.5, 2.5))
+
+    assert [segment.text for segment in segments] == ["v0.5", "v0.5", "v0.5"]
+    assert segments[0].start == 0.0
+    assert segments[-1].end == pytest.approx(2.5)
+    batcher.shutdown()
+
+
+def test_queued_requests_share_a_batch_and_are_routed_back():
+    fake = FakeBatchedTranscriber()
+    batcher = BatchTranscriber(fake, batch_size=8, max_wait_seconds=0.5)
+
+    requests = [batcher.submit(_audio(value, 2.0)) for value in (0.1, 0.2, 0.3)]
+    results = [request.result() for request in requests]
+
+    assert fake.calls == [(6, None)]
+    for value, segments in zip((0.1, 0.2, 0.3), results):
+        assert [segment.text for segment in segments] == [f"v{value:.1f}"] * 2
+        assert [segment.start for segment in segments] == pytest.approx([0.0, 1.0])
+    assert batcher.batches_run == 1
+    batcher.shutdown()
+
+
+def test_full_batch_runs_without_waiting():
+    fake = FakeBatchedTranscriber()
+    batcher = BatchTranscriber(fake, batch_size=2, max_wait_seconds=30.0)
+
+    segments = batcher.transcribe_segments(_audio(0.4, 2.0))
+
+    assert len(segments) == 2
+    batcher.shutdown()
+
+
+def test_different_languages_are_not_mixed():
+    fake = FakeBatchedTranscriber()
+    batcher = BatchTranscriber(fake, batch_size=8, max_wait_seconds=0.2)
+
+    english = batcher.submit(_audio(0.1, 1.0), language="en")
+    german = batcher.submit(_audio(0.2, 1.0), language="de")
+    english.result()
+    german.result()
+
+    assert fake.calls == [(1, "en"), (1, "de")]
+    batcher.shutdown()
+
+
+def test_silent_audio_returns_no_segments():
+    fake = FakeBatchedTranscriber()
+    batcher = BatchTranscriber(fake, batch_size=4, max_wait_seconds=0.01)
+
+    assert batcher.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32)) == ""
+    assert fake.calls == []
+    batcher.shutdown()
+
+
+def test_errors_reach_every_request_in_the_batch():
+    class FailingTranscriber(FakeBatchedTranscriber):
+        def transcribe_batched(self, audio_data, clip_timestamps=None, batch_size=8, language=None):
+            raise RuntimeError("decoder failed")
+
+    batcher = BatchTranscriber(FailingTranscriber(), batch_size=8, max_wait_seconds=0.2)
+    requests = [batcher.submit(_audio(0.1, 1.0)) for _ in range(2)]
+
+    for request in requests:
+        with pytest.raises(RuntimeError, match="decoder failed"):
+            request.result()
+    batcher.shutdown()
+
+
+def test_executor_wraps_batch_runs():
+    fake = FakeBatchedTranscriber()
+    executed = []
+
+    def executor(fn):
+        executed.append(True)
+        return fn()
+
+    batcher = BatchTranscriber(fake, batch_size=4, max_wait_seconds=0.01, executor=executor)
+    batcher.transcribe(_audio(0.3, 1.0))
+
+    assert executed == [True]
+    batcher.shutdown()
+
+
+def test_cancelled_client_stops_submitting():
+    fake = FakeBatchedTranscriber()
+    fake.release.clear()
+    batcher = BatchTranscriber(fake, batch_size=1, max_wait_seconds=0.01)
+    client = batcher.client()
+    errors = []
+
+    def run():
+        try:
+            client.transcribe_segments(_audio(0.2, 1.0))
+        except JobCancelledError as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    while client.current_request is None:
+        pass
+    client.cancel()
+    worker.join(5)
+    fake.release.set()
+
+    assert len(errors) == 1
+    with pytest.raises(JobCancelledError):
+        client.transcribe_segments(_audio(0.2, 1.0))
+    batcher.shutdown()
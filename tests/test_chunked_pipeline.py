@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.chunked_pipeline import ChunkedTranscriptionPipeline, stitch_text
+from src.transcriber import TranscriptSegment
+
+SAMPLE_RATE = 100
+
+
+class SecondCounterTranscriber:
+    def __init__(self):
+        self.window_lengths = []
+
+    def transcribe_segments(self, audio_data, language=None):
+        self.window_lengths.append(len(audio_data))
+        segments = []
+        for second in range(-(-len(audio_data) // SAMPLE_RATE)):
+            value = audio_data[second * SAMPLE_RATE]
+            if value == 0:
+                continue
+            word = f"w{round((value - 0.5) * 1000)}"
+            segments.append(TranscriptSegment(float(second), float(second + 1), word))
+        return segments
+
+
+def _labelled_audio(seconds: int, silent_seconds=()) -> np.ndarray:
+    audio = np.repeat(0.5 + np.arange(seconds) / 1000.0, SAMPLE_RATE).astype(np.float32)
+    for second in silent_seconds:
+        audio[second * SAMPLE_RATE:(second + 1) * SAMPLE_RATE] = 0.0
+    return audio
+
+
+def _chunks(audio: np.ndarray, size: int = 150):
+    return [audio[i:i + size] for i in range(0, len(audio), size)]
+
+
+def _pipeline(transcriber, **kwargs):
+    options = dict(sample_rate=SAMPLE_RATE, window_seconds=10, overlap_seconds=2, silence_search_seconds=3)
+    options.update(kwargs)
+    return ChunkedTranscriptionPipeline(transcriber, **options)
+
+
+def test_short_audio_is_transcribed_once():
+    transcriber = SecondCounterTranscriber()
+    segments = _pipeline(transcriber).run(_chunks(_labelled_audio(5)))
+    assert transcriber.window_lengths == [5 * SAMPLE_RATE]
+    assert [segment.text for segment in segments] == [f"w{i}" for i in range(5)]
+
+
+def test_overlapping_windows_are_deduplicated():
+    transcriber = SecondCounterTranscriber()
+    segments = _pipeline(transcriber).run(_chunks(_labelled_audio(35)))
+
+    assert [segment.text for segment in segments] == [f"w{i}" for i in range(35)]
+    assert [segment.start for segment in segments] == [float(i) for i in range(35)]
+    assert max(transcriber.window_lengths) == 10 * SAMPLE_RATE
+
+
+def test_windows_split_on_silence_without_overlap():
+    transcriber = SecondCounterTranscriber()
+    audio = _labelled_audio(25, silent_seconds=(8, 17))
+    segments = _pipeline(transcriber).run(_chunks(audio))
+
+    assert transcriber.window_lengths[0] < 9 * SAMPLE_RATE
+    assert sum(transcriber.window_lengths) == len(audio)
+    expected = [f"w{i}" for i in range(25) if i not in (8, 17)]
+    assert [segment.text for segment in segments] == expected
+
+
+def test_split_on_silence_disabled_uses_fixed_windows():
+    transcriber = SecondCounterTranscriber()
+    audio = _labelled_audio(20, silent_seconds=(8,))
+    _pipeline(transcriber, split_on_silence=False).run(_chunks(audio))
+    assert transcriber.window_lengths[0] == 10 * SAMPLE_RATE
+
+
+def test_progress_is_reported_per_window():
+    reports = []
+    audio = _labelled_audio(30)
+    _pipeline(SecondCounterTranscriber(), progress_callback=lambda done, total: reports.append((done, total))).run(
+        _chunks(audio), total_duration=30.0
+    )
+
+    done = [report[0] for report in reports]
+    assert len(reports) > 2
+    assert done == sorted(done)
+    assert done[-1] == 30.0
+    assert all(report[1] == 30.0 for report in reports)
+
+
+def test_overlap_must_be_shorter_than_window():
+    with pytest.raises(ValueError):
+        ChunkedTranscriptionPipeline(SecondCounterTranscriber(), window_seconds=5, overlap_seconds=5)
+
+
+def test_stitch_text_removes_repeated_words():
+    assert stitch_text("we went to the", "to the market today") == "market today"
+    assert stitch_text("Hello there.", "there, General Kenobi") == "General Kenobi"
+
+
+def test_stitch_text_keeps_text_without_overlap():
+    assert stitch_text("first part", "second part") == "second part"
+    assert stitch_text("", "anything") == "anything"
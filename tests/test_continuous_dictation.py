@@ -0,0 +1,146 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.continuous_dictation import ContinuousDictation, EndpointDetector
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds, amplitude=0.3):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * 32767 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+
+
+def _silence(seconds, noise=0.001):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * noise * 32767).astype(np.int16)
+
+
+def _feed(detector, audio, block=1024):
+    utterances = []
+    for start in range(0, len(audio), block):
+        utterances.extend(detector.feed(audio[start:start + block]))
+    return utterances
+
+
+def test_pauses_split_utterances_with_margins():
+    detector = EndpointDetector(SAMPLE_RATE, min_silence_ms=700, pre_roll_ms=300, post_roll_ms=300)
+    audio = np.concatenate([_silence(1), _tone(1), _silence(1.5), _tone(2), _silence(1.5)])
+
+    utterances = _feed(detector, audio)
+
+    assert len(utterances) == 2
+    assert len(utterances[0][0]) / SAMPLE_RATE == pytest.approx(1.6, abs=0.1)
+    assert len(utterances[1][0]) / SAMPLE_RATE == pytest.approx(2.6, abs=0.1)
+    assert utterances[0][1] == pytest.approx(0.4, abs=0.05)
+
+
+def test_short_pause_does_not_split():
+    detector = EndpointDetector(SAMPLE_RATE, min_silence_ms=700)
+    audio = np.concatenate([_tone(1), _silence(0.3), _tone(1), _silence(1)])
+
+    assert len(_feed(detector, audio)) == 1
+
+
+def test_clicks_shorter_than_min_speech_are_discarded():
+    detector = EndpointDetector(SAMPLE_RATE, min_speech_ms=250)
+    audio = np.concatenate([_silence(1), _tone(0.06), _silence(2)])
+
+    assert _feed(detector, audio) == []
+
+
+def test_long_speech_is_cut_at_max_length():
+    detector = EndpointDetector(SAMPLE_RATE, max_utterance_seconds=2.0)
+    utterances = _feed(detector, _tone(5))
+    utterances.append(detector.flush())
+
+    assert [round(len(audio) / SAMPLE_RATE) for audio, _ in utterances] == [2, 2, 1]
+
+
+def test_buffer_does_not_grow_over_long_sessions():
+    detector = EndpointDetector(SAMPLE_RATE, max_utterance_seconds=3.0)
+    buffer = detector.buffer
+
+    session = np.concatenate([_tone(1), _silence(1)] * 30)
+    assert len(_feed(detector, session)) == 30
+    assert detector.buffer is buffer
+    assert len(detector.pre_roll) <= detector.pre_roll.maxlen
+
+
+class SlowFirstTranscriber:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, audio):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            time.sleep(0.2)
+        return f"utterance {call} ({len(audio) / SAMPLE_RATE:.0f}s)"
+
+
+def _stream(dictation, audio, block=1024):
+    data = audio.tobytes()
+    for start in range(0, len(data), block * 2):
+        dictation.feed(data[start:start + block * 2])
+
+
+def test_results_are_delivered_in_order_with_latency():
+    results = []
+    dictation = ContinuousDictation(SlowFirstTranscriber(), results.append, SAMPLE_RATE, workers=2)
+    dictation.start()
+
+    _stream(dictation, np.concatenate([_tone(1), _silence(1), _tone(2), _silence(1), _tone(1)]))
+    dictation.stop()
+    dictation.shutdown()
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert results[0].text.startswith("utterance 1")
+    assert all(result.latency_seconds >= 0 for result in results)
+    assert results[0].latency_seconds >= 0.2
+    summary = dictation.latency_summary()
+    assert summary['count'] == 3
+    assert summary['max'] >= summary['p50']
+
+
+def test_backlog_is_bounded():
+    release = threading.Event()
+
+    def blocked(audio):
+        release.wait(5)
+        return "text"
+
+    results = []
+    dictation = ContinuousDictation(blocked, results.append, SAMPLE_RATE, max_pending=2)
+    dictation.start()
+
+    _stream(dictation, np.concatenate([_tone(0.5), _silence(1)] * 5))
+    assert len(dictation.pending) == 2
+    assert dictation.dropped_utterances == 3
+
+    release.set()
+    dictation.stop()
+    dictation.shutdown()
+    assert len(results) == 2
+
+
+def test_resamples_to_target_rate():
+    lengths = []
+
+    def transcribe(audio):
+        lengths.append(len(audio))
+        return "text"
+
+    dictation = ContinuousDictation(transcribe, lambda result: None, 48000, target_sample_rate=16000)
+    dictation.start()
+    t = np.arange(48000) / 48000
+    dictation.feed((0.3 * 32767 * np.sin(2 * np.pi * 220 * t)).astype(np.int16).tobytes())
+    dictation.stop()
+    dictation.shutdown()
+
+    assert lengths and lengths[0] == pytest.approx(16000, abs=480)
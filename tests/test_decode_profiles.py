@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from src.decode_profiles import DEFAULT_PROFILE, DECODE_PROFILES, DecodeProfiles
+from src.transcriber import Transcriber
+
+
+def test_default_profile_matches_previous_transcriber_options():
+    assert Transcriber().decode_options == DECODE_PROFILES[DEFAULT_PROFILE]
+    assert DECODE_PROFILES['accurate'] == dict(
+        beam_size=5,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500)
+    )
+
+
+def test_builtin_profiles():
+    profiles = DecodeProfiles()
+
+    fast = profiles.options('fast')
+    assert fast['beam_size'] == 1
+    assert fast['without_timestamps'] is True
+    assert fast['condition_on_previous_text'] is False
+    assert len(profiles.options('archival')['temperature']) > 1
+
+
+def test_jobs_default_to_accurate_and_can_be_overridden():
+    profiles = DecodeProfiles({'dictation': 'fast', 'file': None})
+
+    assert profiles.profile_for('dictation') == 'fast'
+    assert profiles.profile_for('file') == 'accurate'
+    assert profiles.options_for('youtube') == DECODE_PROFILES['accurate']
+
+
+def test_timestamps_can_be_required():
+    profiles = DecodeProfiles({'dictation': 'fast'})
+
+    assert 'without_timestamps' not in profiles.options_for('dictation', timestamps=True)
+    assert profiles.options_for('dictation')['without_timestamps'] is True
+
+
+def test_options_are_copies():
+    profiles = DecodeProfiles()
+    profiles.options('accurate')['vad_parameters']['min_silence_duration_ms'] = 1
+
+    assert profiles.options('accurate')['vad_parameters']['min_silence_duration_ms'] == 500
+    assert DECODE_PROFILES['accurate']['vad_parameters']['min_silence_duration_ms'] == 500
+
+
+def test_unknown_profile_or_job_is_rejected():
+    with pytest.raises(ValueError):
+        DecodeProfiles({'dictation': 'turbo-mode'})
+    with pytest.raises(ValueError):
+        DecodeProfiles({'podcast': 'fast'})
+    with pytest.raises(ValueError):
+        DecodeProfiles(profiles={'custom': {'base': 'missing'}})
+
+
+def test_config_file_defines_profiles_and_jobs(tmp_path):
+    config = tmp_path / "profiles.json"
+    config.write_text(json.dumps({
+        'profiles': {
+            'meeting': {'base': 'archival', 'beam_size': 8},
+            'fast': {'beam_size': 2}
+        },
+        'jobs': {'file': 'meeting', 'dictation': 'fast'}
+    }), encoding='utf-8')
+
+    profiles = DecodeProfiles.from_file(config)
+
+    meeting = profiles.options_for('file')
+    assert meeting['beam_size'] == 8
+    assert meeting['temperature'] == DECODE_PROFILES['archival']['temperature']
+    assert profiles.options_for('dictation')['beam_size'] == 2
+    assert profiles.options_for('dictation')['without_timestamps'] is True
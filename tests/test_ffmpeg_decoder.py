@@ -0,0 +1,130 @@
+import shutil
+import subprocess
+import sys
+import time
+import numpy as np
+import pytest
+
+from src.ffmpeg_decoder import FFmpegDecoder
+
+requires_posix = pytest.mark.skipif(sys.platform == 'win32', reason="Fake ffmpeg script needs a POSIX shebang")
+requires_ffmpeg = pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="Requires FFmpeg")
+
+
+def _fake_ffmpeg(
+    tmp_path,
+    num_samples: int,
+    exit_code: int = 0,
+    sleep_seconds: float = 0,
+    close_stdout: bool = False
+):
+    script = tmp_path / "fake_ffmpeg"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import os\n"
+        "import sys\n"
+        "import time\n"
+        "import numpy as np\n"
+        f"sys.stdout.buffer.write((np.arange({num_samples}) % 1000).astype(np.int16).tobytes())\n"
+        "sys.stdout.flush()\n"
+        f"if {close_stdout}:\n"
+        "    os.close(1)\n"
+        f"time.sleep({sleep_seconds})\n"
+        f"sys.stderr.write('fake failure' if {exit_code} else '')\n"
+        f"sys.exit({exit_code})\n"
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_ffmpeg_decoder_initialization():
+    decoder = FFmpegDecoder(sample_rate=16000, chunk_seconds=2.0)
+    assert decoder.sample_rate == 16000
+    assert decoder.chunk_samples == 32000
+    assert decoder.processes == []
+
+
+def test_probe_duration_missing_binary():
+    decoder = FFmpegDecoder(ffprobe_path="nonexistent_ffprobe_binary")
+    assert decoder.probe_duration("file.mp3") is None
+
+
+@requires_posix
+def test_decode_reads_pcm_from_stdout(tmp_path):
+    decoder = FFmpegDecoder(chunk_seconds=0.1, ffmpeg_path=_fake_ffmpeg(tmp_path, 5000), ffprobe_path="nonexistent")
+    audio = decoder.decode("input.mp4")
+    assert audio.dtype == np.float32
+    assert len(audio) == 5000
+    np.testing.assert_allclose(audio * 32768.0, np.arange(5000) % 1000)
+    assert decoder.processes == []
+
+
+@requires_posix
+def test_decode_grows_beyond_estimate(tmp_path):
+    decoder = FFmpegDecoder(sample_rate=10, chunk_seconds=100.0, ffmpeg_path=_fake_ffmpeg(tmp_path, 2000), ffprobe_path="nonexistent")
+    audio = decoder.decode("input.mp4")
+    assert len(audio) == 2000
+
+
+@requires_posix
+def test_iter_chunks_yields_fixed_size_chunks(tmp_path):
+    decoder = FFmpegDecoder(ffmpeg_path=_fake_ffmpeg(tmp_path, 4000))
+    chunks = list(decoder.iter_chunks("input.mp4", chunk_seconds=0.1))
+    assert [len(chunk) for chunk in chunks] == [1600, 1600, 800]
+    assert all(chunk.dtype == np.float32 for chunk in chunks)
+
+
+@requires_posix
+def test_decode_raises_on_ffmpeg_error(tmp_path):
+    decoder = FFmpegDecoder(ffmpeg_path=_fake_ffmpeg(tmp_path, 10, exit_code=1), ffprobe_path="nonexistent")
+    with pytest.raises(RuntimeError, match="fake failure"):
+        decoder.decode("input.mp4")
+    assert decoder.processes == []
+
+
+@requires_posix
+def test_closing_generator_kills_process(tmp_path):
+    decoder = FFmpegDecoder(ffmpeg_path=_fake_ffmpeg(tmp_path, 100000))
+    chunks = decoder.iter_chunks("input.mp4", chunk_seconds=0.1)
+    next(chunks)
+    assert len(decoder.processes) == 1
+    chunks.close()
+    assert decoder.processes == []
+
+
+@requires_posix
+def test_stalled_ffmpeg_is_killed(tmp_path):
+    ffmpeg_path = _fake_ffmpeg(tmp_path, 1000, sleep_seconds=30)
+    decoder = FFmpegDecoder(ffmpeg_path=ffmpeg_path, ffprobe_path="nonexistent", stall_timeout=0.5)
+    with pytest.raises(RuntimeError, match="stalled"):
+        decoder.decode("input.mp4")
+    assert decoder.processes == []
+
+
+@requires_posix
+def test_ffmpeg_that_never_exits_is_killed(tmp_path):
+    ffmpeg_path = _fake_ffmpeg(tmp_path, 1000, sleep_seconds=30, close_stdout=True)
+    decoder = FFmpegDecoder(ffmpeg_path=ffmpeg_path, ffprobe_path="nonexistent", stall_timeout=0.5)
+    with pytest.raises(RuntimeError, match="did not exit"):
+        decoder.decode("input.mp4")
+    assert decoder.processes == []
+
+
+@requires_posix
+def test_slow_consumer_is_not_a_stall(tmp_path):
+    decoder = FFmpegDecoder(ffmpeg_path=_fake_ffmpeg(tmp_path, 4000), stall_timeout=0.3)
+    chunks = decoder.iter_chunks("input.mp4", chunk_seconds=0.1)
+    first = next(chunks)
+    time.sleep(1.0)
+    assert len(first) + sum(len(chunk) for chunk in chunks) == 4000
+
+
+@requires_ffmpeg
+def test_decode_real_file(tmp_path):
+    source = tmp_path / "tone.mp3"
+    subprocess.run([
+        'ffmpeg', '-loglevel', 'error', '-f', 'lavfi', '-i', 'sine=frequency=440:duration=2',
+        '-ar', '44100', '-ac', '2', '-y', str(source)
+    ], check=True)
+    audio = FFmpegDecoder().decode(str(source))
+    assert abs(len(audio) - 32000) < 1600
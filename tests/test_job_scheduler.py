@@ -0,0 +1,170 @@
+import threading
+import numpy as np
+import pytest
+
+from src.job_scheduler import JobCancelledError, JobScheduler, ScheduledTranscriber
+from src.transcriber import TranscriptSegment
+
+
+def _blocking_job(scheduler, priority=JobScheduler.PRIORITY_BATCH):
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+        return "blocker"
+
+    job = scheduler.submit(block, priority=priority, name="blocker")
+    assert started.wait(5)
+    return job, release
+
+
+def test_scheduler_runs_jobs_and_returns_results():
+    scheduler = JobScheduler(worker_slots=2)
+    job = scheduler.submit(lambda: 21 * 2, name="answer")
+    assert job.result(timeout=5) == 42
+    assert job.status == "done"
+    assert scheduler.metrics()['completed'] == 1
+    scheduler.shutdown(wait=True)
+
+
+def test_scheduler_propagates_errors():
+    scheduler = JobScheduler()
+
+    def fail():
+        raise ValueError("boom")
+
+    job = scheduler.submit(fail)
+    with pytest.raises(ValueError, match="boom"):
+        job.result(timeout=5)
+    assert scheduler.metrics()['failed'] == 1
+    scheduler.shutdown(wait=True)
+
+
+def test_dictation_runs_before_queued_batch_jobs():
+    scheduler = JobScheduler(worker_slots=1)
+    blocker, release = _blocking_job(scheduler)
+    order = []
+
+    batch = [scheduler.submit(lambda i=i: order.append(f"batch{i}"), priority=JobScheduler.PRIORITY_BATCH) for i in range(3)]
+    dictation = scheduler.submit(lambda: order.append("dictation"), priority=JobScheduler.PRIORITY_DICTATION)
+    assert scheduler.queue_depth() == 4
+
+    release.set()
+    for job in batch + [dictation, blocker]:
+        job.result(timeout=5)
+
+    assert order == ["dictation", "batch0", "batch1", "batch2"]
+    assert scheduler.metrics()['max_queue_depth'] == 4
+    scheduler.shutdown(wait=True)
+
+
+def test_cancelled_jobs_are_skipped():
+    scheduler = JobScheduler(worker_slots=1)
+    blocker, release = _blocking_job(scheduler)
+    ran = []
+
+    job = scheduler.submit(lambda: ran.append(True))
+    assert job.cancel() is True
+    assert scheduler.queue_depth() == 0
+
+    release.set()
+    blocker.result(timeout=5)
+    with pytest.raises(JobCancelledError):
+        job.result(timeout=5)
+
+    scheduler.submit(lambda: None).result(timeout=5)
+    assert ran == []
+    assert scheduler.metrics()['cancelled'] == 1
+    scheduler.shutdown(wait=True)
+
+
+def test_cancel_all_only_touches_lower_priorities():
+    scheduler = JobScheduler(worker_slots=1)
+    blocker, release = _blocking_job(scheduler)
+
+    batch = scheduler.submit(lambda: "batch", priority=JobScheduler.PRIORITY_BATCH)
+    dictation = scheduler.submit(lambda: "dictation", priority=JobScheduler.PRIORITY_DICTATION)
+    assert scheduler.cancel_all(min_priority=JobScheduler.PRIORITY_BATCH) == 1
+
+    release.set()
+    assert dictation.result(timeout=5) == "dictation"
+    assert batch.cancelled
+    assert blocker.result(timeout=5) == "blocker"
+    scheduler.shutdown(wait=True)
+
+
+def test_running_job_cannot_be_cancelled():
+    scheduler = JobScheduler(worker_slots=1)
+    blocker, release = _blocking_job(scheduler)
+    assert blocker.cancel() is False
+    assert scheduler.metrics()['running'] == 1
+    release.set()
+    assert blocker.result(timeout=5) == "blocker"
+    scheduler.shutdown(wait=True)
+
+
+def test_cpu_jobs_run_alongside_blocked_gpu_jobs():
+    scheduler = JobScheduler(worker_slots={'cuda': 1, 'cpu': 2})
+    release = threading.Event()
+    gpu_started = threading.Event()
+
+    def gpu_job():
+        gpu_started.set()
+        release.wait(5)
+
+    gpu = scheduler.submit(gpu_job, device='cuda')
+    assert gpu_started.wait(5)
+    queued_gpu = scheduler.submit(lambda: "gpu", device='cuda')
+
+    assert scheduler.run(lambda: "cpu", device='cpu') == "cpu"
+    assert scheduler.metrics()['running_by_device'] == {'cuda': 1, 'cpu': 0}
+    assert scheduler.metrics()['worker_slots'] == 3
+
+    release.set()
+    gpu.result(timeout=5)
+    assert queued_gpu.result(timeout=5) == "gpu"
+    scheduler.shutdown(wait=True)
+
+
+def test_unknown_device_uses_first_slot_pool():
+    scheduler = JobScheduler(worker_slots={'cuda': 1, 'cpu': 1})
+    job = scheduler.submit(lambda: "done", device='mps')
+    assert job.result(timeout=5) == "done"
+    assert job.device == 'cuda'
+    scheduler.shutdown(wait=True)
+
+
+class FakeTranscriber:
+    def transcribe_segments(self, audio_data, language=None):
+        return [TranscriptSegment(0.0, 1.0, "hello"), TranscriptSegment(1.0, 2.0, "world")]
+
+
+def test_scheduled_transcriber_routes_through_scheduler():
+    scheduler = JobScheduler()
+    scheduled = ScheduledTranscriber(FakeTranscriber(), scheduler, JobScheduler.PRIORITY_INTERACTIVE)
+    assert scheduled.transcribe(np.zeros(16000, dtype=np.float32)) == "hello world"
+    assert scheduler.metrics()['completed'] == 1
+    scheduler.shutdown(wait=True)
+
+
+def test_scheduled_transcriber_cancel_stops_further_work():
+    scheduler = JobScheduler()
+    scheduled = ScheduledTranscriber(FakeTranscriber(), scheduler, JobScheduler.PRIORITY_BATCH)
+    scheduled.cancel()
+    with pytest.raises(JobCancelledError):
+        scheduled.transcribe_segments(np.zeros(10, dtype=np.float32))
+    scheduler.shutdown(wait=True)
+
+
+class CpuTranscriber(FakeTranscriber):
+    preferred_device = 'cpu'
+
+
+def test_scheduled_transcriber_routes_by_preferred_device():
+    scheduler = JobScheduler(worker_slots={'cuda': 1, 'cpu': 1})
+    scheduled = ScheduledTranscriber(CpuTranscriber(), scheduler, JobScheduler.PRIORITY_INTERACTIVE)
+    scheduled.transcribe(np.zeros(16000, dtype=np.float32))
+    assert scheduled.current_job.device == 'cpu'
+    scheduler.shutdown(wait=True)
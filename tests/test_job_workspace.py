@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from src.job_workspace import OWNER_FILE, WorkspaceManager, process_alive
+
+
+def _fake_workspace(root, name, pid, created):
+    path = root / name
+    path.mkdir(parents=True)
+    (path / OWNER_FILE).write_text(json.dumps({'pid': pid, 'created': created}), encoding='utf-8')
+    (path / "audio.webm").write_bytes(b"data")
+    return path
+
+
+def _finished_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_concurrent_jobs_get_separate_directories(tmp_path):
+    manager = WorkspaceManager(tmp_path)
+    first, second = manager.create("file"), manager.create("file")
+
+    first.file("audio.wav").write_bytes(b"first")
+    second.file("audio.wav").write_bytes(b"second")
+
+    assert first.path != second.path
+    assert first.file("audio.wav").read_bytes() == b"first"
+    first.close()
+    assert not first.path.exists()
+    assert second.file("audio.wav").read_bytes() == b"second"
+
+
+def test_workspace_is_removed_on_exit_even_after_errors(tmp_path):
+    manager = WorkspaceManager(tmp_path)
+    try:
+        with manager.create("youtube") as workspace:
+            workspace.file("partial.part").write_bytes(b"x")
+            raise RuntimeError("download failed")
+    except RuntimeError:
+        pass
+
+    assert list(tmp_path.iterdir()) == []
+    assert manager.active == set()
+
+
+def test_close_all_removes_open_workspaces(tmp_path):
+    manager = WorkspaceManager(tmp_path)
+    workspaces = [manager.create("job") for _ in range(3)]
+    manager.close_all()
+
+    assert all(not workspace.path.exists() for workspace in workspaces)
+    assert manager.active == set()
+
+
+def test_stale_workspaces_of_dead_or_old_processes_are_removed(tmp_path):
+    now = time.time()
+    dead = _fake_workspace(tmp_path, "file-dead", _finished_pid(), now)
+    too_old = _fake_workspace(tmp_path, "file-old", os.getppid(), now - 7200)
+    alive = _fake_workspace(tmp_path, "file-alive", os.getppid(), now)
+    manager = WorkspaceManager(tmp_path, max_age_seconds=3600)
+    own = manager.create("file")
+
+    assert manager.cleanup_stale() == 2
+    assert not dead.exists() and not too_old.exists()
+    assert alive.exists() and own.path.exists()
+
+
+def test_workspace_without_owner_is_kept_while_recent(tmp_path):
+    fresh = tmp_path / "job-fresh"
+    fresh.mkdir()
+    abandoned = tmp_path / "job-abandoned"
+    abandoned.mkdir()
+    os.utime(abandoned, (time.time() - 600, time.time() - 600))
+
+    assert WorkspaceManager(tmp_path).cleanup_stale() == 1
+    assert fresh.exists() and not abandoned.exists()
+
+
+def test_process_alive():
+    assert process_alive(os.getpid())
+    assert not process_alive(_finished_pid())
+
+
+def test_missing_root_needs_no_cleanup(tmp_path):
+    assert WorkspaceManager(tmp_path / "missing").cleanup_stale() == 0
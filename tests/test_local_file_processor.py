@@ -4,7 +4,8 @@ from src.local_file_processor import LocalFileProcessor
 
 def test_local_file_processor_initialization():
     processor = LocalFileProcessor()
-    assert processor.temp_dir is not None
+    assert processor.decoder is not None
+    assert processor.decoder.sample_rate == 16000
 
 
 def test_is_valid_file_path_invalid_types():
@@ -0,0 +1,105 @@
+import threading
+import time
+
+from src.memory_cache import MemoryCache
+
+
+def test_memory_cache_put_and_get():
+    cache = MemoryCache()
+    cache.put("key", "value")
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_memory_cache_evicts_least_recently_used_by_count():
+    cache = MemoryCache(max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert "b" not in cache
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats()['evictions'] == 1
+
+
+def test_memory_cache_evicts_by_byte_budget():
+    cache = MemoryCache(max_bytes=30)
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    cache.put("c", "z" * 10)
+
+    assert len(cache) == 2
+    assert "a" not in cache
+    assert cache.total_bytes == 22
+
+
+def test_memory_cache_rejects_oversized_values():
+    cache = MemoryCache(max_bytes=10)
+    cache.put("a", "x" * 100)
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_memory_cache_replacing_value_updates_size():
+    cache = MemoryCache()
+    cache.put("a", "short")
+    cache.put("a", "a bit longer")
+    assert len(cache) == 1
+    assert cache.total_bytes == 1 + len("a bit longer")
+
+
+def test_memory_cache_expires_lazily_on_access():
+    cache = MemoryCache(ttl_seconds=0.05)
+    cache.put("a", "value")
+    time.sleep(0.1)
+    assert cache.stats()['entries'] == 1
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.stats()['expirations'] == 1
+
+
+def test_memory_cache_membership_and_length_respect_ttl():
+    cache = MemoryCache(ttl_seconds=0.05)
+    cache.put("a", "value")
+    cache.put("b", "value")
+    assert "a" in cache and len(cache) == 2
+    time.sleep(0.1)
+    cache.put("c", "value")
+
+    assert "a" not in cache
+    assert len(cache) == 1
+    assert cache.get("c") == "value"
+    assert cache.stats()['expirations'] == 2
+
+
+def test_memory_cache_delete_and_clear():
+    cache = MemoryCache()
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.delete("a")
+    assert "a" not in cache
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_memory_cache_is_thread_safe():
+    cache = MemoryCache(max_entries=50)
+
+    def worker(prefix):
+        for i in range(500):
+            cache.put(f"{prefix}{i}", "value")
+            cache.get(f"{prefix}{i // 2}")
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 50
+    assert cache.total_bytes == sum(len(key) + 5 for key in cache.entries)
@@ -0,0 +1,39 @@
+import time
+
+from src.metadata_cache import VideoMetadata, VideoMetadataCache
+
+
+def test_metadata_survives_reopening(tmp_path):
+    cache = VideoMetadataCache(tmp_path / "metadata.db")
+    cache.put(VideoMetadata("dQw4w9WgXcQ", "Clip", 212.0, 'not_live'))
+    cache.close()
+
+    reopened = VideoMetadataCache(tmp_path / "metadata.db")
+    metadata = reopened.get("dQw4w9WgXcQ")
+    assert metadata == VideoMetadata("dQw4w9WgXcQ", "Clip", 212.0, 'not_live')
+    assert metadata.is_live is False
+    assert reopened.get("aaaaaaaaaaa") is None
+    reopened.close()
+
+
+def test_live_streams_are_not_cached(tmp_path):
+    cache = VideoMetadataCache(tmp_path / "metadata.db")
+    cache.put(VideoMetadata("dQw4w9WgXcQ", "Live", None, 'is_live'))
+    assert cache.get("dQw4w9WgXcQ") is None
+    cache.close()
+
+
+def test_unreadable_entries_are_dropped(tmp_path):
+    cache = VideoMetadataCache(tmp_path / "metadata.db")
+    cache.store.put("dQw4w9WgXcQ", "{not json")
+    assert cache.get("dQw4w9WgXcQ") is None
+    assert len(cache.store) == 0
+    cache.close()
+
+
+def test_entries_expire(tmp_path):
+    cache = VideoMetadataCache(tmp_path / "metadata.db", ttl_seconds=0.05)
+    cache.put(VideoMetadata("dQw4w9WgXcQ", "Clip", 212.0))
+    time.sleep(0.1)
+    assert cache.get("dQw4w9WgXcQ") is None
+    cache.close()
@@ -0,0 +1,113 @@
+import json
+import time
+
+import pytest
+
+from src import metrics
+from src.job_scheduler import JobScheduler
+from src.metrics import MetricsRecorder
+
+
+def test_stages_are_recorded_for_the_current_job():
+    recorder = MetricsRecorder()
+
+    with recorder.job('dictation') as job:
+        job.audio_seconds = 10.0
+        with metrics.stage('resample'):
+            time.sleep(0.01)
+        metrics.record_stage('decode', 1.0)
+        metrics.record_stage('decode', 1.0)
+        metrics.annotate(model="small", device="cpu", cache_hit=False)
+
+    assert job.status == "done"
+    assert job.stages['resample'] >= 0.01
+    assert job.stages['decode'] == 2.0
+    assert job.rtf == pytest.approx(0.2)
+    assert job.model == "small"
+    assert job.total_seconds >= 0.01
+
+
+def test_recording_outside_a_job_is_ignored():
+    metrics.record_stage('decode', 1.0)
+    metrics.annotate(model="small")
+    with metrics.stage('resample'):
+        pass
+
+    assert metrics.current_job() is None
+
+
+def test_failed_and_skipped_jobs_are_excluded_from_summary():
+    recorder = MetricsRecorder()
+
+    with pytest.raises(RuntimeError):
+        with recorder.job('file'):
+            raise RuntimeError("decode failed")
+    with recorder.job('file') as job:
+        job.status = "skipped"
+    with recorder.job('file'):
+        metrics.record_stage('decode', 0.5)
+
+    assert [job.status for job in recorder.recent('file')] == ["failed", "skipped", "done"]
+    assert recorder.summary('file')['count'] == 1
+
+
+def test_scheduler_jobs_record_into_the_submitting_job():
+    recorder = MetricsRecorder()
+    scheduler = JobScheduler()
+
+    with recorder.job('youtube') as job:
+        scheduler.run(lambda: metrics.record_stage('decode', 0.25))
+    scheduler.shutdown()
+
+    assert job.stages['decode'] == 0.25
+    assert 'queue' in job.stages
+
+
+def test_timed_iter_measures_time_spent_producing_items():
+    def slow_chunks():
+        for index in range(3):
+            time.sleep(0.01)
+            yield index
+
+    recorder = MetricsRecorder()
+    with recorder.job('file') as job:
+        assert list(metrics.timed_iter('fetch', slow_chunks())) == [0, 1, 2]
+
+    assert job.stages['fetch'] >= 0.03
+
+
+def test_summary_text_and_history_limit():
+    recorder = MetricsRecorder(history_size=3)
+    assert recorder.summary_text() == "No jobs yet"
+
+    for hit in (True, False, True, True):
+        with recorder.job('youtube') as job:
+            job.audio_seconds = 100.0
+            metrics.record_stage('decode', 10.0)
+            metrics.record_stage('fetch', 20.0)
+            metrics.annotate(cache_hit=hit)
+
+    summary = recorder.summary('youtube')
+    assert summary['count'] == 3
+    assert summary['cache_hits'] == 2
+    assert summary['mean_rtf'] == pytest.approx(0.1)
+    assert recorder.summary_text().startswith("youtube avg ")
+    assert "(fetch 20.00s)" in recorder.summary_text()
+    assert "cache 2/3" in recorder.summary_text()
+
+
+def test_jobs_are_appended_to_the_json_lines_log(tmp_path):
+    log_path = tmp_path / "logs" / "metrics.jsonl"
+    recorder = MetricsRecorder(log_path)
+
+    for name in ('dictation', 'file'):
+        with recorder.job(name) as job:
+            job.audio_seconds = 4.0
+            metrics.record_stage('decode', 1.0)
+    recorder.close()
+
+    entries = [json.loads(line) for line in log_path.read_text(encoding='utf-8').splitlines()]
+    assert [entry['job'] for entry in entries] == ['dictation', 'file']
+    assert entries[0]['stages'] == {'decode': 1.0}
+    assert entries[0]['rtf'] == 0.25
+    assert entries[0]['status'] == "done"
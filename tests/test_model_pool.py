@@ -0,0 +1,155 @@
+import numpy as np
+
+from src.model_pool import ModelPool, ModelRouter, estimate_model_memory_mb
+from src.transcriber import TranscriptSegment
+
+
+class FakeTranscriber:
+    def __init__(self, model_size):
+        self.model_size = model_size
+        self.model = None
+        self.current_device = None
+        self.keep_model_loaded = False
+        self.decode_options = {'beam_size': 5}
+        self.preloaded = False
+        self.is_shut_down = False
+
+    def _load(self):
+        self.model = object()
+        self.current_device = "cpu"
+
+    def transcribe_segments(self, audio_data, language=None, decode_options=None):
+        self._load()
+        self.last_options = decode_options
+        return [TranscriptSegment(0.0, 1.0, self.model_size)]
+
+    def transcribe_batched(self, audio_data, clip_timestamps=None, batch_size=8, language=None, decode_options=None):
+        self._load()
+        self.last_options = decode_options
+        return [TranscriptSegment(0.0, 1.0, f"{self.model_size} batched")]
+
+    def preload_for_recording(self):
+        self.preloaded = True
+        self._load()
+
+    def unload_model(self):
+        self.model = None
+        self.current_device = None
+
+    def shutdown(self):
+        self.is_shut_down = True
+        self.unload_model()
+
+
+def _audio():
+    return np.zeros(16000, dtype=np.float32)
+
+
+def test_router_prefers_override_then_duration_then_source():
+    router = ModelRouter(
+        default_model="turbo",
+        short_model="small",
+        short_max_seconds=20,
+        long_model="large-v3",
+        long_min_seconds=1800,
+        source_models={'youtube': 'medium'}
+    )
+
+    assert router.route('mic', 5) == "small"
+    assert router.route('mic', 60) == "turbo"
+    assert router.route('mic') == "turbo"
+    assert router.route('file', 3600) == "large-v3"
+    assert router.route('youtube', 600) == "medium"
+    assert router.route('youtube', 7200) == "large-v3"
+    assert router.route('file', 5, override="tiny") == "tiny"
+
+
+def test_router_global_override():
+    router = ModelRouter(short_model="small", override="base")
+    assert router.route('mic', 1) == "base"
+    assert router.route('file', 9999) == "base"
+
+
+def test_estimate_model_memory():
+    assert estimate_model_memory_mb("small.en") == estimate_model_memory_mb("small")
+    assert estimate_model_memory_mb("unknown-model") == estimate_model_memory_mb("large-v3")
+
+
+def test_pool_keeps_one_transcriber_per_model():
+    pool = ModelPool(FakeTranscriber)
+
+    assert pool.get("small") is pool.get("small")
+    assert pool.get("small") is not pool.get("turbo")
+
+
+def test_pooled_transcriber_uses_its_model():
+    pool = ModelPool(FakeTranscriber)
+
+    assert pool.pooled("small").transcribe(_audio()) == "small"
+    assert pool.pooled("turbo").transcribe_batched(_audio())[0].text == "turbo batched"
+    assert pool.loaded_models() == ["small", "turbo"]
+    assert pool.pooled("small").decode_options == {'beam_size': 5}
+
+
+def test_pooled_transcriber_passes_profile_options():
+    pool = ModelPool(FakeTranscriber)
+    fast = {'beam_size': 1}
+
+    pooled = pool.pooled("small", decode_options=fast)
+    pooled.transcribe(_audio())
+
+    assert pool.get("small").last_options == fast
+    assert pooled.decode_options == fast
+    pool.pooled("small").transcribe(_audio())
+    assert pool.get("small").last_options is None
+
+
+def test_pool_evicts_least_recently_used_over_budget():
+    budget = estimate_model_memory_mb("small") + estimate_model_memory_mb("turbo")
+    pool = ModelPool(FakeTranscriber, memory_budget_mb=budget)
+
+    pool.pooled("small").transcribe(_audio())
+    pool.pooled("turbo").transcribe(_audio())
+    pool.pooled("small").transcribe(_audio())
+    assert pool.evictions == 0
+
+    pool.pooled("base").transcribe(_audio())
+
+    assert pool.loaded_models() == ["small", "base"]
+    assert pool.evictions == 1
+    assert pool.loaded_memory_mb() <= budget
+
+
+def test_pool_does_not_evict_models_in_use():
+    budget = estimate_model_memory_mb("turbo")
+    pool = ModelPool(FakeTranscriber, memory_budget_mb=budget)
+    pool.pooled("turbo").transcribe(_audio())
+
+    busy = pool.acquire("turbo")
+    pool.pooled("small").transcribe(_audio())
+    assert busy.model is not None
+    pool.release("turbo")
+
+    pool.pooled("base").transcribe(_audio())
+    assert pool.get("turbo").model is None
+
+
+def test_preload_makes_room_and_preloads():
+    pool = ModelPool(FakeTranscriber, memory_budget_mb=estimate_model_memory_mb("turbo"))
+    pool.pooled("turbo").transcribe(_audio())
+
+    pool.preload("small")
+
+    assert pool.get("small").preloaded is True
+    assert pool.get("turbo").model is None
+
+
+def test_pool_applies_keep_loaded_and_shuts_down_every_model():
+    pool = ModelPool(FakeTranscriber)
+    small, turbo = pool.get("small"), pool.get("turbo")
+
+    pool.set_keep_model_loaded(True)
+    assert small.keep_model_loaded and turbo.keep_model_loaded
+
+    pool.shutdown()
+    assert small.is_shut_down and turbo.is_shut_down
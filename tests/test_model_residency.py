@@ -0,0 +1,135 @@
+import pytest
+
+from src.model_residency import ModelResidency
+
+
+class FakeDeviceModel:
+    def __init__(self):
+        self.is_loaded = True
+        self.unload_calls = []
+
+    def unload_model(self, to_cpu=False):
+        self.is_loaded = False
+        self.unload_calls.append(to_cpu)
+
+    def load_model(self):
+        self.is_loaded = True
+
+
+class FakeWhisperModel:
+    def __init__(self, device, compute_type):
+        self.device = device
+        self.compute_type = compute_type
+        self.model = FakeDeviceModel()
+
+
+class FakeFactory:
+    def __init__(self):
+        self.created = []
+
+    def __call__(self, device, compute_type):
+        model = FakeWhisperModel(device, compute_type)
+        self.created.append((device, compute_type))
+        return model
+
+
+def _residency(**kwargs):
+    factory = FakeFactory()
+    residency = ModelResidency(factory, primary=("cuda", "float16"), fallback=("cpu", "int8"), **kwargs)
+    return residency, factory
+
+
+def test_load_primary_creates_model_once():
+    residency, factory = _residency()
+
+    first = residency.load_primary()
+    second = residency.load_primary()
+
+    assert first is second
+    assert factory.created == [("cuda", "float16")]
+    assert residency.active_device == "cuda"
+
+
+def test_demote_parks_primary_and_keeps_fallback_warm():
+    residency, factory = _residency()
+    primary = residency.load_primary()
+
+    fallback = residency.demote()
+
+    assert residency.active_model is fallback
+    assert residency.active_device == "cpu"
+    assert primary.model.unload_calls == [True]
+    assert residency.primary_parked is True
+    assert factory.created == [("cuda", "float16"), ("cpu", "int8")]
+
+
+def test_promote_and_demote_cycles_never_reload_from_disk():
+    residency, factory = _residency()
+    primary = residency.load_primary()
+
+    for _ in range(3):
+        residency.demote()
+        assert residency.promote() is primary
+        assert primary.model.is_loaded is True
+
+    assert len(factory.created) == 2
+    timings = residency.timings()
+    assert timings['promote']['count'] == 3
+    assert timings['demote']['count'] == 3
+    assert timings['load_primary']['count'] == 1
+    assert timings['load_fallback']['count'] == 1
+
+
+def test_demote_without_parking_drops_primary():
+    residency, factory = _residency(park_primary_in_ram=False)
+    residency.load_primary()
+
+    residency.demote()
+    assert residency.primary_model is None
+
+    residency.promote()
+    assert factory.created.count(("cuda", "float16")) == 2
+    assert residency.timings()['drop_primary']['count'] == 1
+
+
+def test_unload_drops_every_tier():
+    residency, _ = _residency()
+    residency.load_primary()
+    residency.demote()
+
+    residency.unload()
+
+    assert residency.active_model is None
+    assert residency.primary_model is None
+    assert residency.fallback_model is None
+    assert residency.active_device is None
+
+
+def test_transition_history_is_bounded():
+    residency, _ = _residency(history_size=4)
+    residency.load_primary()
+    for _ in range(10):
+        residency.demote()
+        residency.promote()
+
+    assert len(residency.transitions) == 4
+    assert residency.timings()['promote']['count'] == 10
+
+
+@pytest.mark.usefixtures("tiny_model")
+def test_real_model_handoff_between_cpu_compute_types():
+    from faster_whisper import WhisperModel
+
+    residency = ModelResidency(
+        lambda device, compute_type: WhisperModel("tiny", device=device, compute_type=compute_type),
+        primary=("cpu", "float32"),
+        fallback=("cpu", "int8")
+    )
+    primary = residency.load_primary()
+    residency.demote()
+    assert residency.promote() is primary
+    assert primary.model.model_is_loaded
+
+    timings = residency.timings()
+    assert timings['promote']['last_seconds'] < timings['load_primary']['last_seconds']
+    residency.unload()
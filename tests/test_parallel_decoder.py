@@ -0,0 +1,105 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.batch_runner import BatchRunner
+from src.parallel_decoder import ParallelDecoder, plan_pieces
+
+SAMPLE_RATE = 16000
+
+
+class FakeModel:
+    created = []
+
+    def __init__(self, model_size, compute_type, cpu_threads, num_workers):
+        self.cpu_threads = cpu_threads
+        self.thread = threading.current_thread().name
+        FakeModel.created.append(self)
+
+    def transcribe(self, audio, language=None, **options):
+        seconds = len(audio) / SAMPLE_RATE
+        segment = SimpleNamespace(start=0.0, end=seconds, text=f" {seconds:.0f}s ")
+        return iter([segment]), None
+
+
+def _clips_every_ten_seconds(audio):
+    total = len(audio) / SAMPLE_RATE
+    return [{'start': start + 1.0, 'end': min(start + 9.0, total)} for start in np.arange(0, total, 10.0)]
+
+
+def _decoder(**kwargs):
+    return ParallelDecoder(
+        "small",
+        model_factory=FakeModel,
+        clip_fn=_clips_every_ten_seconds,
+        executor_factory=ThreadPoolExecutor,
+        **kwargs
+    )
+
+
+def test_plan_pieces_cuts_in_the_middle_of_pauses():
+    clips = [{'start': 1.0, 'end': 9.0}, {'start': 11.0, 'end': 19.0}, {'start': 21.0, 'end': 29.0}]
+
+    assert plan_pieces(clips, 30.0, 15.0) == [(0.0, 20.0), (20.0, 30.0)]
+    assert plan_pieces(clips, 30.0, 5.0) == [(0.0, 10.0), (10.0, 20.0), (20.0, 30.0)]
+    assert plan_pieces([], 30.0, 5.0) == []
+
+
+def test_segments_are_reassembled_in_order_with_absolute_times():
+    decoder = _decoder(processes=3, piece_seconds=20)
+    audio = np.zeros(100 * SAMPLE_RATE, dtype=np.float32)
+
+    segments = decoder.transcribe_segments(audio)
+    decoder.shutdown()
+
+    assert [segment.start for segment in segments] == [0.0, 20.0, 40.0, 60.0, 80.0]
+    assert segments[-1].end == pytest.approx(100.0)
+    assert [segment.text for segment in segments] == ["20s"] * 5
+
+
+def test_piece_size_defaults_to_balance_processes():
+    decoder = _decoder(processes=2)
+    audio = np.zeros(600 * SAMPLE_RATE, dtype=np.float32)
+
+    assert len(decoder.plan(audio)) == 4
+
+
+def test_each_worker_gets_its_own_model_and_thread_share():
+    FakeModel.created = []
+    decoder = _decoder(processes=2, cpu_threads=3)
+    decoder.transcribe(np.zeros(200 * SAMPLE_RATE, dtype=np.float32))
+    decoder.shutdown()
+
+    assert 1 <= len(FakeModel.created) <= 2
+    assert len({model.thread for model in FakeModel.created}) == len(FakeModel.created)
+    assert all(model.cpu_threads == 3 for model in FakeModel.created)
+
+
+def test_silent_input_is_not_decoded():
+    decoder = ParallelDecoder(clip_fn=lambda audio: [], executor_factory=ThreadPoolExecutor, model_factory=FakeModel)
+
+    assert decoder.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32)) == ""
+    assert decoder.executor is None
+
+
+def test_batch_runner_hands_whole_files_to_the_decoder(tmp_path):
+    source = tmp_path / "talk.wav"
+    source.write_bytes(b"audio")
+    decoder = _decoder(processes=2, piece_seconds=20)
+
+    runner = BatchRunner(
+        decoder,
+        manifest_path=tmp_path / "manifest.json",
+        output_formats=['txt'],
+        chunked=False,
+        decode_fn=lambda path: np.zeros(300 * SAMPLE_RATE, dtype=np.float32),
+        executor_factory=ThreadPoolExecutor
+    )
+    summary = runner.run([str(source)])
+    decoder.shutdown()
+
+    assert summary['done'] == 1
+    assert (tmp_path / "talk.txt").read_text(encoding='utf-8').split() == ["20s"] * 15
@@ -0,0 +1,95 @@
+import os
+import time
+
+from src.persistent_cache import PersistentCache, file_fingerprint, make_cache_key
+
+
+def test_persistent_cache_put_and_get(tmp_path):
+    cache = PersistentCache(db_path=tmp_path / "cache.db")
+    cache.put("key", "transcription")
+    assert cache.get("key") == "transcription"
+    assert cache.get("missing") is None
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_persistent_cache_survives_reopen(tmp_path):
+    cache = PersistentCache(db_path=tmp_path / "cache.db")
+    cache.put("key", "transcription")
+    cache.close()
+
+    reopened = PersistentCache(db_path=tmp_path / "cache.db")
+    assert reopened.get("key") == "transcription"
+    reopened.close()
+
+
+def test_persistent_cache_expires_entries(tmp_path):
+    cache = PersistentCache(db_path=tmp_path / "cache.db", ttl_seconds=0.05)
+    cache.put("key", "transcription")
+    time.sleep(0.1)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_persistent_cache_evicts_least_recently_used(tmp_path):
+    cache = PersistentCache(db_path=tmp_path / "cache.db", max_bytes=25)
+    cache.put("a", "x" * 10)
+    time.sleep(0.01)
+    cache.put("b", "y" * 10)
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.put("c", "z" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 10
+    assert cache.get("c") == "z" * 10
+    assert cache.total_bytes() == 20
+    cache.close()
+
+
+def test_file_fingerprint_ignores_name_but_not_content(tmp_path):
+    original = tmp_path / "recording.mp3"
+    original.write_bytes(b"audio" * 1000)
+    renamed = tmp_path / "renamed.mp3"
+    renamed.write_bytes(b"audio" * 1000)
+
+    assert file_fingerprint(str(original)) == file_fingerprint(str(renamed))
+
+    original.write_bytes(b"audio" * 999 + b"edits")
+    assert file_fingerprint(str(original)) != file_fingerprint(str(renamed))
+
+
+def test_file_fingerprint_samples_large_files(tmp_path):
+    large = tmp_path / "large.wav"
+    large.write_bytes(bytes(4096))
+    first = file_fingerprint(str(large), sample_bytes=1024)
+
+    data = bytearray(4096)
+    data[2047] = 1
+    large.write_bytes(bytes(data))
+    assert file_fingerprint(str(large), sample_bytes=1024) != first
+
+
+def test_file_fingerprint_detects_edits_between_samples(tmp_path):
+    large = tmp_path / "large.wav"
+    large.write_bytes(bytes(8192))
+    os.utime(large, ns=(1_000_000_000, 1_000_000_000))
+    first = file_fingerprint(str(large), sample_bytes=1024)
+    assert file_fingerprint(str(large), sample_bytes=1024) == first
+
+    data = bytearray(8192)
+    data[1500] = 1
+    large.write_bytes(bytes(data))
+    os.utime(large, ns=(2_000_000_000, 2_000_000_000))
+    assert file_fingerprint(str(large), sample_bytes=1024) != first
+
+
+def test_make_cache_key_depends_on_decode_settings():
+    options = dict(beam_size=5, vad_filter=True)
+    key = make_cache_key("abc", "turbo", None, options)
+    assert key == make_cache_key("abc", "turbo", None, dict(options))
+    assert key != make_cache_key("abc", "tiny", None, options)
+    assert key != make_cache_key("abc", "turbo", "en", options)
+    assert key != make_cache_key("abc", "turbo", None, dict(beam_size=1, vad_filter=True))
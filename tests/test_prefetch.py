@@ -0,0 +1,63 @@
+import threading
+import time
+
+import pytest
+
+from src.prefetch import prefetch
+
+
+def _throttled(count, delay, produced=None, closed=None):
+    try:
+        for index in range(count):
+            time.sleep(delay)
+            if produced is not None:
+                produced.append(index)
+            yield index
+    finally:
+        if closed is not None:
+            closed.set()
+
+
+def test_items_arrive_in_order():
+    assert list(prefetch(_throttled(5, 0.0))) == [0, 1, 2, 3, 4]
+    assert list(prefetch([])) == []
+
+
+def test_producer_errors_are_raised_in_consumer():
+    def failing():
+        yield 1
+        raise RuntimeError("download failed")
+
+    chunks = prefetch(failing())
+    assert next(chunks) == 1
+    with pytest.raises(RuntimeError, match="download failed"):
+        next(chunks)
+
+
+def test_download_overlaps_consumer_work():
+    count, delay = 10, 0.05
+    start_time = time.perf_counter()
+    for _ in prefetch(_throttled(count, delay)):
+        time.sleep(delay)
+    elapsed = time.perf_counter() - start_time
+
+    assert elapsed < 1.5 * count * delay
+
+
+def test_producer_stays_within_the_queue_bound():
+    produced = []
+    chunks = prefetch(_throttled(100, 0.0, produced), max_items=3)
+    next(chunks)
+    time.sleep(0.2)
+
+    assert len(produced) <= 5
+    chunks.close()
+
+
+def test_closing_stops_and_closes_the_source():
+    closed = threading.Event()
+    chunks = prefetch(_throttled(100, 0.01, closed=closed), max_items=2)
+    next(chunks)
+    chunks.close()
+
+    assert closed.wait(1.0)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+from src.resampler import StreamingResampler, resample, resample_chunks
+
+
+@pytest.mark.parametrize("source_rate", [8000, 22050, 44100, 48000])
+def test_resample_matches_scipy_polyphase(source_rate):
+    audio = np.random.default_rng(0).standard_normal(source_rate // 2 + 7).astype(np.float32)
+    divisor = np.gcd(source_rate, 16000)
+    expected = resample_poly(audio.astype(np.float64), 16000 // divisor, source_rate // divisor)
+
+    result = resample(audio, source_rate, 16000, block_size=1000)
+
+    assert result.dtype == np.float32
+    assert len(result) == len(expected)
+    np.testing.assert_allclose(result, expected, atol=1e-4)
+
+
+def test_resample_same_rate_is_passthrough():
+    audio = np.arange(10, dtype=np.float32)
+    result = resample(audio, 16000, 16000)
+    np.testing.assert_array_equal(result, audio)
+
+
+def test_resampler_ratio_is_reduced():
+    resampler = StreamingResampler(48000, 16000)
+    assert resampler.up == 1
+    assert resampler.down == 3
+
+
+def test_resample_chunks_matches_whole_signal():
+    audio = np.random.default_rng(1).standard_normal(48000).astype(np.float32)
+    chunks = [audio[i:i + 1024] for i in range(0, len(audio), 1024)]
+
+    streamed = np.concatenate(list(resample_chunks(chunks, 48000, 16000)))
+
+    np.testing.assert_allclose(streamed, resample(audio, 48000, 16000), atol=1e-6)
+
+
+def test_streaming_resampler_keeps_bounded_history():
+    resampler = StreamingResampler(48000, 16000)
+    for _ in range(100):
+        resampler.process(np.zeros(4800, dtype=np.float32))
+    assert len(resampler.history) < 4800 + len(resampler.taps)
+
+
+def test_resample_preserves_low_frequency_tone():
+    t = np.arange(48000) / 48000
+    tone = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+
+    result = resample(tone, 48000, 16000)
+
+    expected = np.sin(2 * np.pi * 440 * np.arange(16000) / 16000)
+    np.testing.assert_allclose(result[100:-100], expected[100:-100], atol=1e-2)
@@ -0,0 +1,127 @@
+import threading
+
+import numpy as np
+import pytest
+
+from src.speculative_decoder import SpeculativeDecoder
+
+
+class FakeTranscriber:
+    def __init__(self, text, wait_for=None, error=None):
+        self.text = text
+        self.wait_for = wait_for
+        self.error = error
+
+    def transcribe(self, audio_data, language=None):
+        if self.wait_for is not None:
+            self.wait_for.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.text
+
+
+class Clipboard:
+    def __init__(self):
+        self.history = []
+        self.pasted = False
+
+    def publish(self, text):
+        self.history.append(text)
+
+    def can_replace(self, draft_text):
+        return not self.pasted and self.history[-1] == draft_text
+
+
+def _audio():
+    return np.zeros(16000, dtype=np.float32)
+
+
+def _run(draft, main, clipboard, on_draft=None):
+    def publish(text):
+        clipboard.publish(text)
+        if on_draft is not None and len(clipboard.history) == 1:
+            on_draft()
+
+    return SpeculativeDecoder(draft, main, publish, clipboard.can_replace).transcribe(_audio())
+
+
+def test_draft_is_published_first_then_replaced():
+    main_may_finish = threading.Event()
+    clipboard = Clipboard()
+
+    result = _run(
+        FakeTranscriber("draft text"),
+        FakeTranscriber("final text", wait_for=main_may_finish),
+        clipboard,
+        on_draft=main_may_finish.set
+    )
+
+    assert clipboard.history == ["draft text", "final text"]
+    assert result.replaced is True
+    assert result.final_text == "final text"
+    assert result.first_text_seconds <= result.final_text_seconds
+
+
+def test_draft_is_kept_after_user_pasted():
+    main_may_finish = threading.Event()
+    clipboard = Clipboard()
+
+    def paste():
+        clipboard.pasted = True
+        main_may_finish.set()
+
+    result = _run(
+        FakeTranscriber("draft text"),
+        FakeTranscriber("final text", wait_for=main_may_finish),
+        clipboard,
+        on_draft=paste
+    )
+
+    assert clipboard.history == ["draft text"]
+    assert result.replaced is False
+    assert result.final_text == "final text"
+
+
+def test_identical_final_text_is_not_republished():
+    main_may_finish = threading.Event()
+    clipboard = Clipboard()
+
+    result = _run(
+        FakeTranscriber("same"),
+        FakeTranscriber("same", wait_for=main_may_finish),
+        clipboard,
+        on_draft=main_may_finish.set
+    )
+
+    assert clipboard.history == ["same"]
+    assert result.replaced is False
+
+
+def test_main_model_result_is_used_when_draft_fails():
+    clipboard = Clipboard()
+
+    result = _run(FakeTranscriber("", error=RuntimeError("no draft")), FakeTranscriber("final text"), clipboard)
+
+    assert clipboard.history == ["final text"]
+    assert result.draft_text == ""
+    assert result.first_text_seconds is not None
+
+
+def test_draft_survives_main_model_failure():
+    main_may_finish = threading.Event()
+    clipboard = Clipboard()
+
+    result = _run(
+        FakeTranscriber("draft text"),
+        FakeTranscriber("", wait_for=main_may_finish, error=RuntimeError("out of memory")),
+        clipboard,
+        on_draft=main_may_finish.set
+    )
+
+    assert clipboard.history == ["draft text"]
+    assert result.final_text == "draft text"
+
+
+def test_main_model_failure_without_draft_raises():
+    with pytest.raises(RuntimeError):
+        _run(FakeTranscriber(""), FakeTranscriber("", error=RuntimeError("out of memory")), Clipboard())
@@ -0,0 +1,118 @@
+import numpy as np
+
+from src.streaming_transcriber import StreamingTranscriber
+from src.transcriber import TranscriptSegment
+
+
+class FakeTranscriber:
+    def __init__(self, segment_seconds: float = 1.0, sample_rate: int = 16000):
+        self.segment_seconds = segment_seconds
+        self.sample_rate = sample_rate
+        self.decoded_lengths = []
+
+    def transcribe_segments(self, audio_data, language=None):
+        self.decoded_lengths.append(len(audio_data))
+        duration = len(audio_data) / self.sample_rate
+        segments = []
+        start = 0.0
+        while start + self.segment_seconds <= duration:
+            segments.append(TranscriptSegment(start, start + self.segment_seconds, f"w{len(self.decoded_lengths)}"))
+            start += self.segment_seconds
+        return segments
+
+
+def _chunk(seconds: float, sample_rate: int = 16000) -> bytes:
+    return np.zeros(int(seconds * sample_rate), dtype=np.int16).tobytes()
+
+
+def test_streaming_transcriber_initialization():
+    streaming = StreamingTranscriber(FakeTranscriber(), source_sample_rate=16000)
+    assert streaming.pending_samples == 0
+    assert streaming.committed_text == []
+    assert streaming.decode_thread is None
+
+
+def test_feed_accumulates_pending_samples():
+    streaming = StreamingTranscriber(FakeTranscriber(), source_sample_rate=16000)
+    streaming.feed(_chunk(0.5))
+    streaming.feed(_chunk(0.25))
+    assert streaming.pending_samples == 12000
+
+
+def test_decode_window_commits_only_stable_segments():
+    fake = FakeTranscriber()
+    streaming = StreamingTranscriber(fake, source_sample_rate=16000, commit_margin_seconds=1.5)
+    streaming.feed(_chunk(5.0))
+
+    streaming._decode_window(streaming._snapshot_pending())
+
+    assert len(streaming.committed_text) == 3
+    assert streaming.pending_samples == 2 * 16000
+
+
+def test_finish_decodes_only_unconfirmed_tail():
+    fake = FakeTranscriber()
+    streaming = StreamingTranscriber(fake, source_sample_rate=16000, commit_margin_seconds=1.5)
+    streaming.feed(_chunk(10.0))
+    streaming._decode_window(streaming._snapshot_pending())
+
+    text = streaming.finish()
+
+    assert fake.decoded_lengths == [10 * 16000, 2 * 16000]
+    assert text == " ".join(["w1"] * 8 + ["w2"] * 2)
+    assert streaming.pending_samples == 0
+
+
+def test_long_window_without_speech_is_dropped():
+    fake = FakeTranscriber(segment_seconds=100.0)
+    streaming = StreamingTranscriber(fake, source_sample_rate=16000, max_window_seconds=5.0)
+    streaming.feed(_chunk(6.0))
+
+    streaming._decode_window(streaming._snapshot_pending())
+
+    assert streaming.committed_text == []
+    assert streaming.pending_samples == int(1.5 * 16000)
+
+
+def test_resamples_to_target_rate():
+    fake = FakeTranscriber()
+    streaming = StreamingTranscriber(fake, source_sample_rate=48000)
+    streaming.feed(_chunk(3.0, sample_rate=48000))
+
+    streaming.finish()
+
+    assert fake.decoded_lengths == [3 * 16000]
+
+
+def test_start_and_cancel_background_decoder():
+    streaming = StreamingTranscriber(FakeTranscriber(), source_sample_rate=16000, step_seconds=0.01)
+    streaming.start()
+    assert streaming.decode_thread is not None
+    streaming.feed(_chunk(1.0))
+    streaming.cancel()
+    assert streaming.decode_thread is None
+    assert streaming.pending_samples == 0
+    assert streaming.committed_text == []
+
+
+class SingleSegmentTranscriber:
+    def __init__(self, sample_rate: int = 16000):
+        self.sample_rate = sample_rate
+        self.decoded_lengths = []
+
+    def transcribe_segments(self, audio_data, language=None):
+        self.decoded_lengths.append(len(audio_data))
+        return [TranscriptSegment(0.0, len(audio_data) / self.sample_rate, f"s{len(self.decoded_lengths)}")]
+
+
+def test_single_segment_window_is_committed_at_limit():
+    fake = SingleSegmentTranscriber()
+    streaming = StreamingTranscriber(fake, source_sample_rate=16000, max_window_seconds=5.0)
+
+    for _ in range(5):
+        streaming.feed(_chunk(3.0))
+        streaming._decode_window(streaming._snapshot_pending())
+
+    assert max(fake.decoded_lengths) < 2 * 5 * 16000
+    assert streaming.pending_samples < 5 * 16000
+    assert streaming.committed_text == ["s2", "s4"]
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 
@@ -199,6 +202,23 @@ def test_transcriber_shutdown_waits_for_preload():
     assert transcriber.model is None
 
 
+def test_transcriber_import_defers_faster_whisper():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, src.transcriber; print('faster_whisper' in sys.modules)"],
+        capture_output=True, text=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.usefixtures("tiny_model")
+def test_transcriber_warm_up_loads_model():
+    transcriber = Transcriber(model_size="tiny", device="cpu", compute_type="int8", keep_model_loaded=True)
+    elapsed = transcriber.warm_up(seconds=0.5)
+    assert elapsed > 0
+    assert transcriber.model is not None
+    transcriber.shutdown()
+
+
 @pytest.mark.skipif(True, reason="Requires actual audio data and model")
 def test_transcribe():
     transcriber = Transcriber(model_size="tiny", device="cpu", compute_type="int8")
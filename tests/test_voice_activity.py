@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from src.voice_activity import EnergyVAD
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds, amplitude=0.3):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * 32767 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+
+
+def _silence(seconds, noise=0.001):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * noise * 32767).astype(np.int16)
+
+
+def _feed(vad, audio, block=1024):
+    kept = [vad.process(audio[start:start + block]) for start in range(0, len(audio), block)]
+    kept.append(vad.flush())
+    return np.concatenate(kept)
+
+
+def test_silence_is_dropped():
+    vad = EnergyVAD(SAMPLE_RATE)
+    kept = _feed(vad, _silence(5))
+
+    assert len(kept) == 0
+    assert vad.kept_ratio == 0.0
+    assert vad.raw_samples == 5 * SAMPLE_RATE
+
+
+def test_long_pause_is_trimmed_with_pre_and_post_roll():
+    vad = EnergyVAD(SAMPLE_RATE, pre_roll_ms=300, post_roll_ms=600)
+    audio = np.concatenate([_silence(2), _tone(1), _silence(10), _tone(1), _silence(2)])
+
+    kept = _feed(vad, audio)
+
+    expected_seconds = 2 * (1 + 0.3 + 0.6)
+    assert len(kept) / SAMPLE_RATE == pytest.approx(expected_seconds, abs=0.1)
+    assert vad.kept_ratio == pytest.approx(len(kept) / len(audio))
+    assert vad.kept_ratio < 0.3
+
+
+def test_pre_roll_keeps_audio_before_speech_onset():
+    vad = EnergyVAD(SAMPLE_RATE, pre_roll_ms=300, post_roll_ms=0)
+    onset = _silence(1, noise=0.004)
+    kept = _feed(vad, np.concatenate([onset, _tone(0.5)]))
+
+    assert len(kept) == pytest.approx(int(0.8 * SAMPLE_RATE), abs=vad.frame_samples)
+    assert np.abs(kept[:vad.frame_samples]).max() < 0.02 * 32767
+
+
+def test_continuous_speech_is_kept_whole():
+    vad = EnergyVAD(SAMPLE_RATE)
+    speech = _tone(3)
+
+    kept = _feed(vad, speech, block=777)
+
+    np.testing.assert_array_equal(kept, speech)
+    assert vad.kept_ratio == pytest.approx(1.0)
+
+
+def test_noise_floor_adapts_to_steady_background():
+    vad = EnergyVAD(SAMPLE_RATE, min_threshold=0.005)
+    kept = _feed(vad, np.concatenate([_silence(3, noise=0.004), _tone(1), _silence(3, noise=0.004)]))
+
+    assert len(kept) / SAMPLE_RATE < 2.5
+    assert vad.threshold >= 0.005
+
+
+def test_gate_closes_when_background_starts_above_min_threshold():
+    vad = EnergyVAD(SAMPLE_RATE, min_threshold=0.01)
+    _feed(vad, _silence(6, noise=0.03))
+    assert vad.threshold > 0.03
+
+    kept = _feed(vad, np.concatenate([_silence(3, noise=0.03), _tone(1), _silence(3, noise=0.03)]))
+
+    assert 1.0 <= len(kept) / SAMPLE_RATE < 2.5
+
+
+def test_float_input_is_supported():
+    vad = EnergyVAD(SAMPLE_RATE)
+    audio = np.concatenate([_silence(2), _tone(1)]).astype(np.float32) / 32768.0
+
+    kept = _feed(vad, audio)
+
+    assert kept.dtype == np.float32
+    assert 1.0 <= len(kept) / SAMPLE_RATE < 1.5
+
+
+def test_reset_clears_statistics():
+    vad = EnergyVAD(SAMPLE_RATE)
+    _feed(vad, _tone(1))
+    vad.reset()
+
+    assert vad.raw_samples == 0
+    assert vad.kept_samples == 0
+    assert vad.kept_ratio == 0.0
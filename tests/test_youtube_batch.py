@@ -0,0 +1,189 @@
+import json
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.job_scheduler import JobCancelledError
+from src.transcriber import TranscriptSegment
+from src.youtube_batch import YouTubeBatchRunner, output_name
+from src.youtube_downloader import AudioStream, VideoEntry, YouTubeDownloader
+
+
+class FakeDownloader(YouTubeDownloader):
+    def __init__(self, failing=(), delay=0.0):
+        super().__init__()
+        self.failing = set(failing)
+        self.delay = delay
+        self.downloaded = []
+        self.discarded = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def stream_audio(self, url, chunk_seconds=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+            self.downloaded.append(url)
+        video_id = self.extract_video_id(url)
+        if video_id in self.failing:
+            return None
+        return AudioStream(f"Video {video_id}", 2.0, iter([np.full(16000, 0.1, dtype=np.float32)] * 2))
+
+    def discard(self, stream):
+        self.discarded.append(stream.title)
+
+
+class FakeTranscriber:
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe_segments(self, audio_data, language=None):
+        self.calls += 1
+        return [TranscriptSegment(0.0, len(audio_data) / 16000, f"text {self.calls}")]
+
+
+def _urls(*video_ids):
+    return [f"https://youtu.be/{video_id}" for video_id in video_ids]
+
+
+def test_outputs_and_manifest_are_written_per_video(tmp_path):
+    downloader = FakeDownloader()
+    runner = YouTubeBatchRunner(downloader, FakeTranscriber(), tmp_path / "out", output_formats=['txt', 'json'])
+
+    summary = runner.run(_urls("aaaaaaaaaaa", "bbbbbbbbbbb") + ["https://www.youtube.com/watch?v=aaaaaaaaaaa"])
+
+    assert summary == {'done': 2, 'cached': 0, 'skipped': 0, 'failed': 0}
+    assert len(downloader.downloaded) == 2
+    assert (tmp_path / "out" / "Video aaaaaaaaaaa [aaaaaaaaaaa].txt").read_text(encoding='utf-8') == "text 1\n"
+    data = json.loads((tmp_path / "out" / "Video bbbbbbbbbbb [bbbbbbbbbbb].json").read_text(encoding='utf-8'))
+    assert data['source'] == "bbbbbbbbbbb"
+    manifest = json.loads((tmp_path / "out" / "manifest.json").read_text(encoding='utf-8'))
+    assert manifest['files']['youtube:aaaaaaaaaaa']['status'] == 'done'
+
+
+def test_rerun_skips_finished_videos_and_retries_failed_ones(tmp_path):
+    runner = YouTubeBatchRunner(FakeDownloader(failing={"bbbbbbbbbbb"}), FakeTranscriber(), tmp_path, output_formats=['txt'])
+    assert runner.run(_urls("aaaaaaaaaaa", "bbbbbbbbbbb"))['failed'] == 1
+
+    downloader = FakeDownloader()
+    runner = YouTubeBatchRunner(downloader, FakeTranscriber(), tmp_path, output_formats=['txt'])
+    summary = runner.run(_urls("aaaaaaaaaaa", "bbbbbbbbbbb"))
+
+    assert summary == {'done': 1, 'cached': 0, 'skipped': 1, 'failed': 0}
+    assert downloader.downloaded == [YouTubeDownloader.watch_url("bbbbbbbbbbb")]
+
+
+def test_cached_videos_are_not_downloaded(tmp_path):
+    cache = {"youtube:aaaaaaaaaaa": "cached text"}
+    downloader = FakeDownloader()
+    runner = YouTubeBatchRunner(
+        downloader,
+        FakeTranscriber(),
+        tmp_path,
+        output_formats=['txt'],
+        cache_lookup=cache.get,
+        cache_store=cache.__setitem__
+    )
+
+    summary = runner.run(["https://www.youtube.com/watch?v=aaaaaaaaaaa"] + _urls("bbbbbbbbbbb"))
+
+    assert summary['cached'] == 1 and summary['done'] == 1
+    assert downloader.downloaded == [YouTubeDownloader.watch_url("bbbbbbbbbbb")]
+    assert (tmp_path / "aaaaaaaaaaa.txt").read_text(encoding='utf-8') == "cached text\n"
+    assert cache["youtube:bbbbbbbbbbb"] == "text 1"
+
+
+def test_cached_segments_keep_subtitle_timing(tmp_path):
+    cache, segment_cache = {}, {}
+    runner = YouTubeBatchRunner(
+        FakeDownloader(),
+        FakeTranscriber(),
+        tmp_path / "first",
+        output_formats=['srt'],
+        cache_lookup=cache.get,
+        cache_store=cache.__setitem__,
+        cache_store_segments=segment_cache.__setitem__
+    )
+    runner.run(_urls("aaaaaaaaaaa"))
+    fresh = (tmp_path / "first" / "Video aaaaaaaaaaa [aaaaaaaaaaa].srt").read_text(encoding='utf-8')
+    assert list(cache) == ["youtube:aaaaaaaaaaa"]
+    assert list(segment_cache) == ["youtube:aaaaaaaaaaa:segments"]
+
+    downloader = FakeDownloader()
+    cached_runner = YouTubeBatchRunner(
+        downloader,
+        FakeTranscriber(),
+        tmp_path / "second",
+        output_formats=['srt'],
+        cache_lookup=cache.get,
+        cache_lookup_segments=segment_cache.get
+    )
+    summary = cached_runner.run(_urls("aaaaaaaaaaa"))
+
+    assert summary['cached'] == 1
+    assert downloader.downloaded == []
+    assert (tmp_path / "second" / "aaaaaaaaaaa.srt").read_text(encoding='utf-8') == fresh
+
+
+def test_text_only_cache_entry_is_not_used_for_subtitles(tmp_path):
+    cache = {"youtube:aaaaaaaaaaa": "cached text"}
+    runner = YouTubeBatchRunner(
+        FakeDownloader(),
+        FakeTranscriber(),
+        tmp_path,
+        output_formats=['srt'],
+        cache_lookup=cache.get,
+        cache_lookup_segments=cache.get
+    )
+
+    summary = runner.run(_urls("aaaaaaaaaaa"))
+
+    assert summary['cached'] == 0 and summary['done'] == 1
+
+
+def test_cancellation_prints_partial_summary(tmp_path, capsys):
+    class CancellingTranscriber(FakeTranscriber):
+        def transcribe_segments(self, audio_data, language=None):
+            if self.calls:
+                raise JobCancelledError("cancelled")
+            return super().transcribe_segments(audio_data, language=language)
+
+    downloader = FakeDownloader()
+    runner = YouTubeBatchRunner(downloader, CancellingTranscriber(), tmp_path, output_formats=['txt'])
+
+    with pytest.raises(JobCancelledError):
+        runner.run(_urls("aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"))
+
+    assert "YouTube batch cancelled: 1 done" in capsys.readouterr().out
+    assert sorted(downloader.discarded) == ["Video aaaaaaaaaaa", "Video bbbbbbbbbbb", "Video ccccccccccc"]
+
+
+def test_download_concurrency_is_bounded(tmp_path):
+    downloader = FakeDownloader(delay=0.05)
+    results = []
+    runner = YouTubeBatchRunner(
+        downloader,
+        FakeTranscriber(),
+        tmp_path,
+        output_formats=['txt'],
+        download_workers=2,
+        on_result=lambda entry, text: results.append(entry.video_id)
+    )
+
+    video_ids = [f"video{index:06d}" for index in range(6)]
+    assert runner.run(_urls(*video_ids))['done'] == 6
+
+    assert downloader.max_active == 2
+    assert results == video_ids
+
+
+def test_output_name_strips_unsafe_characters():
+    entry = VideoEntry("aaaaaaaaaaa", "https://youtu.be/aaaaaaaaaaa")
+    assert output_name(entry, 'Part 1/2: "Intro"?') == "Part 1 2 Intro [aaaaaaaaaaa]"
+    assert output_name(entry, None) == "aaaaaaaaaaa"
@@ -1,10 +1,21 @@
+import io
+import shutil
+import subprocess
+import time
+import numpy as np
 import pytest
+from src.ffmpeg_decoder import FFmpegDecoder
+from src.job_workspace import WorkspaceManager
+from src.metadata_cache import VideoMetadata, VideoMetadataCache
+from src.prefetch import prefetch
 from src.youtube_downloader import YouTubeDownloader
 
+requires_ffmpeg = pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="Requires FFmpeg")
+
 
 def test_youtube_downloader_initialization():
     downloader = YouTubeDownloader()
-    assert downloader.temp_dir is not None
+    assert downloader.workspaces.root is not None
 
 
 def test_is_youtube_url_valid():
@@ -50,3 +61,266 @@ def test_download_audio():
     assert len(audio_data) > 0
     assert isinstance(title, str)
     downloader.cleanup()
+
+
+class FakeYoutubeDL:
+    def __init__(self, info, options):
+        self.info = info
+        self.options = options
+        self.processed = []
+        self.extracted = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def extract_info(self, url, download=True, process=True):
+        assert download is False
+        self.extracted.append((url, process))
+        return dict(self.info)
+
+    def prepare_filename(self, info):
+        return self.options['outtmpl'] % {'ext': info['ext']}
+
+    def process_info(self, info):
+        self.processed.append(info)
+        shutil.copy(info['source'], self.prepare_filename(info))
+
+    def urlopen(self, url):
+        time.sleep(self.info.get('fragment_delay', 0))
+        self.info['fetched'].append(url)
+        return io.BytesIO(self.info['fragment_data'][url])
+
+
+def _make_downloader(tmp_path, info):
+    created = []
+
+    def factory(options):
+        created.append(FakeYoutubeDL(info, options))
+        return created[-1]
+
+    downloader = YouTubeDownloader(ydl_factory=factory, workspaces=WorkspaceManager(tmp_path / "jobs"))
+    return downloader, created
+
+
+def _make_media(tmp_path, name, extra_args=(), seconds=2):
+    source = tmp_path / name
+    subprocess.run([
+        'ffmpeg', '-loglevel', 'error', '-f', 'lavfi', '-i', f'sine=frequency=440:duration={seconds}',
+        '-ar', '48000', '-ac', '2', *extra_args, '-y', str(source)
+    ], check=True)
+    return source
+
+
+def test_audio_only_format_is_requested(tmp_path):
+    downloader, created = _make_downloader(tmp_path, {'title': "Clip"})
+    downloader.download_audio("https://youtu.be/dQw4w9WgXcQ")
+
+    assert created[0].options['format'] == YouTubeDownloader.AUDIO_FORMAT
+    assert 'postprocessors' not in created[0].options
+
+
+def test_stream_options_pass_headers_for_http_urls():
+    info = {'url': "https://example.com/audio", 'http_headers': {'User-Agent': "test"}}
+    options = YouTubeDownloader._input_options(info)
+    assert options[-2:] == ['-headers', "User-Agent: test\r\n"]
+    assert YouTubeDownloader._input_options({'url': "/tmp/audio.webm"}) == []
+
+
+@requires_ffmpeg
+def test_stream_is_decoded_in_memory_to_16k_mono(tmp_path):
+    source = _make_media(tmp_path, "stream.mp4", ['-c:a', 'aac'])
+    info = {'title': "Clip", 'url': str(source), 'duration': 2.0, 'format_id': '140', 'acodec': 'mp4a.40.2', 'ext': 'm4a'}
+    downloader, created = _make_downloader(tmp_path, info)
+
+    audio_data, title = downloader.download_audio("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+    assert title == "Clip"
+    assert audio_data.dtype == np.float32
+    assert audio_data.ndim == 1
+    assert abs(len(audio_data) - 32000) < 1600
+    assert created[0].processed == []
+    assert not (tmp_path / "jobs").exists()
+
+
+@requires_ffmpeg
+def test_fragmented_stream_is_downloaded_then_decoded(tmp_path):
+    source = _make_media(tmp_path, "stream.webm", ['-c:a', 'libopus'])
+    info = {'title': "Clip", 'url': "https://example.com/manifest.mpd", 'protocol': 'http_dash_segments', 'ext': 'webm', 'source': str(source)}
+    downloader, created = _make_downloader(tmp_path, info)
+
+    audio_data, _ = downloader.download_audio("https://youtu.be/dQw4w9WgXcQ")
+
+    assert len(created[1].processed) == 1
+    assert created[1].options['outtmpl'].startswith(str(tmp_path / "jobs" / "youtube-"))
+    assert abs(len(audio_data) - 32000) < 1600
+    assert list((tmp_path / "jobs").iterdir()) == []
+
+
+def _fragmented_info(source, count, delay=0.0):
+    data = source.read_bytes()
+    size = -(-len(data) // count)
+    paths = [f"sq/{index}" for index in range(count)]
+    return {
+        'title': "Clip",
+        'url': "https://example.com/manifest.mpd",
+        'protocol': 'http_dash_segments',
+        'ext': 'webm',
+        'fragment_base_url': "https://example.com/base/",
+        'fragments': [{'path': path} for path in paths],
+        'fragment_data': {
+            f"https://example.com/base/{path}": data[index * size:(index + 1) * size] for index, path in enumerate(paths)
+        },
+        'fragment_delay': delay,
+        'fetched': []
+    }
+
+
+@requires_ffmpeg
+def test_dash_fragments_are_piped_into_ffmpeg(tmp_path):
+    source = _make_media(tmp_path, "stream.webm", ['-c:a', 'libopus'])
+    info = _fragmented_info(source, 5)
+    downloader, created = _make_downloader(tmp_path, info)
+
+    audio_data, _ = downloader.download_audio("https://youtu.be/dQw4w9WgXcQ")
+
+    assert abs(len(audio_data) - 32000) < 1600
+    assert len(info['fetched']) == 5
+    assert all(not ydl.processed for ydl in created)
+    assert not (tmp_path / "jobs").exists()
+
+
+@requires_ffmpeg
+def test_dash_stream_decodes_while_fragments_download(tmp_path):
+    source = _make_media(tmp_path, "stream.webm", ['-c:a', 'libopus'], seconds=30)
+    info = _fragmented_info(source, 30, delay=0.03)
+    downloader, _ = _make_downloader(tmp_path, info)
+
+    stream = downloader.stream_audio("https://youtu.be/dQw4w9WgXcQ", chunk_seconds=0.5)
+    first = next(stream.chunks)
+    fetched_at_first_chunk = len(info['fetched'])
+    remaining = sum(len(chunk) for chunk in stream.chunks)
+
+    assert fetched_at_first_chunk < 30
+    assert abs(len(first) + remaining - 30 * 16000) < 1600
+
+
+def test_fragment_urls_need_every_fragment_location():
+    assert YouTubeDownloader._fragment_urls({'fragments': [{'url': "https://a/1"}, {'path': "2"}]}) == []
+    info = {'fragment_base_url': "https://a/base/", 'fragments': [{'path': "1"}, {'url': "https://b/2"}]}
+    assert YouTubeDownloader._fragment_urls(info) == ["https://a/base/1", "https://b/2"]
+
+
+class ThrottledDecoder(FFmpegDecoder):
+    def __init__(self, delay):
+        super().__init__(sample_rate=16000)
+        self.delay = delay
+        self.sources = []
+
+    def iter_chunks(self, source, chunk_seconds=None, input_options=None, feed=None):
+        self.sources.append(source)
+        for chunk in super().iter_chunks(source, chunk_seconds, input_options, feed):
+            time.sleep(self.delay)
+            yield chunk
+
+
+@requires_ffmpeg
+def test_stream_chunks_are_transcribed_while_downloading(tmp_path):
+    source = _make_media(tmp_path, "stream.mp4", ['-c:a', 'aac'])
+    info = {'title': "Clip", 'url': str(source), 'duration': 2.0}
+    downloader, _ = _make_downloader(tmp_path, info)
+    downloader.decoder = ThrottledDecoder(delay=0.05)
+
+    stream = downloader.stream_audio("https://youtu.be/dQw4w9WgXcQ", chunk_seconds=0.2)
+    assert (stream.title, stream.duration) == ("Clip", 2.0)
+    assert downloader.decoder.sources == []
+
+    start_time = time.perf_counter()
+    chunks = []
+    for chunk in prefetch(stream.chunks):
+        time.sleep(0.05)
+        chunks.append(chunk)
+    elapsed = time.perf_counter() - start_time
+
+    assert abs(sum(len(chunk) for chunk in chunks) - 32000) < 1600
+    assert elapsed < 1.5 * len(chunks) * 0.05
+
+
+def test_extract_video_id_normalizes_url_forms():
+    urls = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?t=42",
+        "youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL1234567890",
+    ]
+    assert {YouTubeDownloader.extract_video_id(url) for url in urls} == {"dQw4w9WgXcQ"}
+    assert YouTubeDownloader.extract_video_id("https://www.youtube.com/watch?v=short") is None
+    assert YouTubeDownloader.extract_video_id("https://vimeo.com/123456") is None
+
+
+def test_playlist_urls_are_detected():
+    assert YouTubeDownloader.extract_playlist_id("https://www.youtube.com/playlist?list=PL1234567890") == "PL1234567890"
+    assert YouTubeDownloader.extract_playlist_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL1234567890") is None
+    assert YouTubeDownloader.extract_playlist_id("https://youtu.be/dQw4w9WgXcQ") is None
+
+
+def test_parse_url_list_skips_blank_lines_and_comments():
+    text = "# talks\nhttps://youtu.be/aaaaaaaaaaa\n\n  https://youtu.be/bbbbbbbbbbb https://youtu.be/ccccccccccc \n"
+    assert YouTubeDownloader.parse_url_list(text) == [
+        "https://youtu.be/aaaaaaaaaaa", "https://youtu.be/bbbbbbbbbbb", "https://youtu.be/ccccccccccc"
+    ]
+
+
+def test_list_videos_expands_playlists_and_deduplicates_by_id(tmp_path):
+    info = {'entries': [
+        {'id': "aaaaaaaaaaa", 'title': "First", 'duration': 60},
+        {'id': "bbbbbbbbbbb", 'title': "Second"},
+        None,
+    ]}
+    downloader, created = _make_downloader(tmp_path, info)
+
+    entries = downloader.list_videos([
+        "https://youtu.be/bbbbbbbbbbb",
+        "https://www.youtube.com/playlist?list=PL1234567890",
+        "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+        "not a url",
+    ])
+
+    assert [entry.video_id for entry in entries] == ["bbbbbbbbbbb", "aaaaaaaaaaa"]
+    assert entries[1].title == "First"
+    assert entries[1].url == "https://www.youtube.com/watch?v=aaaaaaaaaaa"
+    assert created[0].options['extract_flat'] == 'in_playlist'
+
+
+def test_canonical_url_drops_tracking_and_timestamps():
+    assert YouTubeDownloader.canonical_url("https://youtu.be/dQw4w9WgXcQ?si=abc&t=42") == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    assert YouTubeDownloader.canonical_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=1m&utm_source=x") == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    assert YouTubeDownloader.canonical_url("https://www.youtube.com/playlist?list=PL1234567890") is None
+
+
+def test_probe_reads_metadata_once_and_caches_it(tmp_path):
+    info = {'id': "dQw4w9WgXcQ", 'title': "Clip", 'duration': 212, 'live_status': 'not_live'}
+    downloader, created = _make_downloader(tmp_path, info)
+    downloader.metadata_cache = VideoMetadataCache(tmp_path / "metadata.db")
+
+    first = downloader.probe("https://youtu.be/dQw4w9WgXcQ?t=10")
+    second = downloader.probe("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+    assert first == second == VideoMetadata("dQw4w9WgXcQ", "Clip", 212, 'not_live')
+    assert len(created) == 1
+    assert created[0].extracted == [("https://www.youtube.com/watch?v=dQw4w9WgXcQ", False)]
+    assert 'format' not in created[0].options
+    downloader.metadata_cache.close()
+
+
+def test_probe_failure_returns_none(tmp_path):
+    def failing_factory(options):
+        raise RuntimeError("offline")
+
+    downloader = YouTubeDownloader(ydl_factory=failing_factory)
+    assert downloader.probe("https://youtu.be/dQw4w9WgXcQ") is None
+    assert downloader.probe("https://vimeo.com/123456") is None